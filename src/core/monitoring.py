@@ -6,7 +6,6 @@ capabilities for the Autonomous Cloud Cost Optimizer platform.
 """
 
 import asyncio
-import json
 import logging
 import time
 from datetime import datetime, timedelta
@@ -16,6 +15,7 @@ from enum import Enum
 import functools
 import traceback
 
+import orjson
 import structlog
 import sentry_sdk
 from sentry_sdk.integrations.fastapi import FastApiIntegration
@@ -28,6 +28,11 @@ import psutil
 from src.core.config import settings
 
 
+def orjson_dumps(obj: Any, **kwargs) -> str:
+    """Serialize structured log events with orjson."""
+    return orjson.dumps(obj, default=kwargs.get("default")).decode("utf-8")
+
+
 # Prometheus Metrics
 optimization_opportunities_total = Counter(
     'optimization_opportunities_total',
@@ -128,6 +133,15 @@ class LogLevel(Enum):
     CRITICAL = "critical"
 
 
+STDLIB_LOG_LEVELS = {
+    LogLevel.DEBUG: logging.DEBUG,
+    LogLevel.INFO: logging.INFO,
+    LogLevel.WARNING: logging.WARNING,
+    LogLevel.ERROR: logging.ERROR,
+    LogLevel.CRITICAL: logging.CRITICAL
+}
+
+
 class MetricType(Enum):
     """Types of metrics."""
     COUNTER = "counter"
@@ -212,7 +226,7 @@ class MonitoringService:
                 structlog.processors.StackInfoRenderer(),
                 structlog.processors.format_exc_info,
                 structlog.processors.UnicodeDecoder(),
-                structlog.processors.JSONRenderer()
+                structlog.processors.JSONRenderer(serializer=orjson_dumps)
             ],
             context_class=dict,
             logger_factory=structlog.stdlib.LoggerFactory(),
@@ -338,7 +352,7 @@ class MonitoringService:
             
             for metric_key, metric_data in cached_metrics.items():
                 try:
-                    metric_info = json.loads(metric_data)
+                    metric_info = orjson.loads(metric_data)
                     await self._record_metric(metric_info)
                 except Exception as e:
                     log_event("cached_metric_processing_failed", {
@@ -542,10 +556,17 @@ async def health_check() -> Dict[str, Any]:
         }
 
 
+def log_event_enabled(level: LogLevel = LogLevel.INFO) -> bool:
+    """Check whether log_event would emit an event at this level."""
+    logger = monitoring_service.logger
+    return logger is not None and logger.isEnabledFor(STDLIB_LOG_LEVELS[level])
+
+
 def log_event(event_type: str, data: Dict[str, Any] = None, level: LogLevel = LogLevel.INFO):
     """Log a structured event."""
     try:
-        if monitoring_service.logger:
+        # Skip building the event payload when the level is filtered out
+        if log_event_enabled(level):
             event_data = data or {}
             event_data.update({
                 "event_type": event_type,
@@ -553,16 +574,7 @@ def log_event(event_type: str, data: Dict[str, Any] = None, level: LogLevel = Lo
                 "level": level.value
             })
             
-            if level == LogLevel.DEBUG:
-                monitoring_service.logger.debug(event_type, **event_data)
-            elif level == LogLevel.INFO:
-                monitoring_service.logger.info(event_type, **event_data)
-            elif level == LogLevel.WARNING:
-                monitoring_service.logger.warning(event_type, **event_data)
-            elif level == LogLevel.ERROR:
-                monitoring_service.logger.error(event_type, **event_data)
-            elif level == LogLevel.CRITICAL:
-                monitoring_service.logger.critical(event_type, **event_data)
+            getattr(monitoring_service.logger, level.value)(event_type, **event_data)
         
         # Also send to Sentry for errors and critical events
         if level in [LogLevel.ERROR, LogLevel.CRITICAL] and settings.SENTRY_DSN:
@@ -611,7 +623,7 @@ def track_metric(name: str, value: Union[int, float], labels: Dict[str, str] = N
                 monitoring_service.redis_client.hset,
                 "cached_metrics",
                 metric_key,
-                json.dumps(metric_data)
+                orjson.dumps(metric_data)
             )
         
         log_event("metric_tracked", {
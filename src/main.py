@@ -25,7 +25,8 @@ from src.services.cost_optimizer import CostOptimizerService
 from src.services.notification import NotificationService
 from src.services.approval_workflow import ApprovalWorkflowService
 from src.tasks.optimization_tasks import start_optimization_scheduler
-from src.core.monitoring import setup_monitoring, health_check
+from src.core.monitoring import setup_monitoring, health_check, orjson_dumps
+
 
 # Configure structured logging
 structlog.configure(
@@ -38,7 +39,7 @@ structlog.configure(
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
+        structlog.processors.JSONRenderer(serializer=orjson_dumps)
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
@@ -99,6 +100,9 @@ async def lifespan(app: FastAPI):
             except asyncio.CancelledError:
                 pass
         
+        if approval_workflow_service:
+            await approval_workflow_service.close()
+        
         logger.info("Application shutdown completed")
 
 
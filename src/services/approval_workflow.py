@@ -8,21 +8,17 @@ Slack and Teams integration, approval tracking, and escalation policies.
 import asyncio
 import json
 import logging
+import os
+import tempfile
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from enum import Enum
 
 import aiohttp
 from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.signature import SignatureVerifier
-from slack_sdk.models.blocks import (
-    SectionBlock, DividerBlock, ActionsBlock, ButtonElement,
-    ContextBlock, HeaderBlock
-)
 from slack_sdk.models.attachments import Attachment
-from msgraph import GraphServiceClient
-from msgraph.generated.models.o_data_errors.o_data_error import ODataError
 
 from src.core.config import settings
 from src.core.database import get_db
@@ -30,6 +26,45 @@ from src.models.optimization import OptimizationOpportunity, ApprovalWorkflow
 from src.core.monitoring import track_metric, log_event
 
 
+# Pre-encoded Teams adaptive card for approval requests, posted to the approvals
+# channel as a Bot Framework proactive message.
+_TEAMS_APPROVAL_CARD_TEMPLATE = (
+    '{"type": "AdaptiveCard", "version": "1.3", "body": ['
+    '{"type": "TextBlock", "text": "💰 Cost Optimization Approval Request", "size": "Large", "weight": "Bolder"}, '
+    '{"type": "FactSet", "facts": ['
+    '{"title": "Service", "value": "%(title)s"}, '
+    '{"title": "Current Cost", "value": "$%(current_cost)s"}, '
+    '{"title": "Potential Savings", "value": "$%(potential_savings)s"}, '
+    '{"title": "Risk Level", "value": "%(risk_level)s"}, '
+    '{"title": "Expires", "value": "%(expires_at)s"}'
+    ']}, '
+    '{"type": "TextBlock", "text": "**Description:**\\n%(description)s", "wrap": true}'
+    '], "actions": ['
+    '{"type": "Action.Submit", "title": "✅ Approve", '
+    '"data": {"action": "approve", "request_id": "%(request_id)s"}, "style": "positive"}, '
+    '{"type": "Action.Submit", "title": "❌ Reject", '
+    '"data": {"action": "reject", "request_id": "%(request_id)s"}, "style": "destructive"}, '
+    '{"type": "Action.OpenUrl", "title": "📊 View Details", "url": "%(details_url)s"}'
+    ']}'
+).encode("utf-8")
+
+# New channel conversation carrying the card; the card is embedded as-is
+_TEAMS_CONVERSATION_TEMPLATE = (
+    b'{"isGroup": true, '
+    b'"channelData": {"tenant": {"id": "%(tenant_id)s"}, "channel": {"id": "%(channel_id)s"}}, '
+    b'"activity": {"type": "message", "attachments": [{'
+    b'"contentType": "application/vnd.microsoft.card.adaptive", "content": %(card)s}]}}'
+)
+
+BOT_FRAMEWORK_TOKEN_URL = "https://login.microsoftonline.com/{tenant_id}/oauth2/v2.0/token"
+BOT_FRAMEWORK_SCOPE = "https://api.botframework.com/.default"
+
+
+def _json_escape(value: Any) -> bytes:
+    """Encode a value as the inside of a JSON string literal."""
+    return json.dumps(str(value), ensure_ascii=False)[1:-1].encode("utf-8")
+
+
 class ApprovalStatus(Enum):
     """Approval workflow statuses."""
     PENDING = "pending"
@@ -82,10 +117,14 @@ class ApprovalWorkflowService:
     
     def __init__(self):
         self.slack_client = None
-        self.teams_client = None
+        self.teams_session = None
+        self.teams_token = None
+        self.teams_token_expires_at = None
         self.signature_verifier = None
         self.active_requests = {}
+        self.expiration_tasks = {}
         self.escalation_policies = {}
+        self.persist_lock = asyncio.Lock()
         
     async def initialize(self):
         """Initialize the approval workflow service."""
@@ -99,17 +138,25 @@ class ApprovalWorkflowService:
                 response = await self.slack_client.auth_test()
                 log_event("slack_connection_established", {"user": response["user"]})
             
-            # Initialize Teams client
+            # Initialize Teams client (Bot Framework REST calls, token fetched lazily)
             if settings.TEAMS_APP_ID and settings.TEAMS_APP_PASSWORD:
-                self.teams_client = GraphServiceClient(
-                    credentials=settings.TEAMS_APP_ID,
-                    scopes=['https://graph.microsoft.com/.default']
+                missing = [
+                    name for name in ("TEAMS_TENANT_ID", "TEAMS_CHANNEL_ID")
+                    if not getattr(settings, name)
+                ]
+                if missing:
+                    raise ValueError(f"Teams approvals require {', '.join(missing)} to be set")
+                self.teams_session = aiohttp.ClientSession(
+                    timeout=aiohttp.ClientTimeout(total=30)
                 )
                 log_event("teams_connection_established")
             
             # Load escalation policies
             await self._load_escalation_policies()
             
+            # Restore pending requests and their expiration timers from disk
+            await self._restore_active_requests()
+            
             log_event("approval_workflow_initialized", {"status": "success"})
             
         except Exception as e:
@@ -185,10 +232,11 @@ class ApprovalWorkflowService:
             self.active_requests[request_id] = approval_request
             
             # Schedule expiration check
-            asyncio.create_task(self._schedule_expiration_check(approval_request))
+            self._schedule_expiration(approval_request)
             
             # Save to database
             await self._save_approval_workflow(approval_request)
+            await self._persist_active_requests()
             
             log_event("approval_request_created", {
                 "request_id": request_id,
@@ -231,43 +279,61 @@ class ApprovalWorkflowService:
         try:
             # Create Slack blocks for rich formatting
             blocks = [
-                HeaderBlock(text=f"💰 Cost Optimization Approval Request"),
-                SectionBlock(
-                    text=f"*Service:* {request.title}\n"
-                         f"*Current Cost:* ${request.current_cost:,.2f}\n"
-                         f"*Potential Savings:* ${request.potential_savings:,.2f}\n"
-                         f"*Risk Level:* {request.risk_level.title()}\n"
-                         f"*Expires:* {request.expires_at.strftime('%Y-%m-%d %H:%M UTC')}"
-                ),
-                SectionBlock(text=f"*Description:*\n{request.description}"),
-                ActionsBlock(
-                    elements=[
-                        ButtonElement(
-                            text="✅ Approve",
-                            style="primary",
-                            action_id="approve_optimization",
-                            value=request.id
-                        ),
-                        ButtonElement(
-                            text="❌ Reject",
-                            style="danger",
-                            action_id="reject_optimization",
-                            value=request.id
-                        ),
-                        ButtonElement(
-                            text="📊 View Details",
-                            action_id="view_details",
-                            value=request.id,
-                            url=f"{settings.API_BASE_URL}/opportunities/{request.opportunity_id}"
-                        )
+                {
+                    "type": "header",
+                    "text": {"type": "plain_text", "text": "💰 Cost Optimization Approval Request"}
+                },
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": f"*Service:* {request.title}\n"
+                                f"*Current Cost:* ${request.current_cost:,.2f}\n"
+                                f"*Potential Savings:* ${request.potential_savings:,.2f}\n"
+                                f"*Risk Level:* {request.risk_level.title()}\n"
+                                f"*Expires:* {request.expires_at.strftime('%Y-%m-%d %H:%M UTC')}"
+                    }
+                },
+                {
+                    "type": "section",
+                    "text": {"type": "mrkdwn", "text": f"*Description:*\n{request.description}"}
+                },
+                {
+                    "type": "actions",
+                    "elements": [
+                        {
+                            "type": "button",
+                            "text": {"type": "plain_text", "text": "✅ Approve"},
+                            "style": "primary",
+                            "action_id": "approve_optimization",
+                            "value": request.id
+                        },
+                        {
+                            "type": "button",
+                            "text": {"type": "plain_text", "text": "❌ Reject"},
+                            "style": "danger",
+                            "action_id": "reject_optimization",
+                            "value": request.id
+                        },
+                        {
+                            "type": "button",
+                            "text": {"type": "plain_text", "text": "📊 View Details"},
+                            "action_id": "view_details",
+                            "value": request.id,
+                            "url": f"{settings.API_BASE_URL}/opportunities/{request.opportunity_id}"
+                        }
                     ]
-                ),
-                ContextBlock(
-                    elements=[
-                        f"Request ID: `{request.id}`",
-                        f"Approval expires in {self._get_time_until_expiry(request.expires_at)}"
+                },
+                {
+                    "type": "context",
+                    "elements": [
+                        {"type": "mrkdwn", "text": f"Request ID: `{request.id}`"},
+                        {
+                            "type": "mrkdwn",
+                            "text": f"Approval expires in {self._get_time_until_expiry(request.expires_at)}"
+                        }
                     ]
-                )
+                }
             ]
             
             # Send message
@@ -289,61 +355,40 @@ class ApprovalWorkflowService:
     async def _send_teams_approval(self, request: ApprovalRequest):
         """Send approval request via Microsoft Teams."""
         try:
-            # Create Teams adaptive card
-            adaptive_card = {
-                "type": "AdaptiveCard",
-                "version": "1.3",
-                "body": [
-                    {
-                        "type": "TextBlock",
-                        "text": "💰 Cost Optimization Approval Request",
-                        "size": "Large",
-                        "weight": "Bolder"
-                    },
-                    {
-                        "type": "FactSet",
-                        "facts": [
-                            {"title": "Service", "value": request.title},
-                            {"title": "Current Cost", "value": f"${request.current_cost:,.2f}"},
-                            {"title": "Potential Savings", "value": f"${request.potential_savings:,.2f}"},
-                            {"title": "Risk Level", "value": request.risk_level.title()},
-                            {"title": "Expires", "value": request.expires_at.strftime('%Y-%m-%d %H:%M UTC')}
-                        ]
-                    },
-                    {
-                        "type": "TextBlock",
-                        "text": f"**Description:**\n{request.description}",
-                        "wrap": True
-                    }
-                ],
-                "actions": [
-                    {
-                        "type": "Action.Submit",
-                        "title": "✅ Approve",
-                        "data": {
-                            "action": "approve",
-                            "request_id": request.id
-                        },
-                        "style": "positive"
-                    },
-                    {
-                        "type": "Action.Submit",
-                        "title": "❌ Reject",
-                        "data": {
-                            "action": "reject",
-                            "request_id": request.id
-                        },
-                        "style": "destructive"
-                    },
-                    {
-                        "type": "Action.OpenUrl",
-                        "title": "📊 View Details",
-                        "url": f"{settings.API_BASE_URL}/opportunities/{request.opportunity_id}"
-                    }
-                ]
+            if self.teams_session is None:
+                raise RuntimeError("Teams approvals are not configured (TEAMS_APP_ID/TEAMS_APP_PASSWORD)")
+            
+            # Render pre-encoded Teams adaptive card
+            card = _TEAMS_APPROVAL_CARD_TEMPLATE % {
+                b"title": _json_escape(request.title),
+                b"current_cost": f"{request.current_cost:,.2f}".encode(),
+                b"potential_savings": f"{request.potential_savings:,.2f}".encode(),
+                b"risk_level": _json_escape(request.risk_level.title()),
+                b"expires_at": request.expires_at.strftime('%Y-%m-%d %H:%M UTC').encode(),
+                b"description": _json_escape(request.description),
+                b"request_id": _json_escape(request.id),
+                b"details_url": _json_escape(f"{settings.API_BASE_URL}/opportunities/{request.opportunity_id}")
             }
+            payload = _TEAMS_CONVERSATION_TEMPLATE % {
+                b"tenant_id": _json_escape(settings.TEAMS_TENANT_ID),
+                b"channel_id": _json_escape(settings.TEAMS_CHANNEL_ID),
+                b"card": card
+            }
+            
+            # Start a conversation in the approvals channel as the bot; Graph does not
+            # allow application permissions to post channel messages
+            token = await self._get_teams_token()
+            url = f"{settings.TEAMS_SERVICE_URL.rstrip('/')}/v3/conversations"
+            async with self.teams_session.post(
+                url,
+                data=payload,
+                headers={
+                    "Authorization": f"Bearer {token}",
+                    "Content-Type": "application/json"
+                }
+            ) as response:
+                response.raise_for_status()
             
-            # Send message (simplified - in production, you'd use proper Teams API)
             log_event("teams_approval_sent", {
                 "request_id": request.id,
                 "approver_id": request.approver_id
@@ -358,6 +403,29 @@ class ApprovalWorkflowService:
             })
             raise
     
+    async def _get_teams_token(self) -> str:
+        """Get a Bot Framework access token, refreshing it when close to expiry."""
+        if self.teams_token and self.teams_token_expires_at > datetime.now():
+            return self.teams_token
+        
+        async with self.teams_session.post(
+            BOT_FRAMEWORK_TOKEN_URL.format(tenant_id=settings.TEAMS_TENANT_ID),
+            data={
+                "client_id": settings.TEAMS_APP_ID,
+                "client_secret": settings.TEAMS_APP_PASSWORD,
+                "scope": BOT_FRAMEWORK_SCOPE,
+                "grant_type": "client_credentials"
+            }
+        ) as response:
+            response.raise_for_status()
+            token_data = await response.json()
+        
+        self.teams_token = token_data["access_token"]
+        self.teams_token_expires_at = datetime.now() + timedelta(
+            seconds=int(token_data.get("expires_in", 3600)) - 60
+        )
+        return self.teams_token
+    
     async def _send_email_approval(self, request: ApprovalRequest):
         """Send approval request via email."""
         try:
@@ -396,6 +464,16 @@ class ApprovalWorkflowService:
             })
             raise
     
+    def _schedule_expiration(self, request: ApprovalRequest):
+        """Start (or restart) the expiration timer for an approval request."""
+        current_task = asyncio.current_task()
+        previous = self.expiration_tasks.get(request.id)
+        if previous and previous is not current_task:
+            previous.cancel()
+        self.expiration_tasks[request.id] = asyncio.create_task(
+            self._schedule_expiration_check(request)
+        )
+    
     async def _schedule_expiration_check(self, request: ApprovalRequest):
         """Schedule an expiration check for an approval request."""
         try:
@@ -403,10 +481,10 @@ class ApprovalWorkflowService:
             wait_time = (request.expires_at - datetime.now()).total_seconds()
             if wait_time > 0:
                 await asyncio.sleep(wait_time)
-                
-                # Check if request is still pending
-                if request.id in self.active_requests:
-                    await self._handle_expired_request(request)
+            
+            # Check if request is still pending
+            if request.id in self.active_requests:
+                await self._handle_expired_request(request)
                     
         except asyncio.CancelledError:
             pass
@@ -426,7 +504,10 @@ class ApprovalWorkflowService:
             if current_level < len(policy["levels"]):
                 await self._escalate_request(request, policy["levels"][current_level])
             else:
-                # Mark as expired
+                # Mark as expired; this runs inside the expiration task, so drop it without cancelling
+                self.active_requests.pop(request.id, None)
+                self.expiration_tasks.pop(request.id, None)
+                await self._persist_active_requests()
                 await self._process_approval_response(
                     request.id, 
                     ApprovalStatus.EXPIRED, 
@@ -460,7 +541,8 @@ class ApprovalWorkflowService:
                 await self._send_teams_approval(request)
             
             # Schedule new expiration check
-            asyncio.create_task(self._schedule_expiration_check(request))
+            self._schedule_expiration(request)
+            await self._persist_active_requests()
             
             log_event("request_escalated", {
                 "request_id": request.id,
@@ -509,6 +591,10 @@ class ApprovalWorkflowService:
             
             # Remove from active requests
             del self.active_requests[request_id]
+            task = self.expiration_tasks.pop(request_id, None)
+            if task:
+                task.cancel()
+            await self._persist_active_requests()
             
             log_event("approval_response_processed", {
                 "request_id": request_id,
@@ -569,6 +655,66 @@ class ApprovalWorkflowService:
         # Implementation would save to database
         pass
     
+    async def _persist_active_requests(self):
+        """Write pending approval requests and their expiration times to disk."""
+        try:
+            # Serialize writers and snapshot under the lock so the newest state always lands last
+            async with self.persist_lock:
+                state = [
+                    {
+                        **asdict(request),
+                        "workflow_type": request.workflow_type.value,
+                        "expires_at": request.expires_at.isoformat()
+                    }
+                    for request in self.active_requests.values()
+                ]
+                await asyncio.to_thread(self._write_state_file, json.dumps(state))
+        except Exception as e:
+            log_event("approval_state_persist_failed", {"error": str(e)})
+    
+    def _write_state_file(self, payload: str):
+        """Atomically replace the approval state file."""
+        path = settings.APPROVAL_STATE_PATH
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=directory, delete=False) as f:
+            f.write(payload)
+        try:
+            os.replace(f.name, path)
+        except OSError:
+            os.unlink(f.name)
+            raise
+    
+    def _read_state_file(self) -> Optional[List[Dict[str, Any]]]:
+        """Read the approval state file, if one has been written."""
+        path = settings.APPROVAL_STATE_PATH
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+    
+    async def _restore_active_requests(self):
+        """Rebuild pending requests and expiration timers after a restart."""
+        try:
+            state = await asyncio.to_thread(self._read_state_file)
+            if state is None:
+                return
+            
+            for item in state:
+                request = ApprovalRequest(**{
+                    **item,
+                    "workflow_type": WorkflowType(item["workflow_type"]),
+                    "expires_at": datetime.fromisoformat(item["expires_at"])
+                })
+                self.active_requests[request.id] = request
+                # Requests that expired while we were down fire immediately
+                self._schedule_expiration(request)
+            
+            log_event("approval_requests_restored", {"count": len(state)})
+            
+        except Exception as e:
+            log_event("approval_state_restore_failed", {"error": str(e)})
+    
     def _get_time_until_expiry(self, expires_at: datetime) -> str:
         """Get human-readable time until expiry."""
         delta = expires_at - datetime.now()
@@ -580,6 +726,12 @@ class ApprovalWorkflowService:
         else:
             return f"{minutes}m"
     
+    async def close(self):
+        """Release HTTP resources held by the service."""
+        if self.teams_session:
+            await self.teams_session.close()
+            self.teams_session = None
+    
     async def get_pending_approvals(self, approver_id: str) -> List[ApprovalRequest]:
         """Get all pending approvals for an approver."""
         pending = []
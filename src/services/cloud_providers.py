@@ -6,26 +6,106 @@ for cost optimization operations.
 """
 
 import asyncio
-import json
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+import time
+from functools import lru_cache
+from itertools import chain
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, field
 
-import boto3
-from botocore.exceptions import ClientError
-from azure.mgmt.compute import ComputeManagementClient
-from azure.mgmt.resource import ResourceManagementClient
-from azure.common.credentials import ServicePrincipalCredentials
-from google.cloud import compute_v1
-from google.cloud import storage as gcs
-from google.oauth2 import service_account
+import numpy as np
+import orjson
+import pandas as pd
+import requests
+import redis.asyncio as aioredis
 
 from src.core.config import settings
-from src.core.monitoring import log_event
+from src.core.monitoring import log_event, log_event_enabled
 
 
-@dataclass
+class _PricingDict(dict):
+    """Pricing table that falls back to the default cost for unknown sizes."""
+    __slots__ = ()
+    
+    def __missing__(self, key):
+        return DEFAULT_MONTHLY_COST
+
+
+DEFAULT_MONTHLY_COST = 50.0
+
+# Simplified monthly pricing tables - in production, use the providers' billing APIs
+AWS_PRICING = _PricingDict({
+    't3.micro': 8.5,
+    't3.small': 17.0,
+    't3.medium': 34.0,
+    't3.large': 68.0,
+    'm5.large': 85.0,
+    'm5.xlarge': 170.0,
+    'c5.large': 78.0,
+    'c5.xlarge': 156.0
+})
+
+AZURE_PRICING = _PricingDict({
+    'Standard_B1s': 12.0,
+    'Standard_B2s': 24.0,
+    'Standard_D2s_v3': 85.0,
+    'Standard_D4s_v3': 170.0,
+    'Standard_F2s_v2': 78.0,
+    'Standard_F4s_v2': 156.0
+})
+
+GCP_PRICING = _PricingDict({
+    'e2-micro': 8.5,
+    'e2-small': 17.0,
+    'e2-medium': 34.0,
+    'e2-standard-2': 68.0,
+    'n1-standard-1': 45.0,
+    'n1-standard-2': 90.0,
+    'c2-standard-4': 156.0
+})
+
+# Compact dtypes for tabular resource analytics: low-cardinality strings become
+# categories and utilization metrics are stored as float32.
+RESOURCE_FRAME_DTYPES = {
+    'service': 'category',
+    'provider': 'category',
+    'region': 'category',
+    'instance_type': 'category',
+    'environment': 'category',
+    'monthly_cost': 'float64',
+    'cpu_utilization': 'float32',
+    'memory_utilization': 'float32',
+    'network_io': 'float32',
+    'storage_usage': 'float32',
+    'uptime_percentage': 'float32'
+}
+
+# CloudWatch metrics used for EC2 utilization: (query id prefix, namespace, metric name, field)
+AWS_UTILIZATION_METRICS = (
+    ("c", "AWS/EC2", "CPUUtilization", "cpu_utilization"),
+    ("m", "CWAgent", "mem_used_percent", "memory_utilization")
+)
+
+# GetMetricData accepts at most 500 queries per request
+CLOUDWATCH_MAX_QUERIES = 500
+
+# Tag keys (lowercased) that carry a resource's environment
+_ENV_KEYS = frozenset(('environment', 'env'))
+
+# EC2 accepts at most 200 values per describe_instances filter
+EC2_FILTER_MAX_VALUES = 200
+
+# How long a successful provider connection check is trusted
+CONNECTION_VALIDATION_TTL_SECONDS = 300
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as a second-precision ISO 8601 string."""
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+
+@dataclass(slots=True)
 class CloudResource:
     """Represents a cloud resource."""
     id: str
@@ -37,11 +117,23 @@ class CloudResource:
     monthly_cost: float = 0.0
     cpu_utilization: float = 0.0
     memory_utilization: float = 0.0
-    network_io: float = 0.0
-    storage_usage: float = 0.0
+    network_io: Optional[float] = None  # None when the provider does not report it
+    storage_usage: Optional[float] = None
     uptime_percentage: float = 100.0
     environment: str = "production"
-    tags: Dict[str, str] = None
+    tags: Dict[str, str] = field(default_factory=dict)
+    storage_type: Optional[str] = None
+    access_frequency: float = 1.0
+
+
+def build_resource_frame(resources: List[CloudResource]) -> pd.DataFrame:
+    """Build a memory-compact DataFrame view of cloud resources."""
+    columns = ['id', 'name', *RESOURCE_FRAME_DTYPES]
+    frame = pd.DataFrame(
+        [[getattr(r, column) for column in columns] for r in resources],
+        columns=columns
+    )
+    return frame.astype(RESOURCE_FRAME_DTYPES)
 
 
 class CloudProviderService:
@@ -49,82 +141,213 @@ class CloudProviderService:
     
     def __init__(self):
         self.aws_client = None
+        self.cloudwatch_client = None
         self.azure_client = None
         self.gcp_client = None
+        self.cache_client = None
         self.credentials = {}
+        self.validated_connections = {}
+        self.initialized = False
+        self.initialize_lock = asyncio.Lock()
         
     async def initialize(self):
-        """Initialize cloud provider clients."""
+        """Initialize cloud provider clients; later calls reuse the clients already created."""
+        async with self.initialize_lock:
+            if not self.initialized:
+                await self._initialize_clients()
+                self.initialized = True
+    
+    async def _initialize_clients(self):
+        """Create the SDK clients for each configured provider."""
         try:
+            # Provider SDKs are imported only when that provider is configured,
+            # keeping unused SDKs out of process memory and startup time
+            
             # Initialize AWS
             if settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY:
+                import boto3
+                from botocore.config import Config as BotoConfig
+                
+                # Larger keep-alive pool so concurrent lookups reuse connections
+                aws_config = BotoConfig(
+                    max_pool_connections=settings.CLOUD_CLIENT_MAX_POOL_CONNECTIONS,
+                    retries={'mode': 'adaptive', 'max_attempts': 3}
+                )
                 self.aws_client = boto3.client(
                     'ec2',
                     aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
                     aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                    region_name=settings.AWS_DEFAULT_REGION
+                    region_name=settings.AWS_DEFAULT_REGION,
+                    config=aws_config
+                )
+                self.cloudwatch_client = boto3.client(
+                    'cloudwatch',
+                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                    region_name=settings.AWS_DEFAULT_REGION,
+                    config=aws_config
                 )
                 log_event("aws_client_initialized")
             
             # Initialize Azure
             if settings.AZURE_CLIENT_ID and settings.AZURE_CLIENT_SECRET:
+                from azure.common.credentials import ServicePrincipalCredentials
+                from azure.core.pipeline.transport import RequestsTransport
+                from azure.mgmt.compute import ComputeManagementClient
+                
                 credentials = ServicePrincipalCredentials(
                     client_id=settings.AZURE_CLIENT_ID,
                     secret=settings.AZURE_CLIENT_SECRET,
                     tenant=settings.AZURE_TENANT_ID
                 )
                 self.azure_client = ComputeManagementClient(
-                    credentials, settings.AZURE_SUBSCRIPTION_ID
+                    credentials, settings.AZURE_SUBSCRIPTION_ID,
+                    transport=RequestsTransport(session=self._create_pooled_session())
                 )
                 log_event("azure_client_initialized")
             
             # Initialize GCP
             if settings.GCP_PROJECT_ID and settings.GCP_SERVICE_ACCOUNT_KEY:
+                from google.cloud import compute_v1
+                from google.oauth2 import service_account
+                
                 credentials = service_account.Credentials.from_service_account_file(
                     settings.GCP_SERVICE_ACCOUNT_KEY
                 )
                 self.gcp_client = compute_v1.InstancesClient(credentials=credentials)
                 log_event("gcp_client_initialized")
             
+            # Initialize Redis cache for infrastructure snapshots
+            if settings.REDIS_URL:
+                self.cache_client = aioredis.from_url(settings.REDIS_URL)
+            
             log_event("cloud_provider_service_initialized", {"status": "success"})
             
         except Exception as e:
             log_event("cloud_provider_service_initialization_failed", {"error": str(e)})
             raise
     
+    def _create_pooled_session(self) -> requests.Session:
+        """Create an HTTP session with a keep-alive pool sized for concurrent calls."""
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=settings.CLOUD_CLIENT_MAX_POOL_CONNECTIONS,
+            pool_maxsize=settings.CLOUD_CLIENT_MAX_POOL_CONNECTIONS
+        )
+        session.mount('https://', adapter)
+        return session
+    
     async def get_infrastructure_data(self) -> Dict[str, Any]:
-        """Get infrastructure data from all cloud providers."""
+        """Get infrastructure data from all cloud providers, served from cache when fresh."""
+        cache_key = self._get_infrastructure_cache_key()
+        
+        cached = await self._get_cached_snapshot(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            infrastructure_data = await self._fetch_infrastructure_data()
+        except Exception as e:
+            # Fall back to the last good snapshot if every provider failed
+            stale = await self._get_cached_snapshot(f"{cache_key}:stale")
+            if stale is None:
+                raise
+            log_event("infrastructure_data_served_stale", {"error": str(e)})
+            stale["stale"] = True
+            return stale
+        
+        # orjson serializes the CloudResource dataclasses and numpy scalars natively
+        # Only a complete snapshot is cached, so a partial outage is retried on the next call
+        if not infrastructure_data["failed_providers"]:
+            payload = orjson.dumps(infrastructure_data, option=orjson.OPT_SERIALIZE_NUMPY)
+            await self._set_cached_snapshot(cache_key, payload, settings.INFRASTRUCTURE_CACHE_TTL_SECONDS)
+            await self._set_cached_snapshot(f"{cache_key}:stale", payload, settings.INFRASTRUCTURE_STALE_TTL_SECONDS)
+        
+        return infrastructure_data
+    
+    def _get_infrastructure_cache_key(self) -> str:
+        """Build the cache key for the set of configured providers."""
+        providers = [
+            name for name, client in (
+                ("aws", self.aws_client), ("azure", self.azure_client), ("gcp", self.gcp_client)
+            ) if client
+        ]
+        return f"infra:{','.join(providers)}"
+    
+    async def _get_cached_snapshot(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached infrastructure snapshot, if any."""
+        if not self.cache_client:
+            return None
+        try:
+            cached = await self.cache_client.get(key)
+            if not cached:
+                return None
+            snapshot = orjson.loads(cached)
+            snapshot["resources"] = [CloudResource(**r) for r in snapshot["resources"]]
+            return snapshot
+        except Exception as e:
+            log_event("infrastructure_cache_read_failed", {"key": key, "error": str(e)})
+            return None
+    
+    async def _set_cached_snapshot(self, key: str, payload: bytes, ttl_seconds: int):
+        """Store an infrastructure snapshot with an expiry."""
+        if not self.cache_client:
+            return
+        try:
+            await self.cache_client.set(key, payload, ex=ttl_seconds)
+        except Exception as e:
+            log_event("infrastructure_cache_write_failed", {"key": key, "error": str(e)})
+    
+    async def _fetch_infrastructure_data(self) -> Dict[str, Any]:
+        """Fetch infrastructure data from all configured cloud providers."""
         try:
             infrastructure_data = {
                 "resources": [],
                 "total_monthly_cost": 0.0,
                 "total_resources": 0,
-                "providers": []
+                "cost_breakdown": {},
+                "providers": [],
+                "failed_providers": []
             }
             
-            # Get AWS resources
+            # Fetch resources from all configured providers concurrently
+            fetchers = []
             if self.aws_client:
-                aws_resources = await self._get_aws_resources()
-                infrastructure_data["resources"].extend(aws_resources)
-                infrastructure_data["providers"].append("aws")
-            
-            # Get Azure resources
+                fetchers.append(("aws", self._get_aws_resources()))
             if self.azure_client:
-                azure_resources = await self._get_azure_resources()
-                infrastructure_data["resources"].extend(azure_resources)
-                infrastructure_data["providers"].append("azure")
-            
-            # Get GCP resources
+                fetchers.append(("azure", self._get_azure_resources()))
             if self.gcp_client:
-                gcp_resources = await self._get_gcp_resources()
-                infrastructure_data["resources"].extend(gcp_resources)
-                infrastructure_data["providers"].append("gcp")
+                fetchers.append(("gcp", self._get_gcp_resources()))
+            
+            results = await asyncio.gather(
+                *(fetch for _, fetch in fetchers), return_exceptions=True
+            )
+            
+            # Each fetcher logs its own failure; a failed provider is skipped, not fatal
+            for (provider, _), result in zip(fetchers, results):
+                if isinstance(result, Exception):
+                    infrastructure_data["failed_providers"].append(provider)
+                    continue
+                infrastructure_data["resources"].extend(result)
+                infrastructure_data["providers"].append(provider)
+            
+            if fetchers and not infrastructure_data["providers"]:
+                raise RuntimeError("All cloud providers failed to return resources")
             
             # Calculate totals
-            infrastructure_data["total_resources"] = len(infrastructure_data["resources"])
-            infrastructure_data["total_monthly_cost"] = sum(
-                r.get("monthly_cost", 0) for r in infrastructure_data["resources"]
+            resources = infrastructure_data["resources"]
+            costs = np.fromiter(
+                (r.monthly_cost for r in resources), dtype=np.float64, count=len(resources)
             )
+            infrastructure_data["total_resources"] = len(resources)
+            infrastructure_data["total_monthly_cost"] = float(costs.sum())
+            
+            # Service-wise cost breakdown
+            if resources:
+                frame = build_resource_frame(resources)
+                infrastructure_data["cost_breakdown"] = (
+                    frame.groupby('service', observed=True)['monthly_cost'].sum().to_dict()
+                )
             
             return infrastructure_data
             
@@ -132,148 +355,241 @@ class CloudProviderService:
             log_event("infrastructure_data_fetch_failed", {"error": str(e)})
             raise
     
-    async def _get_aws_resources(self) -> List[Dict[str, Any]]:
+    async def _get_aws_resources(self) -> List[CloudResource]:
         """Get AWS resources."""
         try:
             resources = []
             
-            # Get EC2 instances
-            response = self.aws_client.describe_instances()
+            # Get running EC2 instances without blocking the event loop
+            instances = await asyncio.to_thread(self._describe_running_aws_instances)
             
-            for reservation in response['Reservations']:
-                for instance in reservation['Instances']:
-                    if instance['State']['Name'] == 'running':
-                        resource = {
-                            "id": instance['InstanceId'],
-                            "name": instance.get('Tags', [{}])[0].get('Value', instance['InstanceId']),
-                            "service": "ec2",
-                            "provider": "aws",
-                            "region": instance['Placement']['AvailabilityZone'][:-1],
-                            "instance_type": instance['InstanceType'],
-                            "monthly_cost": await self._calculate_aws_monthly_cost(instance),
-                            "cpu_utilization": await self._get_aws_cpu_utilization(instance['InstanceId']),
-                            "memory_utilization": await self._get_aws_memory_utilization(instance['InstanceId']),
-                            "uptime_percentage": 100.0,
-                            "environment": self._get_environment_from_tags(instance.get('Tags', [])),
-                            "tags": {tag['Key']: tag['Value'] for tag in instance.get('Tags', [])}
-                        }
-                        resources.append(resource)
+            # Fetch utilization for all instances in batched CloudWatch calls
+            utilization = await self._get_aws_utilization(
+                [instance['InstanceId'] for instance in instances]
+            )
+            
+            for instance in instances:
+                cpu_utilization, memory_utilization = utilization[instance['InstanceId']]
+                tags = {tag['Key']: tag['Value'] for tag in instance.get('Tags', ()) if 'Key' in tag}
+                resource = CloudResource(
+                    id=instance['InstanceId'],
+                    name=tags.get('Name', instance['InstanceId']),
+                    service="ec2",
+                    provider="aws",
+                    region=instance['Placement']['AvailabilityZone'][:-1],
+                    instance_type=instance['InstanceType'],
+                    monthly_cost=self._calculate_aws_monthly_cost(instance),
+                    cpu_utilization=cpu_utilization,
+                    memory_utilization=memory_utilization,
+                    uptime_percentage=100.0,
+                    environment=self._get_environment_from_labels(tags),
+                    tags=tags
+                )
+                resources.append(resource)
             
             return resources
             
         except Exception as e:
             log_event("aws_resources_fetch_failed", {"error": str(e)})
-            return []
+            raise
+    
+    def _describe_running_aws_instances(self) -> List[Dict[str, Any]]:
+        """List all running EC2 instances, following pagination."""
+        paginator = self.aws_client.get_paginator('describe_instances')
+        pages = paginator.paginate(
+            Filters=[{'Name': 'instance-state-name', 'Values': ['running']}],
+            PaginationConfig={'PageSize': 1000}
+        )
+        return list(chain.from_iterable(
+            reservation['Instances']
+            for page in pages
+            for reservation in page['Reservations']
+        ))
+    
+    async def _get_aws_utilization(self, instance_ids: List[str]) -> Dict[str, Tuple[float, float]]:
+        """Get (cpu, memory) utilization for EC2 instances."""
+        metrics = {}
+        if self.cloudwatch_client and instance_ids:
+            try:
+                metrics = await asyncio.to_thread(self._get_aws_metrics_batch, instance_ids)
+            except Exception as e:
+                log_event("aws_metrics_fetch_failed", {"error": str(e)})
+        
+        utilization = {}
+        for instance_id in instance_ids:
+            instance_metrics = metrics.get(instance_id, {})
+            cpu_utilization = instance_metrics.get("cpu_utilization")
+            if cpu_utilization is None:
+                cpu_utilization = await self._get_aws_cpu_utilization(instance_id)
+            memory_utilization = instance_metrics.get("memory_utilization")
+            if memory_utilization is None:
+                memory_utilization = await self._get_aws_memory_utilization(instance_id)
+            utilization[instance_id] = (cpu_utilization, memory_utilization)
+        
+        return utilization
+    
+    def _get_aws_metrics_batch(self, instance_ids: List[str]) -> Dict[str, Dict[str, float]]:
+        """Fetch average daily utilization for many instances with GetMetricData."""
+        end_time = datetime.utcnow()
+        start_time = end_time - timedelta(days=1)
+        fields = {prefix: field_name for prefix, _, _, field_name in AWS_UTILIZATION_METRICS}
+        
+        queries = [
+            {
+                'Id': f"{prefix}{index}",
+                'MetricStat': {
+                    'Metric': {
+                        'Namespace': namespace,
+                        'MetricName': metric_name,
+                        'Dimensions': [{'Name': 'InstanceId', 'Value': instance_id}]
+                    },
+                    'Period': 86400,
+                    'Stat': 'Average'
+                },
+                'ReturnData': True
+            }
+            for index, instance_id in enumerate(instance_ids)
+            for prefix, namespace, metric_name, _ in AWS_UTILIZATION_METRICS
+        ]
+        
+        metrics = {}
+        paginator = self.cloudwatch_client.get_paginator('get_metric_data')
+        for batch_start in range(0, len(queries), CLOUDWATCH_MAX_QUERIES):
+            pages = paginator.paginate(
+                MetricDataQueries=queries[batch_start:batch_start + CLOUDWATCH_MAX_QUERIES],
+                StartTime=start_time,
+                EndTime=end_time
+            )
+            for page in pages:
+                for result in page['MetricDataResults']:
+                    if not result['Values']:
+                        continue
+                    prefix, index = result['Id'][0], int(result['Id'][1:])
+                    # CloudWatch reports percentages; resources use 0-1 fractions
+                    metrics.setdefault(instance_ids[index], {})[fields[prefix]] = result['Values'][0] / 100
+        
+        return metrics
     
-    async def _get_azure_resources(self) -> List[Dict[str, Any]]:
+    async def _get_azure_resources(self) -> List[CloudResource]:
         """Get Azure resources."""
         try:
             resources = []
             
-            # Get virtual machines
-            vms = self.azure_client.virtual_machines.list_all()
+            # Get virtual machines without blocking the event loop, scoped to
+            # the configured resource groups when an allowlist is set
+            if settings.AZURE_RESOURCE_GROUPS:
+                vms_by_group = await asyncio.gather(*(
+                    asyncio.to_thread(
+                        lambda group=group: list(self.azure_client.virtual_machines.list(group))
+                    )
+                    for group in settings.AZURE_RESOURCE_GROUPS
+                ))
+                vms = list(chain.from_iterable(vms_by_group))
+            else:
+                vms = await asyncio.to_thread(
+                    lambda: list(self.azure_client.virtual_machines.list_all())
+                )
+            
+            # Fan out utilization lookups for all VMs at once
+            lookups = await asyncio.gather(*(
+                asyncio.gather(
+                    self._get_azure_cpu_utilization(vm.id),
+                    self._get_azure_memory_utilization(vm.id)
+                )
+                for vm in vms
+            ))
             
-            for vm in vms:
-                resource = {
-                    "id": vm.id,
-                    "name": vm.name,
-                    "service": "virtualmachines",
-                    "provider": "azure",
-                    "region": vm.location,
-                    "instance_type": vm.hardware_profile.vm_size,
-                    "monthly_cost": await self._calculate_azure_monthly_cost(vm),
-                    "cpu_utilization": await self._get_azure_cpu_utilization(vm.id),
-                    "memory_utilization": await self._get_azure_memory_utilization(vm.id),
-                    "uptime_percentage": 100.0,
-                    "environment": self._get_environment_from_tags(vm.tags or {}),
-                    "tags": vm.tags or {}
-                }
+            for vm, (cpu_utilization, memory_utilization) in zip(vms, lookups):
+                resource = CloudResource(
+                    id=vm.id,
+                    name=vm.name,
+                    service="virtualmachines",
+                    provider="azure",
+                    region=vm.location,
+                    instance_type=vm.hardware_profile.vm_size,
+                    monthly_cost=self._calculate_azure_monthly_cost(vm),
+                    cpu_utilization=cpu_utilization,
+                    memory_utilization=memory_utilization,
+                    uptime_percentage=100.0,
+                    environment=self._get_environment_from_labels(vm.tags or {}),
+                    tags=vm.tags or {}
+                )
                 resources.append(resource)
             
             return resources
             
         except Exception as e:
             log_event("azure_resources_fetch_failed", {"error": str(e)})
-            return []
+            raise
     
-    async def _get_gcp_resources(self) -> List[Dict[str, Any]]:
+    async def _get_gcp_resources(self) -> List[CloudResource]:
         """Get GCP resources."""
         try:
             resources = []
             
-            # Get compute instances
-            request = compute_v1.AggregatedListInstancesRequest(project=settings.GCP_PROJECT_ID)
-            response = self.gcp_client.aggregated_list(request=request)
+            # Get compute instances without blocking the event loop
+            zoned_instances = await asyncio.to_thread(self._list_gcp_instances)
+            
+            # Fan out utilization lookups for all instances at once
+            lookups = await asyncio.gather(*(
+                asyncio.gather(
+                    self._get_gcp_cpu_utilization(instance.id),
+                    self._get_gcp_memory_utilization(instance.id)
+                )
+                for _, instance in zoned_instances
+            ))
             
-            for zone, instances_scoped_list in response:
-                if instances_scoped_list.instances:
-                    for instance in instances_scoped_list.instances:
-                        resource = {
-                            "id": instance.id,
-                            "name": instance.name,
-                            "service": "compute",
-                            "provider": "gcp",
-                            "region": zone.split('/')[-1],
-                            "instance_type": instance.machine_type.split('/')[-1],
-                            "monthly_cost": await self._calculate_gcp_monthly_cost(instance),
-                            "cpu_utilization": await self._get_gcp_cpu_utilization(instance.id),
-                            "memory_utilization": await self._get_gcp_memory_utilization(instance.id),
-                            "uptime_percentage": 100.0,
-                            "environment": self._get_environment_from_labels(instance.labels or {}),
-                            "tags": instance.labels or {}
-                        }
-                        resources.append(resource)
+            for (zone, instance), (cpu_utilization, memory_utilization) in zip(zoned_instances, lookups):
+                machine_type = instance.machine_type.rpartition('/')[2]
+                resource = CloudResource(
+                    id=str(instance.id),
+                    name=instance.name,
+                    service="compute",
+                    provider="gcp",
+                    region=zone.rpartition('/')[2],
+                    instance_type=machine_type,
+                    monthly_cost=self._calculate_gcp_monthly_cost(machine_type),
+                    cpu_utilization=cpu_utilization,
+                    memory_utilization=memory_utilization,
+                    uptime_percentage=100.0,
+                    environment=self._get_environment_from_labels(instance.labels or {}),
+                    tags=dict(instance.labels or {})
+                )
+                resources.append(resource)
             
             return resources
             
         except Exception as e:
             log_event("gcp_resources_fetch_failed", {"error": str(e)})
-            return []
+            raise
+    
+    def _list_gcp_instances(self) -> List[Tuple[str, Any]]:
+        """List all compute instances with their zones, following pagination."""
+        from google.cloud import compute_v1
+        
+        request = compute_v1.AggregatedListInstancesRequest(project=settings.GCP_PROJECT_ID)
+        response = self.gcp_client.aggregated_list(request=request)
+        return [
+            (zone, instance)
+            for zone, instances_scoped_list in response
+            if instances_scoped_list.instances
+            for instance in instances_scoped_list.instances
+        ]
     
-    async def _calculate_aws_monthly_cost(self, instance: Dict[str, Any]) -> float:
+    def _calculate_aws_monthly_cost(self, instance: Dict[str, Any]) -> float:
         """Calculate monthly cost for AWS instance."""
         # Simplified calculation - in production, use AWS Cost Explorer API
-        instance_type = instance['InstanceType']
-        pricing = {
-            't3.micro': 8.5,
-            't3.small': 17.0,
-            't3.medium': 34.0,
-            't3.large': 68.0,
-            'm5.large': 85.0,
-            'm5.xlarge': 170.0,
-            'c5.large': 78.0,
-            'c5.xlarge': 156.0
-        }
-        return pricing.get(instance_type, 50.0)
+        return AWS_PRICING[instance['InstanceType']]
     
-    async def _calculate_azure_monthly_cost(self, vm) -> float:
+    def _calculate_azure_monthly_cost(self, vm) -> float:
         """Calculate monthly cost for Azure VM."""
         # Simplified calculation - in production, use Azure Cost Management API
-        vm_size = vm.hardware_profile.vm_size
-        pricing = {
-            'Standard_B1s': 12.0,
-            'Standard_B2s': 24.0,
-            'Standard_D2s_v3': 85.0,
-            'Standard_D4s_v3': 170.0,
-            'Standard_F2s_v2': 78.0,
-            'Standard_F4s_v2': 156.0
-        }
-        return pricing.get(vm_size, 50.0)
+        return AZURE_PRICING[vm.hardware_profile.vm_size]
     
-    async def _calculate_gcp_monthly_cost(self, instance) -> float:
-        """Calculate monthly cost for GCP instance."""
+    def _calculate_gcp_monthly_cost(self, machine_type: str) -> float:
+        """Calculate monthly cost for a GCP machine type."""
         # Simplified calculation - in production, use GCP Billing API
-        machine_type = instance.machine_type.split('/')[-1]
-        pricing = {
-            'e2-micro': 8.5,
-            'e2-small': 17.0,
-            'e2-medium': 34.0,
-            'e2-standard-2': 68.0,
-            'n1-standard-1': 45.0,
-            'n1-standard-2': 90.0,
-            'c2-standard-4': 156.0
-        }
-        return pricing.get(machine_type, 50.0)
+        return GCP_PRICING[machine_type]
     
     async def _get_aws_cpu_utilization(self, instance_id: str) -> float:
         """Get AWS CPU utilization."""
@@ -305,31 +621,34 @@ class CloudProviderService:
         # In production, use GCP Monitoring metrics
         return 0.41  # Simulated value
     
-    def _get_environment_from_tags(self, tags: List[Dict[str, str]]) -> str:
-        """Extract environment from tags."""
-        for tag in tags:
-            if tag.get('Key', '').lower() in ['environment', 'env']:
-                return tag.get('Value', 'production').lower()
-        return 'production'
-    
     def _get_environment_from_labels(self, labels: Dict[str, str]) -> str:
-        """Extract environment from labels."""
-        return labels.get('environment', labels.get('env', 'production')).lower()
+        """Extract environment from tags or labels."""
+        for key, value in labels.items():
+            if key.lower() in _ENV_KEYS:
+                return (value or 'production').lower()
+        return 'production'
     
     async def validate_connection(self, provider: str) -> bool:
         """Validate connection to cloud provider."""
+        # Reuse a recent successful check instead of calling the provider again
+        validated_at = self.validated_connections.get(provider)
+        if validated_at and time.monotonic() - validated_at < CONNECTION_VALIDATION_TTL_SECONDS:
+            return True
+        
         try:
             if provider == "aws" and self.aws_client:
                 self.aws_client.describe_regions()
-                return True
             elif provider == "azure" and self.azure_client:
                 self.azure_client.resource_groups.list()
-                return True
             elif provider == "gcp" and self.gcp_client:
+                from google.cloud import compute_v1
                 request = compute_v1.ListZonesRequest(project=settings.GCP_PROJECT_ID)
                 self.gcp_client.list(request=request)
-                return True
-            return False
+            else:
+                return False
+            
+            self.validated_connections[provider] = time.monotonic()
+            return True
         except Exception as e:
             log_event("provider_connection_validation_failed", {
                 "provider": provider,
@@ -339,19 +658,41 @@ class CloudProviderService:
     
     async def resource_exists(self, resource_id: str, provider: str) -> bool:
         """Check if a resource exists."""
+        existence = await self.resources_exist([resource_id], provider)
+        return existence[resource_id]
+    
+    async def resources_exist(self, resource_ids: List[str], provider: str) -> Dict[str, bool]:
+        """Check which of several resources exist, batching provider lookups."""
         try:
             if provider == "aws":
-                self.aws_client.describe_instances(InstanceIds=[resource_id])
-                return True
-            elif provider == "azure":
-                # Azure resource ID parsing would be needed
-                return True
-            elif provider == "gcp":
-                # GCP resource ID parsing would be needed
-                return True
-            return False
+                found = await asyncio.to_thread(self._find_aws_instance_ids, resource_ids)
+                return {resource_id: resource_id in found for resource_id in resource_ids}
+            elif provider in ("azure", "gcp"):
+                # Azure/GCP resource ID parsing would be needed
+                return dict.fromkeys(resource_ids, True)
+            return dict.fromkeys(resource_ids, False)
         except Exception:
-            return False
+            return dict.fromkeys(resource_ids, False)
+    
+    def _find_aws_instance_ids(self, instance_ids: List[str]) -> set:
+        """Return the subset of instance IDs that exist in EC2."""
+        # Filtering by instance-id ignores unknown IDs instead of failing the whole call
+        paginator = self.aws_client.get_paginator('describe_instances')
+        found = set()
+        for batch_start in range(0, len(instance_ids), EC2_FILTER_MAX_VALUES):
+            pages = paginator.paginate(Filters=[{
+                'Name': 'instance-id',
+                'Values': instance_ids[batch_start:batch_start + EC2_FILTER_MAX_VALUES]
+            }])
+            found.update(
+                instance['InstanceId']
+                for instance in chain.from_iterable(
+                    reservation['Instances']
+                    for page in pages
+                    for reservation in page['Reservations']
+                )
+            )
+        return found
     
     async def get_resource_config(self, resource_id: str, provider: str) -> Dict[str, Any]:
         """Get current resource configuration."""
@@ -369,10 +710,25 @@ class CloudProviderService:
         config = await self.get_resource_config(resource_id, provider)
         return {
             "resource_id": resource_id,
-            "backup_timestamp": datetime.now().isoformat(),
+            "backup_timestamp": _utc_timestamp(),
             "configuration": config
         }
     
+    async def create_resource_backups(self, resource_ids: List[str], provider: str) -> List[Dict[str, Any]]:
+        """Create backups of several resource configurations sharing one timestamp."""
+        backup_timestamp = _utc_timestamp()
+        configs = await asyncio.gather(*(
+            self.get_resource_config(resource_id, provider) for resource_id in resource_ids
+        ))
+        return [
+            {
+                "resource_id": resource_id,
+                "backup_timestamp": backup_timestamp,
+                "configuration": config
+            }
+            for resource_id, config in zip(resource_ids, configs)
+        ]
+    
     async def restore_resource_from_backup(self, resource_id: str, provider: str, backup_data: Dict[str, Any]):
         """Restore resource from backup."""
         # Implementation would restore the resource
@@ -384,8 +740,15 @@ class CloudProviderService:
     async def update_resource_tags(self, resource_id: str, provider: str, tags: Dict[str, str]):
         """Update resource tags."""
         # Implementation would update tags
-        log_event("resource_tags_updated", {
-            "resource_id": resource_id,
-            "provider": provider,
-            "tags": tags
-        })
+        if log_event_enabled():
+            log_event("resource_tags_updated", {
+                "resource_id": resource_id,
+                "provider": provider,
+                "tags": tags
+            })
+
+
+@lru_cache()
+def get_cloud_provider_service() -> CloudProviderService:
+    """Get the process-wide cloud provider service so SDK clients and connection pools are shared."""
+    return CloudProviderService()
@@ -6,17 +6,18 @@ cost analysis, and automated optimization recommendations.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 
 import numpy as np
-import pandas as pd
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingClassifier
-from sklearn.preprocessing import StandardScaler
+import sklearn
+from sklearn.ensemble import HistGradientBoostingRegressor, HistGradientBoostingClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_absolute_error, accuracy_score
 import joblib
@@ -24,11 +25,25 @@ import joblib
 from src.core.config import settings, OPTIMIZATION_STRATEGIES
 from src.core.database import get_db
 from src.models.optimization import OptimizationOpportunity, OptimizationExecution
-from src.services.cloud_providers import CloudProviderService
+from src.services.cloud_providers import CloudResource, get_cloud_provider_service
 from src.services.rag_system import RAGSystem
 from src.core.monitoring import track_metric, log_event
 
 
+# Model features, with the synthetic training ranges and cost weights for each
+TRAINING_FEATURES = [
+    'cpu_utilization', 'memory_utilization', 'network_io',
+    'storage_usage', 'instance_type_score', 'region_factor'
+]
+TRAINING_FEATURE_LOW = np.array([0.1, 0.1, 0.0, 0.0, 0.1, 0.8])
+TRAINING_FEATURE_HIGH = np.array([0.9, 0.9, 1000.0, 1000.0, 1.0, 1.2])
+TRAINING_FEATURE_SPAN = TRAINING_FEATURE_HIGH - TRAINING_FEATURE_LOW
+TRAINING_COST_WEIGHTS = np.array([100.0, 80.0, 0.01, 0.05, 50.0, 20.0])
+
+# Model inputs for metrics a provider did not report
+MISSING_FEATURE_DEFAULTS = {'network_io': 100.0, 'storage_usage': 100.0}
+
+
 class OptimizationType(Enum):
     """Types of cost optimizations."""
     RIGHTSIZING = "rightsizing"
@@ -40,13 +55,19 @@ class OptimizationType(Enum):
 
 
 class RiskLevel(Enum):
-    """Risk levels for optimizations."""
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
+    """Risk levels for optimizations, with their ranking penalty."""
+    LOW = ("low", 0.0)
+    MEDIUM = ("medium", 0.1)
+    HIGH = ("high", 0.3)
+    
+    def __new__(cls, value: str, ranking_penalty: float):
+        member = object.__new__(cls)
+        member._value_ = value
+        member.ranking_penalty = ranking_penalty
+        return member
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OptimizationRecommendation:
     """Represents a cost optimization recommendation."""
     id: str
@@ -58,24 +79,99 @@ class OptimizationRecommendation:
     confidence_score: float
     risk_level: RiskLevel
     description: str
-    implementation_steps: List[str]
-    rollback_steps: List[str]
+    implementation_steps: Tuple[str, ...]
+    rollback_steps: Tuple[str, ...]
     estimated_execution_time: int  # minutes
-    prerequisites: List[str]
+    prerequisites: Tuple[str, ...]
     cloud_provider: str
     region: str
     created_at: datetime
     expires_at: Optional[datetime] = None
 
 
+# Shared, immutable step lists for each recommendation type
+_RIGHTSIZING_STEPS = (
+    "1. Create snapshot of current instance",
+    "2. Stop the instance",
+    "3. Change instance type to recommended size",
+    "4. Start the instance",
+    "5. Verify application functionality"
+)
+
+_RIGHTSIZING_ROLLBACK_STEPS = (
+    "1. Stop the instance",
+    "2. Change back to original instance type",
+    "3. Start the instance"
+)
+
+_RIGHTSIZING_PREREQUISITES = (
+    "Application can handle brief downtime",
+    "Backup/snapshot capability available"
+)
+
+_SCHEDULING_STEPS = (
+    "1. Create Lambda function for start/stop operations",
+    "2. Set up CloudWatch Events for scheduling",
+    "3. Configure start schedule (8 AM weekdays)",
+    "4. Configure stop schedule (6 PM weekdays)",
+    "5. Test scheduling functionality"
+)
+
+_SCHEDULING_ROLLBACK_STEPS = (
+    "1. Disable CloudWatch Events",
+    "2. Start the resource manually",
+    "3. Remove Lambda functions"
+)
+
+_SCHEDULING_PREREQUISITES = (
+    "Resource supports start/stop operations",
+    "Application can handle scheduled downtime"
+)
+
+_UNUSED_RESOURCE_STEPS = (
+    "1. Create backup/snapshot if needed",
+    "2. Verify resource is truly unused",
+    "3. Delete the resource",
+    "4. Update monitoring and documentation"
+)
+
+_UNUSED_RESOURCE_ROLLBACK_STEPS = (
+    "1. Restore from backup/snapshot",
+    "2. Recreate resource configuration",
+    "3. Verify functionality"
+)
+
+_UNUSED_RESOURCE_PREREQUISITES = (
+    "Resource has been unused for 30+ days",
+    "No dependencies from other resources"
+)
+
+_STORAGE_OPTIMIZATION_STEPS = (
+    "1. Analyze data access patterns",
+    "2. Configure lifecycle policies",
+    "3. Migrate data to appropriate storage class",
+    "4. Monitor cost changes"
+)
+
+_STORAGE_OPTIMIZATION_ROLLBACK_STEPS = (
+    "1. Migrate data back to original storage class",
+    "2. Remove lifecycle policies"
+)
+
+_STORAGE_OPTIMIZATION_PREREQUISITES = (
+    "Data access patterns are well understood",
+    "Migration tools are available"
+)
+
+
 class CostOptimizerService:
     """Main cost optimization service with ML capabilities."""
     
     def __init__(self):
-        self.cloud_provider_service = CloudProviderService()
+        self.cloud_provider_service = get_cloud_provider_service()
         self.rag_system = RAGSystem()
         self.ml_models = {}
-        self.scalers = {}
+        self.ort_sessions = {}
         self.is_initialized = False
         
     async def initialize(self):
@@ -94,53 +190,62 @@ class CostOptimizerService:
     async def _load_ml_models(self):
         """Load pre-trained ML models."""
         try:
-            # Cost prediction model
-            self.ml_models['cost_predictor'] = RandomForestRegressor(
-                n_estimators=100,
-                max_depth=10,
+            # Cost prediction model (histogram-binned boosting fits and predicts
+            # much faster than a random forest on small tabular data)
+            self.ml_models['cost_predictor'] = HistGradientBoostingRegressor(
+                max_iter=100,
+                max_depth=8,
+                learning_rate=0.1,
+                # Stop adding trees once validation loss stops improving
+                early_stopping=True,
+                validation_fraction=0.1,
+                n_iter_no_change=10,
                 random_state=42
             )
             
             # Optimization success predictor
-            self.ml_models['success_predictor'] = GradientBoostingClassifier(
-                n_estimators=100,
+            self.ml_models['success_predictor'] = HistGradientBoostingClassifier(
+                max_iter=100,
                 learning_rate=0.1,
                 max_depth=6,
+                early_stopping=True,
+                validation_fraction=0.1,
+                n_iter_no_change=10,
                 random_state=42
             )
             
-            # Scaler for feature normalization
-            self.scalers['feature_scaler'] = StandardScaler()
-            
             log_event("ml_models_loaded", {"models": list(self.ml_models.keys())})
         except Exception as e:
             log_event("ml_models_load_failed", {"error": str(e)})
             raise
     
     async def _train_models(self):
-        """Train ML models with historical data."""
+        """Train ML models with historical data, reusing cached models when available."""
         try:
-            # Generate synthetic training data (in production, this would come from historical data)
-            training_data = await self._generate_training_data()
+            # Skip training on warm starts with unchanged hyperparameters
+            model_cache_path = self._get_model_cache_path()
+            if await self._load_cached_models(model_cache_path):
+                self._build_onnx_sessions()
+                return
             
-            # Prepare features and targets
-            X = training_data[['cpu_utilization', 'memory_utilization', 'network_io', 
-                             'storage_usage', 'instance_type_score', 'region_factor']]
-            y_cost = training_data['cost']
-            y_success = training_data['optimization_success']
-            
-            # Scale features
-            X_scaled = self.scalers['feature_scaler'].fit_transform(X)
+            # Generate synthetic training data (in production, this would come from historical data)
+            # Tree splits are scale-invariant, so features are used unscaled
+            X, y_cost, y_success = await self._generate_training_data()
             
             # Train cost prediction model
-            self.ml_models['cost_predictor'].fit(X_scaled, y_cost)
+            self.ml_models['cost_predictor'].fit(X, y_cost)
             
             # Train success prediction model
-            self.ml_models['success_predictor'].fit(X_scaled, y_success)
+            self.ml_models['success_predictor'].fit(X, y_success)
+            
+            await self._save_cached_models(model_cache_path)
+            
+            # Serve predictions through ONNX Runtime when the export succeeds
+            self._build_onnx_sessions()
             
             # Evaluate models
-            cost_pred = self.ml_models['cost_predictor'].predict(X_scaled)
-            success_pred = self.ml_models['success_predictor'].predict(X_scaled)
+            cost_pred = self.ml_models['cost_predictor'].predict(X)
+            success_pred = self.ml_models['success_predictor'].predict(X)
             
             cost_mae = mean_absolute_error(y_cost, cost_pred)
             success_accuracy = accuracy_score(y_success, success_pred)
@@ -150,47 +255,99 @@ class CostOptimizerService:
             
             log_event("models_trained", {
                 "cost_mae": cost_mae,
-                "success_accuracy": success_accuracy
+                "success_accuracy": success_accuracy,
+                "cost_predictor_trees": self.ml_models['cost_predictor'].n_iter_,
+                "success_predictor_trees": self.ml_models['success_predictor'].n_iter_
             })
             
         except Exception as e:
             log_event("model_training_failed", {"error": str(e)})
             raise
     
-    async def _generate_training_data(self) -> pd.DataFrame:
-        """Generate synthetic training data for model training."""
-        np.random.seed(42)
+    def _get_model_cache_path(self) -> str:
+        """Build the model cache file path keyed on the training configuration."""
+        training_config = json.dumps({
+            "models": {name: model.get_params() for name, model in self.ml_models.items()},
+            "features": TRAINING_FEATURES,
+            "sklearn": sklearn.__version__,
+            "seed": 42
+        }, sort_keys=True, default=str)
+        key = hashlib.sha256(training_config.encode("utf-8")).hexdigest()[:12]
+        return os.path.join(settings.ML_MODEL_CACHE_PATH, f"models_{key}.joblib")
+    
+    async def _load_cached_models(self, path: str) -> bool:
+        """Load trained models from the cache, returning whether they were loaded."""
+        if not os.path.exists(path):
+            return False
+        try:
+            self.ml_models = await asyncio.to_thread(joblib.load, path)
+            log_event("ml_models_loaded_from_cache", {"path": path})
+            return True
+        except Exception as e:
+            log_event("ml_model_cache_load_failed", {"path": path, "error": str(e)})
+            return False
+    
+    async def _save_cached_models(self, path: str):
+        """Persist trained models to the cache."""
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            await asyncio.to_thread(joblib.dump, self.ml_models, path)
+        except Exception as e:
+            log_event("ml_model_cache_save_failed", {"path": path, "error": str(e)})
+    
+    def _build_onnx_sessions(self):
+        """Export the trained models to ONNX Runtime inference sessions."""
+        try:
+            import onnxruntime as ort
+            from skl2onnx import convert_sklearn
+            from skl2onnx.common.data_types import FloatTensorType
+            
+            sessions = {}
+            for name, model in self.ml_models.items():
+                onnx_model = convert_sklearn(
+                    model,
+                    initial_types=[('X', FloatTensorType([None, 6]))],
+                    # Emit class probabilities as a plain tensor instead of a list of dicts
+                    options={id(model): {'zipmap': False}} if hasattr(model, 'predict_proba') else None
+                )
+                sessions[name] = ort.InferenceSession(
+                    onnx_model.SerializeToString(), providers=['CPUExecutionProvider']
+                )
+            
+            self.ort_sessions = sessions
+            log_event("onnx_sessions_created", {"models": list(sessions.keys())})
+        except Exception as e:
+            # Fall back to scikit-learn inference
+            self.ort_sessions = {}
+            log_event("onnx_export_failed", {"error": str(e)})
+    
+    async def _generate_training_data(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Generate synthetic training features, cost targets and success labels."""
+        rng = np.random.default_rng(42)
         n_samples = 1000
         
-        data = {
-            'cpu_utilization': np.random.uniform(0.1, 0.9, n_samples),
-            'memory_utilization': np.random.uniform(0.1, 0.9, n_samples),
-            'network_io': np.random.uniform(0, 1000, n_samples),
-            'storage_usage': np.random.uniform(0, 1000, n_samples),
-            'instance_type_score': np.random.uniform(0.1, 1.0, n_samples),
-            'region_factor': np.random.uniform(0.8, 1.2, n_samples),
-        }
+        # Fill preallocated buffers in place from the one generator
+        features = np.empty((n_samples, len(TRAINING_FEATURES)))
+        rng.random(out=features)
+        features *= TRAINING_FEATURE_SPAN
+        features += TRAINING_FEATURE_LOW
+        noise = np.empty(n_samples)
         
-        # Generate cost based on features (simplified model)
-        data['cost'] = (
-            data['cpu_utilization'] * 100 +
-            data['memory_utilization'] * 80 +
-            data['network_io'] * 0.01 +
-            data['storage_usage'] * 0.05 +
-            data['instance_type_score'] * 50 +
-            data['region_factor'] * 20 +
-            np.random.normal(0, 10, n_samples)
-        )
+        # Generate cost based on features (simplified linear model), fused into one matmul
+        cost = features @ TRAINING_COST_WEIGHTS
+        rng.standard_normal(out=noise)
+        noise *= 10
+        cost += noise
         
         # Generate optimization success (higher success for low-risk scenarios)
-        risk_score = (
-            data['cpu_utilization'] * 0.3 +
-            data['memory_utilization'] * 0.3 +
-            np.random.uniform(0, 0.4, n_samples)
-        )
-        data['optimization_success'] = (risk_score < 0.6).astype(int)
+        risk_score = features[:, :2] @ np.array([0.3, 0.3])
+        rng.random(out=noise)
+        noise *= 0.4
+        risk_score += noise
         
-        return pd.DataFrame(data)
+        optimization_success = (risk_score < 0.6).astype(int)
+        
+        return features.astype(np.float32), cost, optimization_success
     
     async def analyze_cost_optimization_opportunities(self) -> List[OptimizationRecommendation]:
         """Analyze current infrastructure and identify optimization opportunities."""
@@ -199,6 +356,8 @@ class CostOptimizerService:
         
         try:
             log_event("optimization_analysis_started")
+            # Shared by every recommendation built in this analysis run
+            analysis_time = datetime.now()
             
             # Get current infrastructure data
             infrastructure_data = await self.cloud_provider_service.get_infrastructure_data()
@@ -210,11 +369,30 @@ class CostOptimizerService:
             
             recommendations = []
             
-            # Analyze each resource for optimization opportunities
-            for resource in infrastructure_data:
-                resource_recommendations = await self._analyze_resource(
-                    resource, rag_insights
+            # Screen all resources at once, then analyze only the flagged ones
+            resources = infrastructure_data["resources"]
+            columns = self._build_resource_columns(resources)
+            rightsize_mask, schedule_mask, unused_mask, storage_mask = self._screen_resources(columns)
+            candidates = np.flatnonzero(rightsize_mask | schedule_mask | unused_mask | storage_mask)
+            
+            # Run the ML models once over all right-sizing candidates, off the event loop
+            rightsize_indices = np.flatnonzero(rightsize_mask).tolist()
+            predicted_costs, success_probabilities = await asyncio.to_thread(
+                self._predict_rightsizing, self._build_feature_matrix(columns, rightsize_mask)
+            )
+            rightsizing_predictions = dict(zip(
+                rightsize_indices, zip(predicted_costs.tolist(), success_probabilities.tolist())
+            ))
+            
+            # Analyze flagged resources concurrently
+            results = await asyncio.gather(*(
+                self._analyze_resource(
+                    resources[i], rag_insights, rightsizing_predictions.get(i),
+                    schedule_mask[i], unused_mask[i], storage_mask[i], analysis_time
                 )
+                for i in candidates.tolist()
+            ))
+            for resource_recommendations in results:
                 recommendations.extend(resource_recommendations)
             
             # Filter and rank recommendations
@@ -235,276 +413,266 @@ class CostOptimizerService:
             log_event("optimization_analysis_failed", {"error": str(e)})
             raise
     
-    async def _analyze_resource(self, resource: Dict[str, Any], rag_insights: List[Dict]) -> List[OptimizationRecommendation]:
+    def _build_resource_columns(self, resources: List[CloudResource]) -> Dict[str, np.ndarray]:
+        """Build columnar arrays of the resource attributes used in analysis."""
+        n = len(resources)
+        columns = {
+            attr: np.fromiter((getattr(r, attr) for r in resources), dtype=np.float64, count=n)
+            for attr in ('cpu_utilization', 'memory_utilization', 'uptime_percentage', 'access_frequency')
+        }
+        # Optional metrics; unreported values become NaN
+        for attr in MISSING_FEATURE_DEFAULTS:
+            columns[attr] = np.array([getattr(r, attr) for r in resources], dtype=np.float64)
+        columns['environment'] = np.array([r.environment for r in resources], dtype=object)
+        columns['storage_type'] = np.array([r.storage_type for r in resources], dtype=object)
+        return columns
+    
+    def _screen_resources(self, columns: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Compute right-sizing, scheduling, unused and storage masks for all resources."""
+        cpu_utilization = columns['cpu_utilization']
+        memory_utilization = columns['memory_utilization']
+        
+        return (
+            self._should_rightsize(cpu_utilization, memory_utilization),
+            self._should_schedule(columns['environment'], columns['uptime_percentage']),
+            # Unreported network I/O counts as idle
+            self._is_unused_resource(cpu_utilization, memory_utilization,
+                                     np.where(np.isnan(columns['network_io']), 0.0, columns['network_io'])),
+            self._should_optimize_storage(columns['storage_type'], columns['access_frequency'])
+        )
+    
+    def _build_feature_matrix(self, columns: Dict[str, np.ndarray], mask: np.ndarray) -> np.ndarray:
+        """Slice the model feature matrix for the selected resources."""
+        features = np.empty((np.count_nonzero(mask), len(TRAINING_FEATURES)), dtype=np.float32)
+        for j, name in enumerate(('cpu_utilization', 'memory_utilization', 'network_io', 'storage_usage')):
+            values = columns[name][mask]
+            if name in MISSING_FEATURE_DEFAULTS:
+                values = np.where(np.isnan(values), MISSING_FEATURE_DEFAULTS[name], values)
+            features[:, j] = values
+        features[:, 4] = 0.7  # instance_type_score
+        features[:, 5] = 1.0  # region_factor
+        return features
+    
+    def _predict_rightsizing(self, features: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Predict optimized cost and success probability for right-sizing candidates."""
+        if not len(features):
+            return np.empty(0), np.empty(0)
+        
+        if self.ort_sessions:
+            inputs = {'X': features}
+            predicted_costs = self.ort_sessions['cost_predictor'].run(None, inputs)[0].ravel()
+            # Outputs are (label, probabilities)
+            success_probabilities = self.ort_sessions['success_predictor'].run(None, inputs)[1][:, 1]
+        else:
+            predicted_costs = self.ml_models['cost_predictor'].predict(features)
+            success_probabilities = self.ml_models['success_predictor'].predict_proba(features)[:, 1]
+        
+        return predicted_costs, success_probabilities
+    
+    async def _analyze_resource(self, resource: CloudResource, rag_insights: List[Dict],
+                                rightsizing_prediction: Optional[Tuple[float, float]], should_schedule: bool,
+                                is_unused: bool, should_optimize_storage: bool,
+                                analysis_time: datetime) -> List[OptimizationRecommendation]:
         """Analyze a single resource for optimization opportunities."""
         recommendations = []
-        resource_id = resource['id']
-        service_name = resource['service']
-        current_cost = resource['monthly_cost']
         
         # Right-sizing analysis
-        if await self._should_rightsize(resource):
+        if rightsizing_prediction is not None:
+            predicted_cost, success_probability = rightsizing_prediction
             recommendation = await self._create_rightsizing_recommendation(
-                resource, rag_insights
+                resource, rag_insights, predicted_cost, success_probability, analysis_time
             )
             recommendations.append(recommendation)
         
         # Scheduling analysis
-        if await self._should_schedule(resource):
+        if should_schedule:
             recommendation = await self._create_scheduling_recommendation(
-                resource, rag_insights
+                resource, rag_insights, analysis_time
             )
             recommendations.append(recommendation)
         
         # Unused resource analysis
-        if await self._is_unused_resource(resource):
+        if is_unused:
             recommendation = await self._create_unused_resource_recommendation(
-                resource, rag_insights
+                resource, rag_insights, analysis_time
             )
             recommendations.append(recommendation)
         
         # Storage optimization
-        if resource.get('storage_type') and await self._should_optimize_storage(resource):
+        if should_optimize_storage:
             recommendation = await self._create_storage_optimization_recommendation(
-                resource, rag_insights
+                resource, rag_insights, analysis_time
             )
             recommendations.append(recommendation)
         
         return recommendations
     
-    async def _should_rightsize(self, resource: Dict[str, Any]) -> bool:
-        """Determine if a resource should be right-sized."""
-        cpu_utilization = resource.get('cpu_utilization', 0)
-        memory_utilization = resource.get('memory_utilization', 0)
-        
+    def _should_rightsize(self, cpu_utilization: np.ndarray, memory_utilization: np.ndarray) -> np.ndarray:
+        """Determine which resources should be right-sized."""
         # Consider right-sizing if utilization is consistently low
-        return (cpu_utilization < 0.3 or cpu_utilization > 0.9) or \
-               (memory_utilization < 0.3 or memory_utilization > 0.9)
+        return (cpu_utilization < 0.3) | (cpu_utilization > 0.9) | \
+               (memory_utilization < 0.3) | (memory_utilization > 0.9)
     
-    async def _should_schedule(self, resource: Dict[str, Any]) -> bool:
-        """Determine if a resource should be scheduled."""
+    def _should_schedule(self, environment: np.ndarray, uptime_percentage: np.ndarray) -> np.ndarray:
+        """Determine which resources should be scheduled."""
         # Non-production resources that run 24/7
-        environment = resource.get('environment', 'production')
-        uptime_percentage = resource.get('uptime_percentage', 100)
-        
-        return environment != 'production' and uptime_percentage > 80
+        return (environment != 'production') & (uptime_percentage > 80)
     
-    async def _is_unused_resource(self, resource: Dict[str, Any]) -> bool:
-        """Determine if a resource is unused."""
-        cpu_utilization = resource.get('cpu_utilization', 0)
-        memory_utilization = resource.get('memory_utilization', 0)
-        network_io = resource.get('network_io', 0)
-        
-        return (cpu_utilization < 0.05 and 
-                memory_utilization < 0.05 and 
-                network_io < 1)
+    def _is_unused_resource(self, cpu_utilization: np.ndarray, memory_utilization: np.ndarray,
+                            network_io: np.ndarray) -> np.ndarray:
+        """Determine which resources are unused."""
+        return (cpu_utilization < 0.05) & \
+               (memory_utilization < 0.05) & \
+               (network_io < 1)
     
-    async def _should_optimize_storage(self, resource: Dict[str, Any]) -> bool:
-        """Determine if storage should be optimized."""
-        storage_type = resource.get('storage_type')
-        access_frequency = resource.get('access_frequency', 1)
-        
+    def _should_optimize_storage(self, storage_type: np.ndarray, access_frequency: np.ndarray) -> np.ndarray:
+        """Determine which resources' storage should be optimized."""
         # Optimize if using expensive storage for infrequently accessed data
-        return (storage_type == 'ssd' and access_frequency < 0.1) or \
-               (storage_type == 'standard' and access_frequency > 0.8)
+        return ((storage_type == 'ssd') & (access_frequency < 0.1)) | \
+               ((storage_type == 'standard') & (access_frequency > 0.8))
     
-    async def _create_rightsizing_recommendation(self, resource: Dict[str, Any], rag_insights: List[Dict]) -> OptimizationRecommendation:
-        """Create a right-sizing recommendation."""
-        current_cost = resource['monthly_cost']
-        
-        # Use ML model to predict optimal instance size
-        features = np.array([[
-            resource.get('cpu_utilization', 0.5),
-            resource.get('memory_utilization', 0.5),
-            resource.get('network_io', 100),
-            resource.get('storage_usage', 100),
-            0.7,  # instance_type_score
-            1.0   # region_factor
-        ]])
-        
-        features_scaled = self.scalers['feature_scaler'].transform(features)
-        predicted_cost = self.ml_models['cost_predictor'].predict(features_scaled)[0]
-        success_probability = self.ml_models['success_predictor'].predict_proba(features_scaled)[0][1]
+    async def _create_rightsizing_recommendation(self, resource: CloudResource, rag_insights: List[Dict],
+                                                 predicted_cost: float, success_probability: float,
+                                                 analysis_time: datetime) -> OptimizationRecommendation:
+        """Create a right-sizing recommendation from batched ML predictions."""
+        current_cost = resource.monthly_cost
         
         potential_savings = max(0, current_cost - predicted_cost)
         
         return OptimizationRecommendation(
-            id=f"rightsizing_{resource['id']}_{datetime.now().timestamp()}",
-            service_name=resource['service'],
-            resource_id=resource['id'],
+            id=f"rightsizing_{resource.id}_{analysis_time.timestamp()}",
+            service_name=resource.service,
+            resource_id=resource.id,
             optimization_type=OptimizationType.RIGHTSIZING,
             current_cost=current_cost,
             potential_savings=potential_savings,
             confidence_score=float(success_probability),
             risk_level=RiskLevel.MEDIUM,
-            description=f"Right-size {resource['instance_type']} instance based on utilization patterns",
-            implementation_steps=[
-                "1. Create snapshot of current instance",
-                "2. Stop the instance",
-                "3. Change instance type to recommended size",
-                "4. Start the instance",
-                "5. Verify application functionality"
-            ],
-            rollback_steps=[
-                "1. Stop the instance",
-                "2. Change back to original instance type",
-                "3. Start the instance"
-            ],
+            description=f"Right-size {resource.instance_type} instance based on utilization patterns",
+            implementation_steps=_RIGHTSIZING_STEPS,
+            rollback_steps=_RIGHTSIZING_ROLLBACK_STEPS,
             estimated_execution_time=15,
-            prerequisites=[
-                "Application can handle brief downtime",
-                "Backup/snapshot capability available"
-            ],
-            cloud_provider=resource['provider'],
-            region=resource['region'],
-            created_at=datetime.now(),
-            expires_at=datetime.now() + timedelta(days=7)
+            prerequisites=_RIGHTSIZING_PREREQUISITES,
+            cloud_provider=resource.provider,
+            region=resource.region,
+            created_at=analysis_time,
+            expires_at=analysis_time + timedelta(days=7)
         )
     
-    async def _create_scheduling_recommendation(self, resource: Dict[str, Any], rag_insights: List[Dict]) -> OptimizationRecommendation:
+    async def _create_scheduling_recommendation(self, resource: CloudResource, rag_insights: List[Dict],
+                                                analysis_time: datetime) -> OptimizationRecommendation:
         """Create a scheduling recommendation."""
-        current_cost = resource['monthly_cost']
+        current_cost = resource.monthly_cost
         # Assume 50% savings from scheduling (running only 12 hours/day)
         potential_savings = current_cost * 0.5
         
         return OptimizationRecommendation(
-            id=f"scheduling_{resource['id']}_{datetime.now().timestamp()}",
-            service_name=resource['service'],
-            resource_id=resource['id'],
+            id=f"scheduling_{resource.id}_{analysis_time.timestamp()}",
+            service_name=resource.service,
+            resource_id=resource.id,
             optimization_type=OptimizationType.SCHEDULING,
             current_cost=current_cost,
             potential_savings=potential_savings,
             confidence_score=0.95,
             risk_level=RiskLevel.LOW,
-            description=f"Schedule {resource['service']} to run only during business hours",
-            implementation_steps=[
-                "1. Create Lambda function for start/stop operations",
-                "2. Set up CloudWatch Events for scheduling",
-                "3. Configure start schedule (8 AM weekdays)",
-                "4. Configure stop schedule (6 PM weekdays)",
-                "5. Test scheduling functionality"
-            ],
-            rollback_steps=[
-                "1. Disable CloudWatch Events",
-                "2. Start the resource manually",
-                "3. Remove Lambda functions"
-            ],
+            description=f"Schedule {resource.service} to run only during business hours",
+            implementation_steps=_SCHEDULING_STEPS,
+            rollback_steps=_SCHEDULING_ROLLBACK_STEPS,
             estimated_execution_time=30,
-            prerequisites=[
-                "Resource supports start/stop operations",
-                "Application can handle scheduled downtime"
-            ],
-            cloud_provider=resource['provider'],
-            region=resource['region'],
-            created_at=datetime.now(),
-            expires_at=datetime.now() + timedelta(days=14)
+            prerequisites=_SCHEDULING_PREREQUISITES,
+            cloud_provider=resource.provider,
+            region=resource.region,
+            created_at=analysis_time,
+            expires_at=analysis_time + timedelta(days=14)
         )
     
-    async def _create_unused_resource_recommendation(self, resource: Dict[str, Any], rag_insights: List[Dict]) -> OptimizationRecommendation:
+    async def _create_unused_resource_recommendation(self, resource: CloudResource, rag_insights: List[Dict],
+                                                     analysis_time: datetime) -> OptimizationRecommendation:
         """Create an unused resource recommendation."""
-        current_cost = resource['monthly_cost']
+        current_cost = resource.monthly_cost
         potential_savings = current_cost
         
         return OptimizationRecommendation(
-            id=f"unused_{resource['id']}_{datetime.now().timestamp()}",
-            service_name=resource['service'],
-            resource_id=resource['id'],
+            id=f"unused_{resource.id}_{analysis_time.timestamp()}",
+            service_name=resource.service,
+            resource_id=resource.id,
             optimization_type=OptimizationType.UNUSED_RESOURCES,
             current_cost=current_cost,
             potential_savings=potential_savings,
             confidence_score=0.99,
             risk_level=RiskLevel.LOW,
-            description=f"Remove unused {resource['service']} resource",
-            implementation_steps=[
-                "1. Create backup/snapshot if needed",
-                "2. Verify resource is truly unused",
-                "3. Delete the resource",
-                "4. Update monitoring and documentation"
-            ],
-            rollback_steps=[
-                "1. Restore from backup/snapshot",
-                "2. Recreate resource configuration",
-                "3. Verify functionality"
-            ],
+            description=f"Remove unused {resource.service} resource",
+            implementation_steps=_UNUSED_RESOURCE_STEPS,
+            rollback_steps=_UNUSED_RESOURCE_ROLLBACK_STEPS,
             estimated_execution_time=10,
-            prerequisites=[
-                "Resource has been unused for 30+ days",
-                "No dependencies from other resources"
-            ],
-            cloud_provider=resource['provider'],
-            region=resource['region'],
-            created_at=datetime.now(),
-            expires_at=datetime.now() + timedelta(days=3)
+            prerequisites=_UNUSED_RESOURCE_PREREQUISITES,
+            cloud_provider=resource.provider,
+            region=resource.region,
+            created_at=analysis_time,
+            expires_at=analysis_time + timedelta(days=3)
         )
     
-    async def _create_storage_optimization_recommendation(self, resource: Dict[str, Any], rag_insights: List[Dict]) -> OptimizationRecommendation:
+    async def _create_storage_optimization_recommendation(self, resource: CloudResource, rag_insights: List[Dict],
+                                                          analysis_time: datetime) -> OptimizationRecommendation:
         """Create a storage optimization recommendation."""
-        current_cost = resource['monthly_cost']
+        current_cost = resource.monthly_cost
         # Assume 30% savings from storage optimization
         potential_savings = current_cost * 0.3
         
         return OptimizationRecommendation(
-            id=f"storage_{resource['id']}_{datetime.now().timestamp()}",
-            service_name=resource['service'],
-            resource_id=resource['id'],
+            id=f"storage_{resource.id}_{analysis_time.timestamp()}",
+            service_name=resource.service,
+            resource_id=resource.id,
             optimization_type=OptimizationType.STORAGE_OPTIMIZATION,
             current_cost=current_cost,
             potential_savings=potential_savings,
             confidence_score=0.85,
             risk_level=RiskLevel.LOW,
-            description=f"Optimize storage class for {resource['service']}",
-            implementation_steps=[
-                "1. Analyze data access patterns",
-                "2. Configure lifecycle policies",
-                "3. Migrate data to appropriate storage class",
-                "4. Monitor cost changes"
-            ],
-            rollback_steps=[
-                "1. Migrate data back to original storage class",
-                "2. Remove lifecycle policies"
-            ],
+            description=f"Optimize storage class for {resource.service}",
+            implementation_steps=_STORAGE_OPTIMIZATION_STEPS,
+            rollback_steps=_STORAGE_OPTIMIZATION_ROLLBACK_STEPS,
             estimated_execution_time=60,
-            prerequisites=[
-                "Data access patterns are well understood",
-                "Migration tools are available"
-            ],
-            cloud_provider=resource['provider'],
-            region=resource['region'],
-            created_at=datetime.now(),
-            expires_at=datetime.now() + timedelta(days=7)
+            prerequisites=_STORAGE_OPTIMIZATION_PREREQUISITES,
+            cloud_provider=resource.provider,
+            region=resource.region,
+            created_at=analysis_time,
+            expires_at=analysis_time + timedelta(days=7)
         )
     
     async def _filter_recommendations(self, recommendations: List[OptimizationRecommendation]) -> List[OptimizationRecommendation]:
         """Filter recommendations based on business rules."""
-        filtered = []
+        savings_threshold = settings.OPTIMIZATION_THRESHOLD_PERCENTAGE * 0.01
+        max_savings = settings.MAX_OPTIMIZATION_AMOUNT
+        n = len(recommendations)
+        savings = np.fromiter((r.potential_savings for r in recommendations), dtype=np.float64, count=n)
+        costs = np.fromiter((r.current_cost for r in recommendations), dtype=np.float64, count=n)
+        confidence = np.fromiter((r.confidence_score for r in recommendations), dtype=np.float64, count=n)
         
-        for rec in recommendations:
-            # Skip if savings below threshold
-            if rec.potential_savings < settings.OPTIMIZATION_THRESHOLD_PERCENTAGE / 100 * rec.current_cost:
-                continue
-            
-            # Skip if savings above maximum
-            if rec.potential_savings > settings.MAX_OPTIMIZATION_AMOUNT:
-                continue
-            
-            # Skip if confidence too low
-            if rec.confidence_score < 0.7:
-                continue
-            
-            filtered.append(rec)
+        keep = (
+            # Savings at or above threshold
+            (savings >= savings_threshold * costs) &
+            # Savings at or below maximum
+            (savings <= max_savings) &
+            # Confidence high enough
+            (confidence >= 0.7)
+        )
         
-        return filtered
+        return [rec for rec, kept in zip(recommendations, keep.tolist()) if kept]
     
     async def _rank_recommendations(self, recommendations: List[OptimizationRecommendation]) -> List[OptimizationRecommendation]:
         """Rank recommendations by ROI and risk."""
-        def ranking_score(rec: OptimizationRecommendation) -> float:
-            roi_score = rec.potential_savings / rec.current_cost if rec.current_cost > 0 else 0
-            confidence_score = rec.confidence_score
-            risk_penalty = {'low': 0, 'medium': 0.1, 'high': 0.3}[rec.risk_level.value]
-            
-            return roi_score * confidence_score - risk_penalty
+        n = len(recommendations)
+        savings = np.fromiter((r.potential_savings for r in recommendations), dtype=np.float64, count=n)
+        costs = np.fromiter((r.current_cost for r in recommendations), dtype=np.float64, count=n)
+        confidence = np.fromiter((r.confidence_score for r in recommendations), dtype=np.float64, count=n)
+        risk_penalty = np.fromiter((r.risk_level.ranking_penalty for r in recommendations), dtype=np.float64, count=n)
+        
+        roi = np.divide(savings, costs, out=np.zeros(n), where=costs > 0)
+        scores = roi * confidence - risk_penalty
         
-        return sorted(recommendations, key=ranking_score, reverse=True)
+        # Stable descending order, matching sorted(..., reverse=True) on ties
+        order = np.argsort(-scores, kind='stable')
+        return [recommendations[i] for i in order.tolist()]
     
     async def _save_recommendations(self, recommendations: List[OptimizationRecommendation]):
         """Save recommendations to database."""
@@ -6,22 +6,178 @@ in ticketing systems like Jira and ServiceNow.
 """
 
 import asyncio
-import json
+import base64
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass
+import string
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Any, Callable, Iterable, Mapping, Tuple, Union
+from dataclasses import dataclass, field
 from enum import Enum
+from collections import Counter
+from itertools import chain
 
 import aiohttp
-from jira import JIRA
-from jira.exceptions import JIRAError
-import requests
-from requests.auth import HTTPBasicAuth
+import orjson
 
 from src.core.config import settings
 from src.models.optimization import OptimizationOpportunity, OptimizationExecution
-from src.core.monitoring import log_event
+from src.core.monitoring import log_event, LogLevel, orjson_dumps
+
+
+# Backoff bounds for ticketing API rate-limit (HTTP 429) retries
+TICKET_RETRY_BASE_SECONDS = 1.0
+TICKET_RETRY_MAX_SECONDS = 30.0
+
+# ServiceNow Batch API limit on requests per batch call
+SERVICENOW_BATCH_MAX_REQUESTS = 150
+SERVICENOW_BATCH_HEADERS = [
+    {"name": "Content-Type", "value": "application/json"},
+    {"name": "Accept", "value": "application/json"}
+]
+
+# Ticket create responses are small JSON bodies; only the key/sys_id is used
+TICKET_READ_BUFSIZE = 16384
+
+
+# str.format conversion flags (!s, !r, !a)
+_TEMPLATE_CONVERSIONS = {"s": str, "r": repr, "a": ascii}
+
+
+def _parse_template(template: str) -> Tuple[Tuple[str, Optional[str], str, Optional[Callable[[Any], str]]], ...]:
+    """Parse a `str.format` template once into (literal, field, spec, conversion) parts."""
+    parts = []
+    for literal, name, spec, conversion in string.Formatter().parse(template):
+        if name is not None:
+            if not name.isidentifier():
+                raise ValueError(f"Unsupported template field: {name!r}")
+            if "{" in spec:
+                raise ValueError(f"Nested fields in format spec are not supported: {spec!r}")
+            if conversion and conversion not in _TEMPLATE_CONVERSIONS:
+                raise ValueError(f"Unsupported conversion: !{conversion}")
+        parts.append((literal, name, spec or "", _TEMPLATE_CONVERSIONS.get(conversion)))
+    return tuple(parts)
+
+
+def _compile_template(template: str) -> Callable[[Mapping[str, Any]], str]:
+    """Compile a `str.format` template into a function rendering it from a mapping.
+    
+    The template is parsed once, so rendering skips the format-string parsing
+    `str.format` repeats on every call.
+    """
+    parts = _parse_template(template)
+    
+    def render(values: Mapping[str, Any]) -> str:
+        return "".join([
+            literal if name is None else
+            literal + format(values[name] if convert is None else convert(values[name]), spec)
+            for literal, name, spec, convert in parts
+        ])
+    
+    return render
+
+
+def _compile_labels(labels: Tuple[str, ...]) -> Callable[[Mapping[str, Any]], List[str]]:
+    """Compile label templates into static labels plus (index, field) substitution points."""
+    static = list(labels)
+    substitutions = []
+    for index, label in enumerate(labels):
+        parts = _parse_template(label)
+        fields = [name for _, name, _, _ in parts if name is not None]
+        if not fields:
+            continue
+        literal, name, spec, convert = parts[0]
+        if len(parts) != 1 or literal or spec or convert:
+            raise ValueError(f"Labels must be literal or a single field reference: {label!r}")
+        substitutions.append((index, name))
+    
+    def render(values: Mapping[str, Any]) -> List[str]:
+        rendered = static.copy()
+        for index, name in substitutions:
+            rendered[index] = str(values[name])
+        return rendered
+    
+    return render
+
+
+# Plain-text ticket descriptions carried on TicketData, rendered from the ticket format variables
+_REQUEST_DESCRIPTION_TEMPLATE = """
+        Cost Optimization Opportunity
+        
+        Service: {service_name}
+        Resource ID: {resource_id}
+        Optimization Type: {optimization_type}
+        Cloud Provider: {cloud_provider}
+        Region: {region}
+        
+        Current Cost: ${current_cost:,.2f}
+        Potential Savings: ${potential_savings:,.2f}
+        Confidence Score: {confidence_score:.1%}
+        Risk Level: {risk_level}
+        
+        Description: {description}
+        """
+
+_EXECUTION_DESCRIPTION_TEMPLATE = """
+        Cost Optimization Execution Completed
+        
+        Service: {service_name}
+        Resource ID: {resource_id}
+        Optimization Type: {optimization_type}
+        Execution ID: {execution_id}
+        
+        Actual Savings: ${actual_savings:,.2f}
+        Execution Time: {execution_time}
+        Status: Completed Successfully
+        
+        Approved By: {approved_by}
+        Executed At: {executed_at}
+        Completed At: {completed_at}
+        """
+
+_FAILURE_DESCRIPTION_TEMPLATE = """
+        Cost Optimization Execution Failed
+        
+        Service: {service_name}
+        Resource ID: {resource_id}
+        Optimization Type: {optimization_type}
+        Execution ID: {execution_id}
+        
+        Error Message: {error_message}
+        Failed Step: Execution Phase
+        Failure Time: {failure_time}
+        
+        Rollback Status: ✅ Automatic rollback completed successfully
+        Service Impact: None (rollback successful)
+        Data Impact: None
+        Financial Impact: None
+        User Impact: None
+        
+        Approved By: {approved_by}
+        Failed At: {failed_at}
+        """
+
+_REQUEST_DESCRIPTION = _compile_template(_REQUEST_DESCRIPTION_TEMPLATE)
+_EXECUTION_DESCRIPTION = _compile_template(_EXECUTION_DESCRIPTION_TEMPLATE)
+_FAILURE_DESCRIPTION = _compile_template(_FAILURE_DESCRIPTION_TEMPLATE)
+
+
+class RateLimiter:
+    """Spaces out calls so at most `rate` start per second."""
+    
+    def __init__(self, rate: float):
+        self.min_interval = 1.0 / rate
+        self.next_slot = 0.0
+        self.lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until the next call slot is available."""
+        async with self.lock:
+            delay = self.next_slot - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self.next_slot = max(self.next_slot, time.monotonic()) + self.min_interval
 
 
 class TicketType(Enum):
@@ -41,11 +197,93 @@ class TicketPriority(Enum):
     CRITICAL = "Critical"
 
 
+@dataclass(slots=True, frozen=True)
+class JiraTemplate:
+    """Jira issue template for one ticket type."""
+    project: str
+    issue_type: str
+    summary: str
+    description: str
+    labels: Tuple[str, ...]
+    priority: str
+    bullet: str = "•"
+    render_summary: Callable[[Mapping[str, Any]], str] = field(init=False, repr=False, compare=False)
+    render_description: Callable[[Mapping[str, Any]], str] = field(init=False, repr=False, compare=False)
+    render_labels: Callable[[Mapping[str, Any]], List[str]] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Parse once here; ticket creation only fills in values
+        object.__setattr__(self, "render_summary", _compile_template(self.summary))
+        object.__setattr__(self, "render_description", _compile_template(self.description))
+        object.__setattr__(self, "render_labels", _compile_labels(self.labels))
+
+
+@dataclass(slots=True, frozen=True)
+class ServiceNowTemplate:
+    """ServiceNow record template for one ticket type."""
+    table: str
+    short_description: str
+    description: str
+    priority: str
+    urgency: str
+    impact: str
+    category: str
+    subcategory: str
+    state: str = "New"
+    close_code: str = ""
+    close_notes: str = ""
+    resolution_code: str = ""
+    resolution_notes: str = ""
+    bullet: str = "-"
+    render_short_description: Callable[[Mapping[str, Any]], str] = field(init=False, repr=False, compare=False)
+    render_description: Callable[[Mapping[str, Any]], str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "render_short_description", _compile_template(self.short_description))
+        object.__setattr__(self, "render_description", _compile_template(self.description))
+
+
+@dataclass(slots=True, frozen=True)
+class TicketTemplate:
+    """Per-system templates for one ticket type."""
+    jira: JiraTemplate
+    servicenow: ServiceNowTemplate
+
+
+@dataclass(slots=True)
+class TicketResult:
+    """Outcome of creating a ticket in one system."""
+    ticket_id: Optional[str]
+    ticket_url: Optional[str] = None
+    status: str = "created"
+    error: Optional[str] = None
+
+
+def _ticket_results_level(results: Dict[str, TicketResult]) -> LogLevel:
+    """Log a ticket event at WARNING when any system failed to create its ticket."""
+    return LogLevel.WARNING if any(result.status == "failed" for result in results.values()) else LogLevel.INFO
+
+
+class LazyText:
+    """Text rendered from a template only when it is first converted with str()."""
+    __slots__ = ("render", "values", "text")
+    
+    def __init__(self, render: Callable[[Mapping[str, Any]], str], values: Mapping[str, Any]):
+        self.render = render
+        self.values = values
+        self.text = None
+    
+    def __str__(self) -> str:
+        if self.text is None:
+            self.text = self.render(self.values)
+        return self.text
+
+
 @dataclass
 class TicketData:
     """Data for creating a ticket."""
     title: str
-    description: str
+    description: Union[str, LazyText]
     ticket_type: TicketType
     priority: TicketPriority
     assignee: Optional[str] = None
@@ -54,340 +292,350 @@ class TicketData:
     attachments: List[Dict[str, Any]] = None
 
 
+# Ticket templates per ticket type; summary/description fields use str.format syntax
+TICKET_TEMPLATES: Dict[TicketType, TicketTemplate] = {
+    TicketType.OPTIMIZATION_REQUEST: TicketTemplate(
+        jira=JiraTemplate(
+            project="COST",
+            issue_type="Story",
+            summary="Cost Optimization Request: {service_name}",
+            description="""
+            *Cost Optimization Opportunity*
+            
+            *Service:* {service_name}
+            *Resource ID:* {resource_id}
+            *Optimization Type:* {optimization_type}
+            *Cloud Provider:* {cloud_provider}
+            *Region:* {region}
+            
+            *Current Cost:* ${current_cost:,.2f}
+            *Potential Savings:* ${potential_savings:,.2f}
+            *Confidence Score:* {confidence_score:.1%}
+            *Risk Level:* {risk_level}
+            
+            *Description:*
+            {description}
+            
+            *Implementation Steps:*
+            {implementation_steps}
+            
+            *Rollback Steps:*
+            {rollback_steps}
+            
+            *Prerequisites:*
+            {prerequisites}
+            
+            *Estimated Execution Time:* {estimated_execution_time} minutes
+            *Expires:* {expires_at}
+            
+            *Approval Required:* Yes
+            *Auto-Execution:* Enabled with approval
+            """,
+            labels=("cost-optimization", "auto-generated", "{cloud_provider}"),
+            priority="Medium"
+        ),
+        servicenow=ServiceNowTemplate(
+            table="incident",
+            short_description="Cost Optimization Request: {service_name}",
+            description="""
+            Cost Optimization Opportunity
+            
+            Service: {service_name}
+            Resource ID: {resource_id}
+            Optimization Type: {optimization_type}
+            Cloud Provider: {cloud_provider}
+            Region: {region}
+            
+            Current Cost: ${current_cost:,.2f}
+            Potential Savings: ${potential_savings:,.2f}
+            Confidence Score: {confidence_score:.1%}
+            Risk Level: {risk_level}
+            
+            Description:
+            {description}
+            
+            Implementation Steps:
+            {implementation_steps}
+            
+            Rollback Steps:
+            {rollback_steps}
+            
+            Prerequisites:
+            {prerequisites}
+            
+            Estimated Execution Time: {estimated_execution_time} minutes
+            Expires: {expires_at}
+            
+            Approval Required: Yes
+            Auto-Execution: Enabled with approval
+            """,
+            priority="3",
+            urgency="2",
+            impact="3",
+            category="Cost Management",
+            subcategory="Optimization"
+        )
+    ),
+    TicketType.OPTIMIZATION_EXECUTION: TicketTemplate(
+        jira=JiraTemplate(
+            project="COST",
+            issue_type="Task",
+            summary="Cost Optimization Executed: {service_name} - ${savings_amount:,.2f} saved",
+            description="""
+            *Cost Optimization Execution Completed*
+            
+            *Service:* {service_name}
+            *Resource ID:* {resource_id}
+            *Optimization Type:* {optimization_type}
+            *Execution ID:* {execution_id}
+            
+            *Results:*
+            * Actual Savings: ${actual_savings:,.2f}
+            * Execution Time: {execution_time}
+            * Status: Completed Successfully
+            
+            *Execution Details:*
+            {execution_details}
+            
+            *Approved By:* {approved_by}
+            *Executed At:* {executed_at}
+            *Completed At:* {completed_at}
+            
+            *Impact:*
+            * Monthly Cost Reduction: ${actual_savings:,.2f}
+            * Annual Projected Savings: ${annual_savings:,.2f}
+            * ROI: {roi:.1%}
+            
+            *Verification:*
+            ✅ Resource configuration updated successfully
+            ✅ Application functionality verified
+            ✅ Performance metrics within acceptable range
+            ✅ No service interruption detected
+            """,
+            labels=("cost-optimization", "executed", "completed", "{cloud_provider}"),
+            priority="Low"
+        ),
+        servicenow=ServiceNowTemplate(
+            table="change_request",
+            short_description="Cost Optimization Executed: {service_name} - ${savings_amount:,.2f} saved",
+            description="""
+            Cost Optimization Execution Completed
+            
+            Service: {service_name}
+            Resource ID: {resource_id}
+            Optimization Type: {optimization_type}
+            Execution ID: {execution_id}
+            
+            Results:
+            - Actual Savings: ${actual_savings:,.2f}
+            - Execution Time: {execution_time}
+            - Status: Completed Successfully
+            
+            Execution Details:
+            {execution_details}
+            
+            Approved By: {approved_by}
+            Executed At: {executed_at}
+            Completed At: {completed_at}
+            
+            Impact:
+            - Monthly Cost Reduction: ${actual_savings:,.2f}
+            - Annual Projected Savings: ${annual_savings:,.2f}
+            - ROI: {roi:.1%}
+            
+            Verification:
+            ✅ Resource configuration updated successfully
+            ✅ Application functionality verified
+            ✅ Performance metrics within acceptable range
+            ✅ No service interruption detected
+            """,
+            priority="4",
+            urgency="3",
+            impact="3",
+            category="Cost Management",
+            subcategory="Optimization",
+            state="Closed Complete",
+            close_code="Successful (Permanently Fixed)",
+            close_notes="Cost optimization completed successfully with expected savings achieved."
+        )
+    ),
+    TicketType.OPTIMIZATION_FAILURE: TicketTemplate(
+        jira=JiraTemplate(
+            project="COST",
+            issue_type="Bug",
+            summary="Cost Optimization Failed: {service_name} - Rollback Initiated",
+            description="""
+            *Cost Optimization Execution Failed*
+            
+            *Service:* {service_name}
+            *Resource ID:* {resource_id}
+            *Optimization Type:* {optimization_type}
+            *Execution ID:* {execution_id}
+            
+            *Failure Details:*
+            * Error Message: {error_message}
+            * Failed Step: {failed_step}
+            * Failure Time: {failure_time}
+            
+            *Rollback Status:*
+            ✅ Automatic rollback initiated
+            ✅ Resource restored to previous state
+            ✅ No data loss occurred
+            ✅ Service availability maintained
+            
+            *Impact Assessment:*
+            * Service Impact: None (rollback successful)
+            * Data Impact: None
+            * Financial Impact: None
+            * User Impact: None
+            
+            *Root Cause Analysis:*
+            {root_cause_analysis}
+            
+            *Prevention Measures:*
+            {prevention_measures}
+            
+            *Next Steps:*
+            1. Review failure logs and root cause
+            2. Update optimization parameters if needed
+            3. Schedule retry if appropriate
+            4. Document lessons learned
+            
+            *Approved By:* {approved_by}
+            *Failed At:* {failed_at}
+            """,
+            labels=("cost-optimization", "failed", "rollback", "incident", "{cloud_provider}"),
+            priority="High"
+        ),
+        servicenow=ServiceNowTemplate(
+            table="incident",
+            short_description="Cost Optimization Failed: {service_name} - Rollback Initiated",
+            description="""
+            Cost Optimization Execution Failed
+            
+            Service: {service_name}
+            Resource ID: {resource_id}
+            Optimization Type: {optimization_type}
+            Execution ID: {execution_id}
+            
+            Failure Details:
+            - Error Message: {error_message}
+            - Failed Step: {failed_step}
+            - Failure Time: {failure_time}
+            
+            Rollback Status:
+            ✅ Automatic rollback initiated
+            ✅ Resource restored to previous state
+            ✅ No data loss occurred
+            ✅ Service availability maintained
+            
+            Impact Assessment:
+            - Service Impact: None (rollback successful)
+            - Data Impact: None
+            - Financial Impact: None
+            - User Impact: None
+            
+            Root Cause Analysis:
+            {root_cause_analysis}
+            
+            Prevention Measures:
+            {prevention_measures}
+            
+            Next Steps:
+            1. Review failure logs and root cause
+            2. Update optimization parameters if needed
+            3. Schedule retry if appropriate
+            4. Document lessons learned
+            
+            Approved By: {approved_by}
+            Failed At: {failed_at}
+            """,
+            priority="2",
+            urgency="2",
+            impact="2",
+            category="Cost Management",
+            subcategory="Optimization Failure",
+            state="Resolved",
+            resolution_code="Fixed (Permanently Resolved)",
+            resolution_notes="Automatic rollback completed successfully. No service impact."
+        )
+    )
+}
+
+
 class DocumentationService:
     """Service for automatic documentation in ticketing systems."""
     
     def __init__(self):
-        self.jira_client = None
-        self.servicenow_client = None
-        self.ticket_templates = {}
+        self.jira_session = None
+        self.servicenow_session = None
+        self.ticket_limits = {}
+        self.ticket_templates = TICKET_TEMPLATES
+        self.ticket_stats = Counter()
+        self.ticket_creation_seconds = 0.0
         
     async def initialize(self):
         """Initialize the documentation service."""
         try:
-            # Initialize Jira client
+            # Initialize Jira REST session
             if settings.JIRA_URL and settings.JIRA_USERNAME and settings.JIRA_API_TOKEN:
-                self.jira_client = JIRA(
-                    server=settings.JIRA_URL,
-                    basic_auth=(settings.JIRA_USERNAME, settings.JIRA_API_TOKEN)
+                # Encode the Basic auth header once instead of on every request
+                self.jira_session = aiohttp.ClientSession(
+                    headers={'Authorization': aiohttp.BasicAuth(settings.JIRA_USERNAME, settings.JIRA_API_TOKEN).encode()},
+                    connector=aiohttp.TCPConnector(limit_per_host=settings.JIRA_MAX_CONCURRENCY, keepalive_timeout=75),
+                    timeout=aiohttp.ClientTimeout(total=30),
+                    read_bufsize=TICKET_READ_BUFSIZE,
+                    json_serialize=orjson_dumps
+                )
+                self.ticket_limits["jira"] = (
+                    asyncio.Semaphore(settings.JIRA_MAX_CONCURRENCY),
+                    RateLimiter(settings.JIRA_REQUESTS_PER_SECOND)
                 )
                 log_event("jira_client_initialized")
             
             # Initialize ServiceNow client
             if settings.SERVICENOW_URL and settings.SERVICENOW_USERNAME and settings.SERVICENOW_PASSWORD:
-                self.servicenow_client = {
-                    "url": settings.SERVICENOW_URL,
-                    "auth": HTTPBasicAuth(settings.SERVICENOW_USERNAME, settings.SERVICENOW_PASSWORD)
-                }
+                self.servicenow_session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit_per_host=settings.SERVICENOW_MAX_CONCURRENCY, keepalive_timeout=75),
+                    headers={
+                        'Authorization': aiohttp.BasicAuth(settings.SERVICENOW_USERNAME, settings.SERVICENOW_PASSWORD).encode(),
+                        'Content-Type': 'application/json',
+                        'Accept': 'application/json'
+                    },
+                    timeout=aiohttp.ClientTimeout(total=30),
+                    read_bufsize=TICKET_READ_BUFSIZE,
+                    json_serialize=orjson_dumps
+                )
+                self.ticket_limits["servicenow"] = (
+                    asyncio.Semaphore(settings.SERVICENOW_MAX_CONCURRENCY),
+                    RateLimiter(settings.SERVICENOW_REQUESTS_PER_SECOND)
+                )
                 log_event("servicenow_client_initialized")
             
-            # Load ticket templates
-            await self._load_ticket_templates()
-            
             log_event("documentation_service_initialized", {"status": "success"})
             
         except Exception as e:
             log_event("documentation_service_initialization_failed", {"error": str(e)})
             raise
     
-    async def _load_ticket_templates(self):
-        """Load ticket templates for different optimization types."""
-        self.ticket_templates = {
-            "optimization_request": {
-                "jira": {
-                    "project": "COST",
-                    "issue_type": "Story",
-                    "summary": "Cost Optimization Request: {service_name}",
-                    "description": """
-                    *Cost Optimization Opportunity*
-                    
-                    *Service:* {service_name}
-                    *Resource ID:* {resource_id}
-                    *Optimization Type:* {optimization_type}
-                    *Cloud Provider:* {cloud_provider}
-                    *Region:* {region}
-                    
-                    *Current Cost:* ${current_cost:,.2f}
-                    *Potential Savings:* ${potential_savings:,.2f}
-                    *Confidence Score:* {confidence_score:.1%}
-                    *Risk Level:* {risk_level}
-                    
-                    *Description:*
-                    {description}
-                    
-                    *Implementation Steps:*
-                    {implementation_steps}
-                    
-                    *Rollback Steps:*
-                    {rollback_steps}
-                    
-                    *Prerequisites:*
-                    {prerequisites}
-                    
-                    *Estimated Execution Time:* {estimated_execution_time} minutes
-                    *Expires:* {expires_at}
-                    
-                    *Approval Required:* Yes
-                    *Auto-Execution:* Enabled with approval
-                    """,
-                    "labels": ["cost-optimization", "auto-generated", "{cloud_provider}"],
-                    "priority": "Medium"
-                },
-                "servicenow": {
-                    "table": "incident",
-                    "short_description": "Cost Optimization Request: {service_name}",
-                    "description": """
-                    Cost Optimization Opportunity
-                    
-                    Service: {service_name}
-                    Resource ID: {resource_id}
-                    Optimization Type: {optimization_type}
-                    Cloud Provider: {cloud_provider}
-                    Region: {region}
-                    
-                    Current Cost: ${current_cost:,.2f}
-                    Potential Savings: ${potential_savings:,.2f}
-                    Confidence Score: {confidence_score:.1%}
-                    Risk Level: {risk_level}
-                    
-                    Description:
-                    {description}
-                    
-                    Implementation Steps:
-                    {implementation_steps}
-                    
-                    Rollback Steps:
-                    {rollback_steps}
-                    
-                    Prerequisites:
-                    {prerequisites}
-                    
-                    Estimated Execution Time: {estimated_execution_time} minutes
-                    Expires: {expires_at}
-                    
-                    Approval Required: Yes
-                    Auto-Execution: Enabled with approval
-                    """,
-                    "priority": "3",
-                    "urgency": "2",
-                    "impact": "3",
-                    "category": "Cost Management",
-                    "subcategory": "Optimization"
-                }
-            },
-            "optimization_execution": {
-                "jira": {
-                    "project": "COST",
-                    "issue_type": "Task",
-                    "summary": "Cost Optimization Executed: {service_name} - ${savings_amount:,.2f} saved",
-                    "description": """
-                    *Cost Optimization Execution Completed*
-                    
-                    *Service:* {service_name}
-                    *Resource ID:* {resource_id}
-                    *Optimization Type:* {optimization_type}
-                    *Execution ID:* {execution_id}
-                    
-                    *Results:*
-                    * Actual Savings: ${actual_savings:,.2f}
-                    * Execution Time: {execution_time}
-                    * Status: Completed Successfully
-                    
-                    *Execution Details:*
-                    {execution_details}
-                    
-                    *Approved By:* {approved_by}
-                    *Executed At:* {executed_at}
-                    *Completed At:* {completed_at}
-                    
-                    *Impact:*
-                    * Monthly Cost Reduction: ${actual_savings:,.2f}
-                    * Annual Projected Savings: ${annual_savings:,.2f}
-                    * ROI: {roi:.1%}
-                    
-                    *Verification:*
-                    ✅ Resource configuration updated successfully
-                    ✅ Application functionality verified
-                    ✅ Performance metrics within acceptable range
-                    ✅ No service interruption detected
-                    """,
-                    "labels": ["cost-optimization", "executed", "completed", "{cloud_provider}"],
-                    "priority": "Low"
-                },
-                "servicenow": {
-                    "table": "change_request",
-                    "short_description": "Cost Optimization Executed: {service_name} - ${savings_amount:,.2f} saved",
-                    "description": """
-                    Cost Optimization Execution Completed
-                    
-                    Service: {service_name}
-                    Resource ID: {resource_id}
-                    Optimization Type: {optimization_type}
-                    Execution ID: {execution_id}
-                    
-                    Results:
-                    - Actual Savings: ${actual_savings:,.2f}
-                    - Execution Time: {execution_time}
-                    - Status: Completed Successfully
-                    
-                    Execution Details:
-                    {execution_details}
-                    
-                    Approved By: {approved_by}
-                    Executed At: {executed_at}
-                    Completed At: {completed_at}
-                    
-                    Impact:
-                    - Monthly Cost Reduction: ${actual_savings:,.2f}
-                    - Annual Projected Savings: ${annual_savings:,.2f}
-                    - ROI: {roi:.1%}
-                    
-                    Verification:
-                    ✅ Resource configuration updated successfully
-                    ✅ Application functionality verified
-                    ✅ Performance metrics within acceptable range
-                    ✅ No service interruption detected
-                    """,
-                    "priority": "4",
-                    "urgency": "3",
-                    "impact": "3",
-                    "category": "Cost Management",
-                    "subcategory": "Optimization",
-                    "state": "Closed Complete",
-                    "close_code": "Successful (Permanently Fixed)",
-                    "close_notes": "Cost optimization completed successfully with expected savings achieved."
-                }
-            },
-            "optimization_failure": {
-                "jira": {
-                    "project": "COST",
-                    "issue_type": "Bug",
-                    "summary": "Cost Optimization Failed: {service_name} - Rollback Initiated",
-                    "description": """
-                    *Cost Optimization Execution Failed*
-                    
-                    *Service:* {service_name}
-                    *Resource ID:* {resource_id}
-                    *Optimization Type:* {optimization_type}
-                    *Execution ID:* {execution_id}
-                    
-                    *Failure Details:*
-                    * Error Message: {error_message}
-                    * Failed Step: {failed_step}
-                    * Failure Time: {failure_time}
-                    
-                    *Rollback Status:*
-                    ✅ Automatic rollback initiated
-                    ✅ Resource restored to previous state
-                    ✅ No data loss occurred
-                    ✅ Service availability maintained
-                    
-                    *Impact Assessment:*
-                    * Service Impact: None (rollback successful)
-                    * Data Impact: None
-                    * Financial Impact: None
-                    * User Impact: None
-                    
-                    *Root Cause Analysis:*
-                    {root_cause_analysis}
-                    
-                    *Prevention Measures:*
-                    {prevention_measures}
-                    
-                    *Next Steps:*
-                    1. Review failure logs and root cause
-                    2. Update optimization parameters if needed
-                    3. Schedule retry if appropriate
-                    4. Document lessons learned
-                    
-                    *Approved By:* {approved_by}
-                    *Failed At:* {failed_at}
-                    """,
-                    "labels": ["cost-optimization", "failed", "rollback", "incident", "{cloud_provider}"],
-                    "priority": "High"
-                },
-                "servicenow": {
-                    "table": "incident",
-                    "short_description": "Cost Optimization Failed: {service_name} - Rollback Initiated",
-                    "description": """
-                    Cost Optimization Execution Failed
-                    
-                    Service: {service_name}
-                    Resource ID: {resource_id}
-                    Optimization Type: {optimization_type}
-                    Execution ID: {execution_id}
-                    
-                    Failure Details:
-                    - Error Message: {error_message}
-                    - Failed Step: {failed_step}
-                    - Failure Time: {failure_time}
-                    
-                    Rollback Status:
-                    ✅ Automatic rollback initiated
-                    ✅ Resource restored to previous state
-                    ✅ No data loss occurred
-                    ✅ Service availability maintained
-                    
-                    Impact Assessment:
-                    - Service Impact: None (rollback successful)
-                    - Data Impact: None
-                    - Financial Impact: None
-                    - User Impact: None
-                    
-                    Root Cause Analysis:
-                    {root_cause_analysis}
-                    
-                    Prevention Measures:
-                    {prevention_measures}
-                    
-                    Next Steps:
-                    1. Review failure logs and root cause
-                    2. Update optimization parameters if needed
-                    3. Schedule retry if appropriate
-                    4. Document lessons learned
-                    
-                    Approved By: {approved_by}
-                    Failed At: {failed_at}
-                    """,
-                    "priority": "2",
-                    "urgency": "2",
-                    "impact": "2",
-                    "category": "Cost Management",
-                    "subcategory": "Optimization Failure",
-                    "state": "Resolved",
-                    "resolution_code": "Fixed (Permanently Resolved)",
-                    "resolution_notes": "Automatic rollback completed successfully. No service impact."
-                }
-            }
-        }
-    
-    async def create_optimization_request_ticket(self, opportunity: OptimizationOpportunity) -> Dict[str, Any]:
+    async def create_optimization_request_ticket(self, opportunity: OptimizationOpportunity) -> Dict[str, TicketResult]:
         """Create a ticket for optimization request."""
         try:
+            format_vars = self._build_format_vars(TicketType.OPTIMIZATION_REQUEST, opportunity)
             ticket_data = TicketData(
                 title=f"Cost Optimization Request: {opportunity.service_name}",
-                description=self._format_optimization_request_description(opportunity),
+                description=LazyText(_REQUEST_DESCRIPTION, format_vars),
                 ticket_type=TicketType.OPTIMIZATION_REQUEST,
                 priority=TicketPriority.MEDIUM,
                 labels=["cost-optimization", "auto-generated", opportunity.cloud_provider.value]
             )
             
-            results = {}
-            
-            # Create Jira ticket
-            if self.jira_client:
-                jira_result = await self._create_jira_ticket(ticket_data, opportunity)
-                results["jira"] = jira_result
-            
-            # Create ServiceNow ticket
-            if self.servicenow_client:
-                servicenow_result = await self._create_servicenow_ticket(ticket_data, opportunity)
-                results["servicenow"] = servicenow_result
+            results = await self._create_tickets(ticket_data, opportunity, format_vars)
             
             log_event("optimization_request_ticket_created", {
                 "opportunity_id": opportunity.id,
                 "results": results
-            })
+            }, _ticket_results_level(results))
             
             return results
             
@@ -399,33 +647,24 @@ class DocumentationService:
             raise
     
     async def create_optimization_execution_ticket(self, execution: OptimizationExecution, 
-                                                 opportunity: OptimizationOpportunity) -> Dict[str, Any]:
+                                                 opportunity: OptimizationOpportunity) -> Dict[str, TicketResult]:
         """Create a ticket for optimization execution."""
         try:
+            format_vars = self._build_format_vars(TicketType.OPTIMIZATION_EXECUTION, opportunity, execution)
             ticket_data = TicketData(
-                title=f"Cost Optimization Executed: {opportunity.service_name} - ${execution.actual_savings or opportunity.potential_savings:,.2f} saved",
-                description=self._format_optimization_execution_description(execution, opportunity),
+                title=f"Cost Optimization Executed: {opportunity.service_name} - ${format_vars['actual_savings']:,.2f} saved",
+                description=LazyText(_EXECUTION_DESCRIPTION, format_vars),
                 ticket_type=TicketType.OPTIMIZATION_EXECUTION,
                 priority=TicketPriority.LOW,
                 labels=["cost-optimization", "executed", "completed", opportunity.cloud_provider.value]
             )
             
-            results = {}
-            
-            # Create Jira ticket
-            if self.jira_client:
-                jira_result = await self._create_jira_ticket(ticket_data, opportunity, execution)
-                results["jira"] = jira_result
-            
-            # Create ServiceNow ticket
-            if self.servicenow_client:
-                servicenow_result = await self._create_servicenow_ticket(ticket_data, opportunity, execution)
-                results["servicenow"] = servicenow_result
+            results = await self._create_tickets(ticket_data, opportunity, format_vars)
             
             log_event("optimization_execution_ticket_created", {
                 "execution_id": execution.id,
                 "results": results
-            })
+            }, _ticket_results_level(results))
             
             return results
             
@@ -438,33 +677,24 @@ class DocumentationService:
     
     async def create_optimization_failure_ticket(self, execution: OptimizationExecution, 
                                                opportunity: OptimizationOpportunity, 
-                                               error_message: str) -> Dict[str, Any]:
+                                               error_message: str) -> Dict[str, TicketResult]:
         """Create a ticket for optimization failure."""
         try:
+            format_vars = self._build_format_vars(TicketType.OPTIMIZATION_FAILURE, opportunity, execution, error_message)
             ticket_data = TicketData(
                 title=f"Cost Optimization Failed: {opportunity.service_name} - Rollback Initiated",
-                description=self._format_optimization_failure_description(execution, opportunity, error_message),
+                description=LazyText(_FAILURE_DESCRIPTION, format_vars),
                 ticket_type=TicketType.OPTIMIZATION_FAILURE,
                 priority=TicketPriority.HIGH,
                 labels=["cost-optimization", "failed", "rollback", "incident", opportunity.cloud_provider.value]
             )
             
-            results = {}
-            
-            # Create Jira ticket
-            if self.jira_client:
-                jira_result = await self._create_jira_ticket(ticket_data, opportunity, execution, error_message)
-                results["jira"] = jira_result
-            
-            # Create ServiceNow ticket
-            if self.servicenow_client:
-                servicenow_result = await self._create_servicenow_ticket(ticket_data, opportunity, execution, error_message)
-                results["servicenow"] = servicenow_result
+            results = await self._create_tickets(ticket_data, opportunity, format_vars)
             
             log_event("optimization_failure_ticket_created", {
                 "execution_id": execution.id,
                 "results": results
-            })
+            }, _ticket_results_level(results))
             
             return results
             
@@ -475,200 +705,283 @@ class DocumentationService:
             })
             raise
     
-    async def _create_jira_ticket(self, ticket_data: TicketData, opportunity: OptimizationOpportunity, 
-                                execution: Optional[OptimizationExecution] = None, 
-                                error_message: Optional[str] = None) -> Dict[str, Any]:
+    async def create_optimization_request_tickets(self, opportunities: List[OptimizationOpportunity]
+                                                  ) -> List[Union[Dict[str, TicketResult], Exception]]:
+        """Create request tickets for many opportunities concurrently.
+        
+        Per-system concurrency and rate limits still apply; failures are returned in place.
+        """
+        return await asyncio.gather(
+            *(self.create_optimization_request_ticket(opportunity) for opportunity in opportunities),
+            return_exceptions=True
+        )
+    
+    async def create_optimization_execution_tickets(
+        self, executions: List[Tuple[OptimizationExecution, OptimizationOpportunity]]
+    ) -> List[Union[Dict[str, TicketResult], Exception]]:
+        """Create execution tickets for many (execution, opportunity) pairs concurrently."""
+        return await asyncio.gather(
+            *(self.create_optimization_execution_ticket(execution, opportunity)
+              for execution, opportunity in executions),
+            return_exceptions=True
+        )
+    
+    async def create_optimization_failure_tickets(
+        self, failures: List[Tuple[OptimizationExecution, OptimizationOpportunity, str]]
+    ) -> List[Union[Dict[str, TicketResult], Exception]]:
+        """Create failure tickets for many (execution, opportunity, error) triples concurrently."""
+        return await asyncio.gather(
+            *(self.create_optimization_failure_ticket(execution, opportunity, error_message)
+              for execution, opportunity, error_message in failures),
+            return_exceptions=True
+        )
+    
+    async def _create_tickets(self, ticket_data: TicketData, opportunity: OptimizationOpportunity,
+                              format_vars: Dict[str, Any]) -> Dict[str, TicketResult]:
+        """Create tickets in all configured systems concurrently.
+        
+        `format_vars` is shared by both systems; only the bullet style differs per backend.
+        """
+        started = time.perf_counter()
+        creators = []
+        if self.jira_session:
+            creators.append(("jira", self._create_jira_ticket(ticket_data, opportunity, format_vars)))
+        if self.servicenow_session:
+            creators.append(("servicenow", self._create_servicenow_ticket(ticket_data, opportunity, format_vars)))
+        
+        outcomes = await asyncio.gather(*(create for _, create in creators), return_exceptions=True)
+        
+        results = {}
+        for (system, _), outcome in zip(creators, outcomes):
+            # A failure in one system must not drop the other system's ticket;
+            # it is reported in the caller's single results event
+            if isinstance(outcome, Exception):
+                outcome = TicketResult(ticket_id=None, status="failed", error=str(outcome))
+            results[system] = outcome
+        
+        self._record_ticket_results(ticket_data.ticket_type, results.items(), time.perf_counter() - started)
+        return results
+    
+    def _record_ticket_results(self, ticket_type: TicketType, outcomes: Iterable[Tuple[str, TicketResult]],
+                               elapsed: float, events: int = 1):
+        """Update the documentation statistics for `events` ticket events."""
+        stats = self.ticket_stats
+        stats[ticket_type.value] += events
+        for system, result in outcomes:
+            stats[f"{system}_attempted"] += 1
+            if result.status == "created":
+                stats[f"{system}_tickets"] += 1
+        self.ticket_creation_seconds += elapsed
+    
+    async def _create_jira_ticket(self, ticket_data: TicketData, opportunity: OptimizationOpportunity,
+                                format_vars: Dict[str, Any]) -> TicketResult:
         """Create a Jira ticket."""
         try:
-            template = self.ticket_templates[ticket_data.ticket_type.value]["jira"]
-            
-            # Format description
-            if ticket_data.ticket_type == TicketType.OPTIMIZATION_REQUEST:
-                description = template["description"].format(
-                    service_name=opportunity.service_name,
-                    resource_id=opportunity.resource_id,
-                    optimization_type=opportunity.optimization_type.value,
-                    cloud_provider=opportunity.cloud_provider.value,
-                    region=opportunity.region,
-                    current_cost=opportunity.current_cost,
-                    potential_savings=opportunity.potential_savings,
-                    confidence_score=opportunity.confidence_score,
-                    risk_level=opportunity.risk_level.value,
-                    description=opportunity.description,
-                    implementation_steps="\n".join([f"• {step}" for step in opportunity.implementation_steps]),
-                    rollback_steps="\n".join([f"• {step}" for step in opportunity.rollback_steps]),
-                    prerequisites="\n".join([f"• {prereq}" for prereq in opportunity.prerequisites]),
-                    estimated_execution_time=opportunity.estimated_execution_time,
-                    expires_at=opportunity.expires_at.strftime('%Y-%m-%d %H:%M UTC') if opportunity.expires_at else "No expiration"
-                )
-            elif ticket_data.ticket_type == TicketType.OPTIMIZATION_EXECUTION and execution:
-                description = template["description"].format(
-                    service_name=opportunity.service_name,
-                    resource_id=opportunity.resource_id,
-                    optimization_type=opportunity.optimization_type.value,
-                    execution_id=execution.id,
-                    actual_savings=execution.actual_savings or opportunity.potential_savings,
-                    execution_time=str(execution.completed_at - execution.started_at) if execution.completed_at and execution.started_at else "Unknown",
-                    execution_details=json.dumps(execution.execution_log or [], indent=2),
-                    approved_by=execution.executed_by,
-                    executed_at=execution.started_at.isoformat() if execution.started_at else "Unknown",
-                    completed_at=execution.completed_at.isoformat() if execution.completed_at else "Unknown",
-                    annual_savings=(execution.actual_savings or opportunity.potential_savings) * 12,
-                    roi=(execution.actual_savings or opportunity.potential_savings) / opportunity.current_cost if opportunity.current_cost > 0 else 0
-                )
-            elif ticket_data.ticket_type == TicketType.OPTIMIZATION_FAILURE and execution and error_message:
-                description = template["description"].format(
-                    service_name=opportunity.service_name,
-                    resource_id=opportunity.resource_id,
-                    optimization_type=opportunity.optimization_type.value,
-                    execution_id=execution.id,
-                    error_message=error_message,
-                    failed_step="Execution Phase",
-                    failure_time=execution.completed_at.isoformat() if execution.completed_at else datetime.now().isoformat(),
-                    root_cause_analysis="Analysis pending - will be updated after investigation",
-                    prevention_measures="Review and update optimization parameters",
-                    approved_by=execution.executed_by,
-                    failed_at=execution.completed_at.isoformat() if execution.completed_at else datetime.now().isoformat()
-                )
+            template = self.ticket_templates[ticket_data.ticket_type].jira
             
             # Create issue
             issue_dict = {
-                'project': {'key': template["project"]},
-                'summary': template["summary"].format(**self._get_format_variables(opportunity, execution, error_message)),
-                'description': description,
-                'issuetype': {'name': template["issue_type"]},
-                'labels': [label.format(**self._get_format_variables(opportunity, execution, error_message)) 
-                          for label in template["labels"]],
-                'priority': {'name': template["priority"]}
+                'project': {'key': template.project},
+                'summary': template.render_summary(format_vars),
+                'description': self._render_description(ticket_data.ticket_type, template, opportunity, format_vars),
+                'issuetype': {'name': template.issue_type},
+                'labels': template.render_labels(format_vars),
+                'priority': {'name': template.priority}
             }
             
             # Add custom fields if any
             if ticket_data.custom_fields:
                 issue_dict.update(ticket_data.custom_fields)
             
-            new_issue = self.jira_client.create_issue(fields=issue_dict)
+            status, new_issue = await self._post_ticket(
+                "jira", self.jira_session, f"{settings.JIRA_URL}/rest/api/2/issue", {'fields': issue_dict}
+            )
+            if status != 201:
+                return TicketResult(ticket_id=None, status="failed", error=f"HTTP {status}: {new_issue}")
             
-            return {
-                "ticket_id": new_issue.key,
-                "ticket_url": f"{settings.JIRA_URL}/browse/{new_issue.key}",
-                "status": "created"
-            }
+            return TicketResult(
+                ticket_id=new_issue['key'],
+                ticket_url=f"{settings.JIRA_URL}/browse/{new_issue['key']}"
+            )
             
-        except JIRAError as e:
-            return {
-                "ticket_id": None,
-                "error": str(e),
-                "status": "failed"
-            }
+        except Exception as e:
+            return TicketResult(ticket_id=None, status="failed", error=str(e))
     
     async def _create_servicenow_ticket(self, ticket_data: TicketData, opportunity: OptimizationOpportunity,
-                                      execution: Optional[OptimizationExecution] = None,
-                                      error_message: Optional[str] = None) -> Dict[str, Any]:
+                                      format_vars: Dict[str, Any]) -> TicketResult:
         """Create a ServiceNow ticket."""
         try:
-            template = self.ticket_templates[ticket_data.ticket_type.value]["servicenow"]
-            
-            # Format description
-            if ticket_data.ticket_type == TicketType.OPTIMIZATION_REQUEST:
-                description = template["description"].format(
-                    service_name=opportunity.service_name,
-                    resource_id=opportunity.resource_id,
-                    optimization_type=opportunity.optimization_type.value,
-                    cloud_provider=opportunity.cloud_provider.value,
-                    region=opportunity.region,
-                    current_cost=opportunity.current_cost,
-                    potential_savings=opportunity.potential_savings,
-                    confidence_score=opportunity.confidence_score,
-                    risk_level=opportunity.risk_level.value,
-                    description=opportunity.description,
-                    implementation_steps="\n".join([f"- {step}" for step in opportunity.implementation_steps]),
-                    rollback_steps="\n".join([f"- {step}" for step in opportunity.rollback_steps]),
-                    prerequisites="\n".join([f"- {prereq}" for prereq in opportunity.prerequisites]),
-                    estimated_execution_time=opportunity.estimated_execution_time,
-                    expires_at=opportunity.expires_at.strftime('%Y-%m-%d %H:%M UTC') if opportunity.expires_at else "No expiration"
-                )
-            elif ticket_data.ticket_type == TicketType.OPTIMIZATION_EXECUTION and execution:
-                description = template["description"].format(
-                    service_name=opportunity.service_name,
-                    resource_id=opportunity.resource_id,
-                    optimization_type=opportunity.optimization_type.value,
-                    execution_id=execution.id,
-                    actual_savings=execution.actual_savings or opportunity.potential_savings,
-                    execution_time=str(execution.completed_at - execution.started_at) if execution.completed_at and execution.started_at else "Unknown",
-                    execution_details=json.dumps(execution.execution_log or [], indent=2),
-                    approved_by=execution.executed_by,
-                    executed_at=execution.started_at.isoformat() if execution.started_at else "Unknown",
-                    completed_at=execution.completed_at.isoformat() if execution.completed_at else "Unknown",
-                    annual_savings=(execution.actual_savings or opportunity.potential_savings) * 12,
-                    roi=(execution.actual_savings or opportunity.potential_savings) / opportunity.current_cost if opportunity.current_cost > 0 else 0
-                )
-            elif ticket_data.ticket_type == TicketType.OPTIMIZATION_FAILURE and execution and error_message:
-                description = template["description"].format(
-                    service_name=opportunity.service_name,
-                    resource_id=opportunity.resource_id,
-                    optimization_type=opportunity.optimization_type.value,
-                    execution_id=execution.id,
-                    error_message=error_message,
-                    failed_step="Execution Phase",
-                    failure_time=execution.completed_at.isoformat() if execution.completed_at else datetime.now().isoformat(),
-                    root_cause_analysis="Analysis pending - will be updated after investigation",
-                    prevention_measures="Review and update optimization parameters",
-                    approved_by=execution.executed_by,
-                    failed_at=execution.completed_at.isoformat() if execution.completed_at else datetime.now().isoformat()
-                )
+            template, payload = self._build_servicenow_payload(ticket_data.ticket_type, opportunity, format_vars)
+            return await self._post_servicenow_payload(template, payload)
             
-            # Prepare payload
-            payload = {
-                'short_description': template["short_description"].format(**self._get_format_variables(opportunity, execution, error_message)),
-                'description': description,
-                'priority': template["priority"],
-                'urgency': template["urgency"],
-                'impact': template["impact"],
-                'category': template["category"],
-                'subcategory': template["subcategory"]
-            }
+        except Exception as e:
+            return TicketResult(ticket_id=None, status="failed", error=str(e))
+    
+    async def create_servicenow_request_tickets_batch(self, opportunities: List[OptimizationOpportunity]
+                                                      ) -> List[TicketResult]:
+        """Create ServiceNow request tickets through the Batch REST API.
+        
+        Up to SERVICENOW_BATCH_MAX_REQUESTS records are created per round trip;
+        results are returned in the order of `opportunities`.
+        """
+        if not self.servicenow_session:
+            return []
+        
+        started = time.perf_counter()
+        tickets = [
+            (opportunity, self._build_format_vars(TicketType.OPTIMIZATION_REQUEST, opportunity))
+            for opportunity in opportunities
+        ]
+        chunks = await asyncio.gather(*(
+            self._create_servicenow_batch(tickets[start:start + SERVICENOW_BATCH_MAX_REQUESTS])
+            for start in range(0, len(tickets), SERVICENOW_BATCH_MAX_REQUESTS)
+        ))
+        results = list(chain.from_iterable(chunks))
+        self._record_ticket_results(
+            TicketType.OPTIMIZATION_REQUEST, (("servicenow", result) for result in results),
+            time.perf_counter() - started, events=len(results)
+        )
+        
+        log_event("servicenow_request_tickets_batch_created", {
+            "tickets": len(results),
+            "failed": sum(result.status == "failed" for result in results)
+        })
+        
+        return results
+    
+    async def _create_servicenow_batch(self, tickets: List[Tuple[OptimizationOpportunity, Dict[str, Any]]]
+                                       ) -> List[TicketResult]:
+        """Create up to SERVICENOW_BATCH_MAX_REQUESTS request tickets in one Batch API call."""
+        results: List[Optional[TicketResult]] = [None] * len(tickets)
+        try:
+            prepared = [
+                self._build_servicenow_payload(TicketType.OPTIMIZATION_REQUEST, opportunity, format_vars)
+                for opportunity, format_vars in tickets
+            ]
+            rest_requests = [{
+                "id": str(index),
+                "method": "POST",
+                "url": f"/api/now/table/{template.table}",
+                "headers": SERVICENOW_BATCH_HEADERS,
+                "body": base64.b64encode(orjson.dumps(payload)).decode()
+            } for index, (template, payload) in enumerate(prepared)]
+            
+            status, batch = await self._post_ticket(
+                "servicenow", self.servicenow_session, f"{settings.SERVICENOW_URL}/api/now/v1/batch",
+                {"batch_request_id": uuid.uuid4().hex, "rest_requests": rest_requests}
+            )
+            if status != 200:
+                return [TicketResult(ticket_id=None, status="failed", error=f"HTTP {status}: {batch}")
+                        for _ in prepared]
             
-            # Add state and resolution fields for closed tickets
-            if ticket_data.ticket_type in [TicketType.OPTIMIZATION_EXECUTION, TicketType.OPTIMIZATION_FAILURE]:
-                payload.update({
-                    'state': template.get("state", "New"),
-                    'close_code': template.get("close_code", ""),
-                    'close_notes': template.get("close_notes", "")
-                })
-            
-            # Create ticket
-            response = requests.post(
-                f"{self.servicenow_client['url']}/api/now/table/{template['table']}",
-                auth=self.servicenow_client['auth'],
-                headers={'Content-Type': 'application/json'},
-                json=payload
+            serviced = {item["id"]: item for item in batch.get("serviced_requests", [])}
+            unserviced = []
+            for index, (template, _) in enumerate(prepared):
+                item = serviced.get(str(index))
+                if item is None:
+                    unserviced.append(index)
+                    continue
+                
+                body = base64.b64decode(item.get("body") or "")
+                if item["status_code"] != 201:
+                    results[index] = TicketResult(
+                        ticket_id=None, status="failed",
+                        error=f"HTTP {item['status_code']}: {body.decode(errors='replace')}"
+                    )
+                else:
+                    results[index] = self._servicenow_result(template, orjson.loads(body))
+            
+            # Requests the instance did not get to (e.g. batch time limit) are sent one by one
+            retried = await asyncio.gather(
+                *(self._post_servicenow_payload(*prepared[index]) for index in unserviced),
+                return_exceptions=True
             )
+            for index, result in zip(unserviced, retried):
+                if isinstance(result, Exception):
+                    result = TicketResult(ticket_id=None, status="failed", error=str(result))
+                results[index] = result
             
-            if response.status_code == 201:
-                ticket_data = response.json()
-                return {
-                    "ticket_id": ticket_data['result']['sys_id'],
-                    "ticket_url": f"{self.servicenow_client['url']}/nav_to.do?uri={template['table']}.do?sys_id={ticket_data['result']['sys_id']}",
-                    "status": "created"
-                }
-            else:
-                return {
-                    "ticket_id": None,
-                    "error": f"HTTP {response.status_code}: {response.text}",
-                    "status": "failed"
-                }
+            return results
             
         except Exception as e:
-            return {
-                "ticket_id": None,
-                "error": str(e),
-                "status": "failed"
-            }
+            # Keep the records already created so they are not reported as failed and created again
+            return [
+                result if result is not None else TicketResult(ticket_id=None, status="failed", error=str(e))
+                for result in results
+            ]
+    
+    def _build_servicenow_payload(self, ticket_type: TicketType, opportunity: OptimizationOpportunity,
+                                  format_vars: Dict[str, Any]) -> Tuple[ServiceNowTemplate, Dict[str, Any]]:
+        """Render the ServiceNow template and record payload for a ticket."""
+        template = self.ticket_templates[ticket_type].servicenow
+        
+        payload = {
+            'short_description': template.render_short_description(format_vars),
+            'description': self._render_description(ticket_type, template, opportunity, format_vars),
+            'priority': template.priority,
+            'urgency': template.urgency,
+            'impact': template.impact,
+            'category': template.category,
+            'subcategory': template.subcategory
+        }
+        
+        # Add state and resolution fields for closed tickets
+        if ticket_type in [TicketType.OPTIMIZATION_EXECUTION, TicketType.OPTIMIZATION_FAILURE]:
+            payload.update({
+                'state': template.state,
+                'close_code': template.close_code,
+                'close_notes': template.close_notes
+            })
+        
+        return template, payload
+    
+    async def _post_servicenow_payload(self, template: ServiceNowTemplate, payload: Dict[str, Any]) -> TicketResult:
+        """Create one ServiceNow record from a prepared payload."""
+        status, record = await self._post_ticket(
+            "servicenow", self.servicenow_session,
+            f"{settings.SERVICENOW_URL}/api/now/table/{template.table}", payload
+        )
+        if status != 201:
+            return TicketResult(ticket_id=None, status="failed", error=f"HTTP {status}: {record}")
+        
+        return self._servicenow_result(template, record)
+    
+    def _servicenow_result(self, template: ServiceNowTemplate, record: Dict[str, Any]) -> TicketResult:
+        """Build the result for a created ServiceNow record."""
+        sys_id = record['result']['sys_id']
+        return TicketResult(
+            ticket_id=sys_id,
+            ticket_url=f"{settings.SERVICENOW_URL}/nav_to.do?uri={template.table}.do?sys_id={sys_id}"
+        )
+    
+    async def _post_ticket(self, system: str, session: aiohttp.ClientSession,
+                           url: str, payload: Dict[str, Any]) -> Tuple[int, Any]:
+        """POST a ticket with bounded concurrency, rate limiting and 429 backoff.
+        
+        Returns the response status with the parsed JSON body on 200/201, or the raw text otherwise.
+        """
+        semaphore, rate_limiter = self.ticket_limits[system]
+        async with semaphore:
+            for attempt in range(settings.TICKET_MAX_RETRIES + 1):
+                await rate_limiter.acquire()
+                async with session.post(url, json=payload) as response:
+                    if response.status != 429 or attempt == settings.TICKET_MAX_RETRIES:
+                        if response.status in (200, 201):
+                            return response.status, await response.json(loads=orjson.loads)
+                        return response.status, await response.text()
+                    
+                    retry_after = response.headers.get('Retry-After', '')
+                    delay = float(retry_after) if retry_after.isdigit() else TICKET_RETRY_BASE_SECONDS * 2 ** attempt
+                
+                log_event("ticket_rate_limited", {"system": system, "attempt": attempt + 1, "retry_in": delay})
+                await asyncio.sleep(min(delay, TICKET_RETRY_MAX_SECONDS))
     
     def _get_format_variables(self, opportunity: OptimizationOpportunity, 
                             execution: Optional[OptimizationExecution] = None,
                             error_message: Optional[str] = None) -> Dict[str, Any]:
         """Get variables for string formatting."""
+        potential_savings = opportunity.potential_savings
+        savings_amount = (execution.actual_savings if execution else None) or potential_savings
         variables = {
             "service_name": opportunity.service_name,
             "resource_id": opportunity.resource_id,
@@ -676,95 +989,99 @@ class DocumentationService:
             "cloud_provider": opportunity.cloud_provider.value,
             "region": opportunity.region,
             "current_cost": opportunity.current_cost,
-            "potential_savings": opportunity.potential_savings,
-            "savings_amount": execution.actual_savings if execution and execution.actual_savings else opportunity.potential_savings
+            "potential_savings": potential_savings,
+            "savings_amount": savings_amount
         }
         
         if execution:
-            variables.update({
-                "execution_id": execution.id,
-                "actual_savings": execution.actual_savings or opportunity.potential_savings
-            })
+            variables["execution_id"] = execution.id
+            variables["actual_savings"] = savings_amount
         
         if error_message:
             variables["error_message"] = error_message
         
         return variables
     
-    def _format_optimization_request_description(self, opportunity: OptimizationOpportunity) -> str:
-        """Format optimization request description."""
-        return f"""
-        Cost Optimization Opportunity
+    def _build_format_vars(self, ticket_type: TicketType, opportunity: OptimizationOpportunity,
+                           execution: Optional[OptimizationExecution] = None,
+                           error_message: Optional[str] = None) -> Dict[str, Any]:
+        """Build the variables the summary, labels and description of a ticket need.
         
-        Service: {opportunity.service_name}
-        Resource ID: {opportunity.resource_id}
-        Optimization Type: {opportunity.optimization_type.value}
-        Cloud Provider: {opportunity.cloud_provider.value}
-        Region: {opportunity.region}
-        
-        Current Cost: ${opportunity.current_cost:,.2f}
-        Potential Savings: ${opportunity.potential_savings:,.2f}
-        Confidence Score: {opportunity.confidence_score:.1%}
-        Risk Level: {opportunity.risk_level.value}
-        
-        Description: {opportunity.description}
+        Bullet lists are backend specific and are added by `_render_description`.
         """
-    
-    def _format_optimization_execution_description(self, execution: OptimizationExecution, 
-                                                 opportunity: OptimizationOpportunity) -> str:
-        """Format optimization execution description."""
-        return f"""
-        Cost Optimization Execution Completed
+        variables = self._get_format_variables(opportunity, execution, error_message)
         
-        Service: {opportunity.service_name}
-        Resource ID: {opportunity.resource_id}
-        Optimization Type: {opportunity.optimization_type.value}
-        Execution ID: {execution.id}
-        
-        Actual Savings: ${execution.actual_savings or opportunity.potential_savings:,.2f}
-        Execution Time: {execution.completed_at - execution.started_at if execution.completed_at and execution.started_at else 'Unknown'}
-        Status: Completed Successfully
+        if ticket_type == TicketType.OPTIMIZATION_REQUEST:
+            variables.update({
+                "confidence_score": opportunity.confidence_score,
+                "risk_level": opportunity.risk_level.value,
+                "description": opportunity.description,
+                "estimated_execution_time": opportunity.estimated_execution_time,
+                "expires_at": opportunity.expires_at.strftime('%Y-%m-%d %H:%M UTC') if opportunity.expires_at else "No expiration"
+            })
+        elif ticket_type == TicketType.OPTIMIZATION_EXECUTION and execution:
+            actual_savings = variables["actual_savings"]
+            variables.update({
+                "execution_time": str(execution.completed_at - execution.started_at) if execution.completed_at and execution.started_at else "Unknown",
+                "execution_details": orjson.dumps(execution.execution_log or [], option=orjson.OPT_INDENT_2).decode(),
+                "approved_by": execution.executed_by,
+                "executed_at": execution.started_at.isoformat() if execution.started_at else "Unknown",
+                "completed_at": execution.completed_at.isoformat() if execution.completed_at else "Unknown",
+                "annual_savings": actual_savings * 12,
+                "roi": actual_savings / opportunity.current_cost if opportunity.current_cost > 0 else 0
+            })
+        elif ticket_type == TicketType.OPTIMIZATION_FAILURE and execution and error_message:
+            failed_at = (execution.completed_at or datetime.now(timezone.utc)).isoformat()
+            variables.update({
+                "failed_step": "Execution Phase",
+                "failure_time": failed_at,
+                "root_cause_analysis": "Analysis pending - will be updated after investigation",
+                "prevention_measures": "Review and update optimization parameters",
+                "approved_by": execution.executed_by,
+                "failed_at": failed_at
+            })
         
-        Approved By: {execution.executed_by}
-        Executed At: {execution.started_at.isoformat() if execution.started_at else 'Unknown'}
-        Completed At: {execution.completed_at.isoformat() if execution.completed_at else 'Unknown'}
-        """
+        return variables
     
-    def _format_optimization_failure_description(self, execution: OptimizationExecution,
-                                               opportunity: OptimizationOpportunity,
-                                               error_message: str) -> str:
-        """Format optimization failure description."""
-        return f"""
-        Cost Optimization Execution Failed
-        
-        Service: {opportunity.service_name}
-        Resource ID: {opportunity.resource_id}
-        Optimization Type: {opportunity.optimization_type.value}
-        Execution ID: {execution.id}
-        
-        Error Message: {error_message}
-        Failed Step: Execution Phase
-        Failure Time: {execution.completed_at.isoformat() if execution.completed_at else datetime.now().isoformat()}
-        
-        Rollback Status: ✅ Automatic rollback completed successfully
-        Service Impact: None (rollback successful)
-        Data Impact: None
-        Financial Impact: None
-        User Impact: None
-        
-        Approved By: {execution.executed_by}
-        Failed At: {execution.completed_at.isoformat() if execution.completed_at else datetime.now().isoformat()}
-        """
+    def _render_description(self, ticket_type: TicketType, template: Union[JiraTemplate, ServiceNowTemplate],
+                            opportunity: OptimizationOpportunity, format_vars: Dict[str, Any]) -> str:
+        """Render a ticket description in the template's bullet style."""
+        if ticket_type == TicketType.OPTIMIZATION_REQUEST:
+            format_vars = {**format_vars, **self._get_bullet_variables(opportunity, template.bullet)}
+        return template.render_description(format_vars)
+    
+    def _get_bullet_variables(self, opportunity: OptimizationOpportunity, bullet: str) -> Dict[str, str]:
+        """Render the opportunity's step lists as bullet lists."""
+        return {
+            "implementation_steps": "\n".join(f"{bullet} {step}" for step in opportunity.implementation_steps),
+            "rollback_steps": "\n".join(f"{bullet} {step}" for step in opportunity.rollback_steps),
+            "prerequisites": "\n".join(f"{bullet} {prereq}" for prereq in opportunity.prerequisites)
+        }
+    
+    async def close(self):
+        """Release HTTP resources held by the service."""
+        if self.jira_session:
+            await self.jira_session.close()
+            self.jira_session = None
+        if self.servicenow_session:
+            await self.servicenow_session.close()
+            self.servicenow_session = None
     
     async def get_documentation_statistics(self) -> Dict[str, Any]:
         """Get documentation service statistics."""
+        stats = self.ticket_stats
+        created = stats["jira_tickets"] + stats["servicenow_tickets"]
+        attempted = stats["jira_attempted"] + stats["servicenow_attempted"]
+        events = (stats[TicketType.OPTIMIZATION_REQUEST.value] + stats[TicketType.OPTIMIZATION_EXECUTION.value]
+                  + stats[TicketType.OPTIMIZATION_FAILURE.value])
+        
         return {
-            "total_tickets_created": 342,
-            "jira_tickets": 198,
-            "servicenow_tickets": 144,
-            "optimization_requests": 156,
-            "execution_records": 123,
-            "failure_incidents": 63,
-            "success_rate": 0.94,
-            "average_creation_time_seconds": 3.2
+            "total_tickets_created": created,
+            "jira_tickets": stats["jira_tickets"],
+            "servicenow_tickets": stats["servicenow_tickets"],
+            "optimization_requests": stats[TicketType.OPTIMIZATION_REQUEST.value],
+            "execution_records": stats[TicketType.OPTIMIZATION_EXECUTION.value],
+            "failure_incidents": stats[TicketType.OPTIMIZATION_FAILURE.value],
+            "success_rate": created / attempted if attempted else 0.0,
+            "average_creation_time_seconds": self.ticket_creation_seconds / events if events else 0.0
         }
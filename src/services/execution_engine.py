@@ -6,20 +6,35 @@ with comprehensive rollback capabilities and safety mechanisms.
 """
 
 import asyncio
-import json
 import logging
+import random
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple, Callable
+from typing import Dict, List, Mapping, Optional, Any, Set, Tuple, Callable
 from dataclasses import dataclass, field
+from collections import ChainMap
 from enum import Enum
+from types import MappingProxyType
 import uuid
 import traceback
 
+import orjson
+
 from src.core.config import settings
-from src.core.database import get_db
-from src.models.optimization import OptimizationOpportunity, OptimizationExecution, OptimizationStatus
-from src.services.cloud_providers import CloudProviderService
-from src.core.monitoring import track_metric, log_event
+from src.models.optimization import OptimizationOpportunity, OptimizationExecution, OptimizationStatus, OptimizationType
+from src.services.cloud_providers import get_cloud_provider_service
+from src.core.monitoring import track_metric, log_event, log_event_enabled, LogLevel
+
+
+# Exponential backoff bounds for retrying transient step failures
+STEP_RETRY_BASE_SECONDS = 0.5
+STEP_RETRY_MAX_SECONDS = 60.0
+
+# Provider error codes that indicate throttling or a transient service fault
+RETRYABLE_ERROR_CODES = frozenset((
+    "Throttling", "ThrottlingException", "RequestLimitExceeded", "TooManyRequestsException",
+    "InternalError", "InternalFailure", "ServiceUnavailable", "RequestTimeout"
+))
 
 
 class ExecutionStatus(Enum):
@@ -43,7 +58,35 @@ class ExecutionPhase(Enum):
     ROLLBACK = "rollback"
 
 
-@dataclass
+# Phases whose steps must all complete before a step of the given phase starts
+PHASE_DEPENDENCIES = {
+    ExecutionPhase.PREPARATION: (),
+    ExecutionPhase.VALIDATION: (ExecutionPhase.PREPARATION,),
+    ExecutionPhase.BACKUP: (ExecutionPhase.PREPARATION,),
+    ExecutionPhase.EXECUTION: (ExecutionPhase.VALIDATION, ExecutionPhase.BACKUP),
+    ExecutionPhase.VERIFICATION: (ExecutionPhase.EXECUTION,),
+    ExecutionPhase.COMPLETION: (ExecutionPhase.VERIFICATION,),
+    ExecutionPhase.ROLLBACK: ()
+}
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether a step failure is transient (timeout, connection, throttling or 5xx)."""
+    if isinstance(error, (asyncio.TimeoutError, ConnectionError)):
+        return True
+    
+    # botocore ClientError carries the parsed error response
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        status = response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+        return response.get("Error", {}).get("Code") in RETRYABLE_ERROR_CODES or status == 429 or status >= 500
+    
+    # Azure HttpResponseError / aiohttp ClientResponseError
+    status = getattr(error, "status_code", None) or getattr(error, "status", None)
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+
+@dataclass(slots=True)
 class ExecutionStep:
     """Represents a single step in the execution process."""
     id: str
@@ -57,12 +100,87 @@ class ExecutionStep:
     status: ExecutionStatus = ExecutionStatus.PENDING
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
+    duration_seconds: Optional[float] = None  # measured on the monotonic clock
     error_message: Optional[str] = None
     rollback_steps: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    depends_on: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True, frozen=True)
+class StepTemplate:
+    """Static definition of an execution step, instantiated once per execution."""
+    slug: str
+    name: str
+    description: str
+    phase: ExecutionPhase
+    order: int
+    timeout_minutes: int
+    rollback_steps: Tuple[str, ...] = ()
+    
+    def build(self, execution_id: str, description: Optional[str] = None,
+              timeout_minutes: Optional[int] = None) -> ExecutionStep:
+        """Create a fresh step for an execution, optionally overriding per-run fields."""
+        return ExecutionStep(
+            id=f"{execution_id}_{self.slug}",
+            name=self.name,
+            description=self.description if description is None else description,
+            phase=self.phase,
+            order=self.order,
+            timeout_minutes=self.timeout_minutes if timeout_minutes is None else timeout_minutes,
+            rollback_steps=list(self.rollback_steps)
+        )
+
+
+# Steps shared by every optimization; the execution step's description and timeout are per run
+BASE_STEP_TEMPLATES = (
+    StepTemplate("preparation", "Preparation", "Prepare execution environment",
+                 ExecutionPhase.PREPARATION, 1, 5),
+    StepTemplate("validation", "Validation", "Validate current state and prerequisites",
+                 ExecutionPhase.VALIDATION, 2, 10),
+    StepTemplate("backup", "Backup", "Create backup of current configuration",
+                 ExecutionPhase.BACKUP, 3, 15),
+    StepTemplate("execution", "Execution", "Execute optimization",
+                 ExecutionPhase.EXECUTION, 4, 0),
+    StepTemplate("verification", "Verification", "Verify optimization was successful",
+                 ExecutionPhase.VERIFICATION, 5, 10),
+    StepTemplate("completion", "Completion", "Complete execution and cleanup",
+                 ExecutionPhase.COMPLETION, 6, 5),
+)
+
+RIGHTSIZING_STEP = StepTemplate(
+    "rightsizing", "Instance Rightsizing", "Change instance type",
+    ExecutionPhase.EXECUTION, 4, 20,
+    ("Stop instance", "Change instance type back to original", "Start instance")
+)
+SCHEDULING_STEP = StepTemplate(
+    "scheduling", "Resource Scheduling", "Configure automatic start/stop schedule",
+    ExecutionPhase.EXECUTION, 4, 15,
+    ("Remove scheduled actions", "Start resource manually")
+)
+REMOVAL_STEP = StepTemplate(
+    "removal", "Unused Resource Removal", "Remove unused resource",
+    ExecutionPhase.EXECUTION, 4, 10,
+    ("Restore from backup", "Recreate resource configuration")
+)
+STORAGE_STEP = StepTemplate(
+    "storage", "Storage Optimization", "Migrate to optimal storage class",
+    ExecutionPhase.EXECUTION, 4, 30,
+    ("Migrate back to original storage class", "Remove lifecycle policies")
+)
+RESERVED_INSTANCE_STEP = StepTemplate(
+    "reserved", "Reserved Instance Purchase", "Purchase reserved instances",
+    ExecutionPhase.EXECUTION, 4, 5,
+    ("Cancel reserved instance purchase",)
+)
+SPOT_INSTANCE_STEP = StepTemplate(
+    "spot", "Spot Instance Migration", "Migrate to spot instances",
+    ExecutionPhase.EXECUTION, 4, 25,
+    ("Stop spot instance", "Start on-demand instance", "Update load balancer configuration")
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionContext:
     """Context for optimization execution."""
     opportunity_id: str
@@ -70,51 +188,96 @@ class ExecutionContext:
     resource_id: str
     cloud_provider: str
     region: str
-    optimization_type: str
+    optimization_type: OptimizationType
     current_config: Dict[str, Any]
-    target_config: Dict[str, Any]
+    target_config: Dict[str, Any]  # only the keys the optimization changes
     backup_data: Dict[str, Any] = field(default_factory=dict)
     execution_log: List[Dict[str, Any]] = field(default_factory=list)
     rollback_data: Dict[str, Any] = field(default_factory=dict)
+    changes_started: bool = False  # set once an EXECUTION-phase step starts
+    handler: Optional[Callable] = field(default=None, repr=False)
+    
+    @property
+    def effective_target_config(self) -> ChainMap:
+        """Read-only view of the full target configuration (target overrides over current config)."""
+        return ChainMap(self.target_config, self.current_config)
+    
+    @property
+    def is_noop(self) -> bool:
+        """True when the computed changes all match the current configuration."""
+        # An empty delta is not a no-op: removals and purchases carry no target config
+        return bool(self.target_config) and all(
+            key in self.current_config and self.current_config[key] == value
+            for key, value in self.target_config.items()
+        )
+    
+    def status_view(self) -> Dict[str, Any]:
+        """Small projection for status polling that leaves out configs, backups and the log."""
+        return {
+            "opportunity_id": self.opportunity_id,
+            "execution_id": self.execution_id,
+            "resource_id": self.resource_id,
+            "cloud_provider": self.cloud_provider,
+            "region": self.region,
+            "optimization_type": self.optimization_type.value,
+            "completed_steps": len(self.execution_log),
+            "has_backup": bool(self.backup_data)
+        }
 
 
 class ExecutionEngine:
     """Engine for executing cost optimizations with rollback capabilities."""
     
     def __init__(self):
-        self.cloud_provider_service = CloudProviderService()
+        self.cloud_provider_service = get_cloud_provider_service()
         self.active_executions = {}
-        self.execution_handlers = {}
+        self.execution_handlers = MappingProxyType({
+            OptimizationType.RIGHTSIZING: self._execute_rightsizing,
+            OptimizationType.SCHEDULING: self._execute_scheduling,
+            OptimizationType.UNUSED_RESOURCES: self._execute_unused_resource_removal,
+            OptimizationType.STORAGE_OPTIMIZATION: self._execute_storage_optimization,
+            OptimizationType.RESERVED_INSTANCES: self._execute_reserved_instance_purchase,
+            OptimizationType.SPOT_INSTANCES: self._execute_spot_instance_migration
+        })
+        self.pending_tag_tasks: Set[asyncio.Task] = set()
+        self.phase_handlers = {
+            ExecutionPhase.PREPARATION: self._execute_preparation_step,
+            ExecutionPhase.VALIDATION: self._execute_validation_step,
+            ExecutionPhase.BACKUP: self._execute_backup_step,
+            ExecutionPhase.EXECUTION: self._execute_optimization_step,
+            ExecutionPhase.VERIFICATION: self._execute_verification_step,
+            ExecutionPhase.COMPLETION: self._execute_completion_step
+        }
         
     async def initialize(self):
         """Initialize the execution engine."""
         try:
             await self.cloud_provider_service.initialize()
-            await self._register_execution_handlers()
             log_event("execution_engine_initialized", {"status": "success"})
         except Exception as e:
             log_event("execution_engine_initialization_failed", {"error": str(e)})
             raise
     
-    async def _register_execution_handlers(self):
-        """Register handlers for different optimization types."""
-        self.execution_handlers = {
-            "rightsizing": self._execute_rightsizing,
-            "scheduling": self._execute_scheduling,
-            "unused_resources": self._execute_unused_resource_removal,
-            "storage_optimization": self._execute_storage_optimization,
-            "reserved_instances": self._execute_reserved_instance_purchase,
-            "spot_instances": self._execute_spot_instance_migration
-        }
+    async def close(self):
+        """Wait for background tag updates to finish."""
+        if self.pending_tag_tasks:
+            await asyncio.gather(*self.pending_tag_tasks, return_exceptions=True)
+    
+    def _tag_update_done(self, task: asyncio.Task):
+        """Drop a finished tag update and report it if it failed."""
+        self.pending_tag_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            log_event("resource_tag_update_failed", {"error": str(task.exception())}, LogLevel.WARNING)
     
     async def execute_optimization(self, opportunity: OptimizationOpportunity, 
                                  approver_id: str) -> OptimizationExecution:
         """Execute an approved optimization."""
         try:
-            log_event("optimization_execution_started", {
-                "opportunity_id": opportunity.id,
-                "optimization_type": opportunity.optimization_type.value
-            })
+            if log_event_enabled():
+                log_event("optimization_execution_started", {
+                    "opportunity_id": opportunity.id,
+                    "optimization_type": opportunity.optimization_type.value
+                })
             
             # Create execution record
             execution = OptimizationExecution(
@@ -125,38 +288,50 @@ class ExecutionEngine:
                 executed_by=approver_id
             )
             
-            # Create execution context
-            context = await self._create_execution_context(opportunity, execution)
-            
-            # Store active execution
-            self.active_executions[execution.id] = {
-                "execution": execution,
-                "context": context,
-                "status": ExecutionStatus.RUNNING
-            }
-            
-            # Execute the optimization
+            # Reserve a slot before any await so concurrent calls cannot overshoot the cap
+            self._register_active_execution(execution)
             try:
-                await self._run_execution_pipeline(context, opportunity)
-                execution.status = OptimizationStatus.COMPLETED
-                execution.completed_at = datetime.utcnow()
+                # Create execution context
+                context = await self._create_execution_context(opportunity, execution)
                 
-                log_event("optimization_execution_completed", {
-                    "execution_id": execution.id,
-                    "opportunity_id": opportunity.id
-                })
+                # Nothing to change: the resource already has the target configuration
+                if context.is_noop:
+                    execution.status = OptimizationStatus.COMPLETED
+                    execution.completed_at = datetime.utcnow()
+                    log_event("optimization_noop", {
+                        "execution_id": execution.id,
+                        "opportunity_id": opportunity.id,
+                        "resource_id": context.resource_id
+                    })
+                    return execution
                 
-            except Exception as e:
-                # Execution failed, attempt rollback
-                await self._handle_execution_failure(execution, context, str(e))
-                raise
+                # Attach the context to the reserved entry
+                self.active_executions[execution.id].update(
+                    context=context, status=ExecutionStatus.RUNNING
+                )
+                
+                # Execute the optimization
+                try:
+                    await self._run_execution_pipeline(context, opportunity)
+                    execution.status = OptimizationStatus.COMPLETED
+                    execution.completed_at = datetime.utcnow()
+                    
+                    if log_event_enabled():
+                        log_event("optimization_execution_completed", {
+                            "execution_id": execution.id,
+                            "opportunity_id": opportunity.id
+                        })
+                    
+                except Exception as e:
+                    # Execution failed, attempt rollback
+                    await self._handle_execution_failure(execution, context, str(e))
+                    raise
+                
+                return execution
             
             finally:
-                # Clean up active execution
-                if execution.id in self.active_executions:
-                    del self.active_executions[execution.id]
-            
-            return execution
+                # Release the slot on every exit path
+                self.active_executions.pop(execution.id, None)
             
         except Exception as e:
             log_event("optimization_execution_failed", {
@@ -166,9 +341,40 @@ class ExecutionEngine:
             })
             raise
     
+    def _register_active_execution(self, execution: OptimizationExecution):
+        """Drop leaked executions, enforce the active execution cap and reserve a slot."""
+        # Anything older than twice the pipeline timeout can no longer be running
+        cutoff = datetime.utcnow() - timedelta(minutes=2 * settings.EXECUTION_PIPELINE_TIMEOUT_MINUTES)
+        stale = [
+            execution_id for execution_id, execution_data in self.active_executions.items()
+            if execution_data["execution"].started_at < cutoff
+        ]
+        for execution_id in stale:
+            del self.active_executions[execution_id]
+        if stale:
+            log_event("stale_executions_evicted", {"execution_ids": stale}, LogLevel.WARNING)
+        
+        if len(self.active_executions) >= settings.MAX_ACTIVE_EXECUTIONS:
+            raise RuntimeError(
+                f"Active execution limit reached ({settings.MAX_ACTIVE_EXECUTIONS}); "
+                f"cannot start execution {execution.id}"
+            )
+        
+        # Placeholder until the context is created; must stay free of awaits to keep check and insert atomic
+        self.active_executions[execution.id] = {
+            "execution": execution,
+            "context": None,
+            "status": ExecutionStatus.PENDING
+        }
+    
     async def _create_execution_context(self, opportunity: OptimizationOpportunity, 
                                       execution: OptimizationExecution) -> ExecutionContext:
         """Create execution context for an optimization."""
+        # Resolve the handler first so unsupported types fail before any cloud calls
+        handler = self.execution_handlers.get(opportunity.optimization_type)
+        if handler is None:
+            raise ValueError(f"No handler found for optimization type: {opportunity.optimization_type.value}")
+        
         # Get current resource configuration
         current_config = await self.cloud_provider_service.get_resource_config(
             opportunity.resource_id, opportunity.cloud_provider.value
@@ -183,29 +389,31 @@ class ExecutionEngine:
             resource_id=opportunity.resource_id,
             cloud_provider=opportunity.cloud_provider.value,
             region=opportunity.region,
-            optimization_type=opportunity.optimization_type.value,
+            optimization_type=opportunity.optimization_type,
             current_config=current_config,
-            target_config=target_config
+            target_config=target_config,
+            handler=handler
         )
     
     async def _calculate_target_config(self, opportunity: OptimizationOpportunity, 
                                      current_config: Dict[str, Any]) -> Dict[str, Any]:
-        """Calculate target configuration for optimization."""
-        target_config = current_config.copy()
+        """Calculate the configuration changes for an optimization, as a delta over current_config."""
+        target_config = {}
         
-        if opportunity.optimization_type.value == "rightsizing":
+        optimization_type = opportunity.optimization_type
+        if optimization_type is OptimizationType.RIGHTSIZING:
             # Calculate optimal instance size based on utilization
             target_config["instance_type"] = await self._calculate_optimal_instance_size(
                 current_config, opportunity
             )
-        elif opportunity.optimization_type.value == "scheduling":
+        elif optimization_type is OptimizationType.SCHEDULING:
             # Add scheduling configuration
             target_config["scheduling"] = {
                 "start_schedule": "0 8 * * 1-5",  # 8 AM weekdays
                 "stop_schedule": "0 18 * * 1-5",  # 6 PM weekdays
                 "timezone": "UTC"
             }
-        elif opportunity.optimization_type.value == "storage_optimization":
+        elif optimization_type is OptimizationType.STORAGE_OPTIMIZATION:
             # Calculate optimal storage class
             target_config["storage_class"] = await self._calculate_optimal_storage_class(
                 current_config, opportunity
@@ -215,161 +423,153 @@ class ExecutionEngine:
     
     async def _run_execution_pipeline(self, context: ExecutionContext, 
                                     opportunity: OptimizationOpportunity):
-        """Run the complete execution pipeline."""
+        """Run the complete execution pipeline.
+        
+        Steps run in waves: every step whose dependencies have completed is started
+        concurrently, so independent phases (validation and backup) overlap.
+        """
         execution_steps = await self._create_execution_steps(context, opportunity)
         
-        for step in execution_steps:
-            try:
-                await self._execute_step(step, context)
+        try:
+            await asyncio.wait_for(
+                self._run_execution_steps(execution_steps, context),
+                timeout=settings.EXECUTION_PIPELINE_TIMEOUT_MINUTES * 60
+            )
+        except asyncio.TimeoutError:
+            raise Exception(
+                f"Execution pipeline exceeded {settings.EXECUTION_PIPELINE_TIMEOUT_MINUTES} minutes"
+            ) from None
+    
+    async def _run_execution_steps(self, execution_steps: List[ExecutionStep], context: ExecutionContext):
+        """Run steps in dependency waves until all complete or one fails."""
+        pending = {step.id: step for step in execution_steps}
+        completed = set()
+        while pending:
+            ready = [step for step in pending.values() if completed.issuperset(step.depends_on)]
+            if not ready:
+                raise Exception(f"Unsatisfiable step dependencies: {sorted(pending)}")
+            
+            outcomes = await asyncio.gather(
+                *(self._execute_step(step, context) for step in ready), return_exceptions=True
+            )
+            
+            for step, outcome in zip(ready, outcomes):
+                del pending[step.id]
                 context.execution_log.append({
                     "step_id": step.id,
                     "step_name": step.name,
                     "status": step.status.value,
-                    "completed_at": step.completed_at.isoformat() if step.completed_at else None,
-                    "duration_seconds": (step.completed_at - step.started_at).total_seconds() 
-                                      if step.completed_at and step.started_at else None
+                    "completed_at": step.completed_at,
+                    "duration_seconds": step.duration_seconds
                 })
-                
-                # Check if execution should be aborted
-                if step.status == ExecutionStatus.FAILED and step.retry_count >= step.max_retries:
-                    raise Exception(f"Step {step.name} failed after {step.max_retries} retries: {step.error_message}")
-                
-            except Exception as e:
+            
+            failures = [(step, outcome) for step, outcome in zip(ready, outcomes) if isinstance(outcome, Exception)]
+            for step, error in failures:
                 log_event("execution_step_failed", {
                     "step_id": step.id,
                     "step_name": step.name,
-                    "error": str(e)
+                    "error": str(error)
                 })
-                
-                # Attempt rollback
-                await self._rollback_execution(context, step)
-                raise
+            if failures:
+                # Rollback is performed by the caller's failure handling
+                step, error = failures[0]
+                raise Exception(f"Step {step.name} failed after {step.retry_count} attempts: {error}") from error
+            
+            completed.update(step.id for step in ready)
     
     async def _create_execution_steps(self, context: ExecutionContext, 
                                     opportunity: OptimizationOpportunity) -> List[ExecutionStep]:
         """Create execution steps for the optimization."""
-        base_steps = [
-            ExecutionStep(
-                id=f"{context.execution_id}_preparation",
-                name="Preparation",
-                description="Prepare execution environment",
-                phase=ExecutionPhase.PREPARATION,
-                order=1,
-                timeout_minutes=5
-            ),
-            ExecutionStep(
-                id=f"{context.execution_id}_validation",
-                name="Validation",
-                description="Validate current state and prerequisites",
-                phase=ExecutionPhase.VALIDATION,
-                order=2,
-                timeout_minutes=10
-            ),
-            ExecutionStep(
-                id=f"{context.execution_id}_backup",
-                name="Backup",
-                description="Create backup of current configuration",
-                phase=ExecutionPhase.BACKUP,
-                order=3,
-                timeout_minutes=15
-            ),
-            ExecutionStep(
-                id=f"{context.execution_id}_execution",
-                name="Execution",
-                description=f"Execute {context.optimization_type} optimization",
-                phase=ExecutionPhase.EXECUTION,
-                order=4,
-                timeout_minutes=opportunity.estimated_execution_time
-            ),
-            ExecutionStep(
-                id=f"{context.execution_id}_verification",
-                name="Verification",
-                description="Verify optimization was successful",
-                phase=ExecutionPhase.VERIFICATION,
-                order=5,
-                timeout_minutes=10
-            ),
-            ExecutionStep(
-                id=f"{context.execution_id}_completion",
-                name="Completion",
-                description="Complete execution and cleanup",
-                phase=ExecutionPhase.COMPLETION,
-                order=6,
-                timeout_minutes=5
-            )
-        ]
-        
-        # Add optimization-specific steps
         optimization_steps = await self._get_optimization_specific_steps(context, opportunity)
-        all_steps = base_steps + optimization_steps
         
-        return sorted(all_steps, key=lambda x: x.order)
+        # Templates are already in order; optimization-specific steps follow the base execution step
+        all_steps = []
+        for template in BASE_STEP_TEMPLATES:
+            if template.phase is ExecutionPhase.EXECUTION:
+                all_steps.append(template.build(
+                    context.execution_id,
+                    description=f"Execute {context.optimization_type.value} optimization",
+                    timeout_minutes=opportunity.estimated_execution_time
+                ))
+                all_steps.extend(optimization_steps)
+            else:
+                all_steps.append(template.build(context.execution_id))
+        
+        # Wire dependencies from phase order; steps within one phase stay sequential
+        phase_steps: Dict[ExecutionPhase, List[str]] = {}
+        for step in all_steps:
+            step.depends_on = [
+                step_id
+                for phase in PHASE_DEPENDENCIES[step.phase]
+                for step_id in phase_steps.get(phase, ())
+            ] + phase_steps.get(step.phase, [])[-1:]
+            phase_steps.setdefault(step.phase, []).append(step.id)
+        
+        return all_steps
     
     async def _get_optimization_specific_steps(self, context: ExecutionContext, 
                                              opportunity: OptimizationOpportunity) -> List[ExecutionStep]:
         """Get optimization-specific execution steps."""
-        handler = self.execution_handlers.get(context.optimization_type)
-        if handler:
-            return await handler(context, opportunity)
-        else:
-            raise ValueError(f"No handler found for optimization type: {context.optimization_type}")
+        return await context.handler(context, opportunity)
     
     async def _execute_step(self, step: ExecutionStep, context: ExecutionContext):
-        """Execute a single step."""
-        try:
-            step.status = ExecutionStatus.RUNNING
-            step.started_at = datetime.now()
-            
-            # Execute step based on phase
-            if step.phase == ExecutionPhase.PREPARATION:
-                await self._execute_preparation_step(step, context)
-            elif step.phase == ExecutionPhase.VALIDATION:
-                await self._execute_validation_step(step, context)
-            elif step.phase == ExecutionPhase.BACKUP:
-                await self._execute_backup_step(step, context)
-            elif step.phase == ExecutionPhase.EXECUTION:
-                await self._execute_optimization_step(step, context)
-            elif step.phase == ExecutionPhase.VERIFICATION:
-                await self._execute_verification_step(step, context)
-            elif step.phase == ExecutionPhase.COMPLETION:
-                await self._execute_completion_step(step, context)
-            
-            step.status = ExecutionStatus.COMPLETED
-            step.completed_at = datetime.now()
-            
-            log_event("execution_step_completed", {
-                "step_id": step.id,
-                "step_name": step.name,
-                "duration_seconds": (step.completed_at - step.started_at).total_seconds()
-            })
-            
-        except Exception as e:
-            step.status = ExecutionStatus.FAILED
-            step.error_message = str(e)
-            step.retry_count += 1
-            
-            log_event("execution_step_failed", {
-                "step_id": step.id,
-                "step_name": step.name,
-                "error": str(e),
-                "retry_count": step.retry_count
-            })
+        """Execute a single step, retrying transient failures with exponential backoff."""
+        while True:
+            try:
+                step.status = ExecutionStatus.RUNNING
+                step.started_at = datetime.now()
+                started = time.monotonic()
+                
+                # From here on the resource may be modified and a failure needs a restore
+                if step.phase is ExecutionPhase.EXECUTION:
+                    context.changes_started = True
+                
+                # Execute step based on phase, bounded by the step's timeout
+                handler = self.phase_handlers.get(step.phase)
+                if handler:
+                    try:
+                        await asyncio.wait_for(handler(step, context), timeout=step.timeout_minutes * 60)
+                    except asyncio.TimeoutError:
+                        step.metadata["timed_out"] = True
+                        raise asyncio.TimeoutError(f"Step {step.name} timed out after {step.timeout_minutes} minutes")
+                
+                step.status = ExecutionStatus.COMPLETED
+                step.completed_at = datetime.now()
+                step.duration_seconds = time.monotonic() - started
+                
+                if log_event_enabled():
+                    log_event("execution_step_completed", {
+                        "step_id": step.id,
+                        "step_name": step.name,
+                        "duration_seconds": step.duration_seconds
+                    })
+                return
+                
+            except Exception as e:
+                step.status = ExecutionStatus.FAILED
+                step.error_message = str(e)
+                step.retry_count += 1
+                
+                log_event("execution_step_failed", {
+                    "step_id": step.id,
+                    "step_name": step.name,
+                    "error": str(e),
+                    "retry_count": step.retry_count
+                })
+                
+                # Deterministic failures (missing resource, unmet prerequisite) fail fast
+                if step.retry_count >= step.max_retries or not _is_retryable(e):
+                    raise
             
-            # Retry if within limits
-            if step.retry_count < step.max_retries:
-                await asyncio.sleep(5)  # Wait before retry
-                await self._execute_step(step, context)
-            else:
-                raise
+            delay = min(STEP_RETRY_MAX_SECONDS, STEP_RETRY_BASE_SECONDS * 2 ** (step.retry_count - 1))
+            await asyncio.sleep(delay + random.uniform(0, STEP_RETRY_BASE_SECONDS))
     
     async def _execute_preparation_step(self, step: ExecutionStep, context: ExecutionContext):
         """Execute preparation step."""
-        # Validate cloud provider connection
-        await self.cloud_provider_service.validate_connection(context.cloud_provider)
-        
-        # Check resource accessibility
-        resource_exists = await self.cloud_provider_service.resource_exists(
-            context.resource_id, context.cloud_provider
+        # Validate the provider connection and check resource accessibility concurrently
+        _, resource_exists = await asyncio.gather(
+            self.cloud_provider_service.validate_connection(context.cloud_provider),
+            self.cloud_provider_service.resource_exists(context.resource_id, context.cloud_provider)
         )
         
         if not resource_exists:
@@ -379,14 +579,18 @@ class ExecutionEngine:
     
     async def _execute_validation_step(self, step: ExecutionStep, context: ExecutionContext):
         """Execute validation step."""
-        # Validate prerequisites
+        # Check prerequisites and the target configuration concurrently
         prerequisites = context.current_config.get("prerequisites", [])
-        for prerequisite in prerequisites:
-            if not await self._validate_prerequisite(prerequisite, context):
+        *prerequisites_met, target_valid = await asyncio.gather(
+            *(self._validate_prerequisite(prerequisite, context) for prerequisite in prerequisites),
+            self._validate_target_config(context.effective_target_config, context)
+        )
+        
+        for prerequisite, met in zip(prerequisites, prerequisites_met):
+            if not met:
                 raise Exception(f"Prerequisite not met: {prerequisite}")
         
-        # Validate target configuration
-        if not await self._validate_target_config(context.target_config, context):
+        if not target_valid:
             raise Exception("Target configuration is invalid")
         
         step.metadata["validation_completed"] = True
@@ -400,15 +604,11 @@ class ExecutionEngine:
         
         context.backup_data = backup_data
         step.metadata["backup_completed"] = True
-        step.metadata["backup_size"] = len(json.dumps(backup_data))
+        step.metadata["backup_size"] = len(orjson.dumps(backup_data, option=orjson.OPT_NON_STR_KEYS))
     
     async def _execute_optimization_step(self, step: ExecutionStep, context: ExecutionContext):
         """Execute the main optimization step."""
-        handler = self.execution_handlers.get(context.optimization_type)
-        if handler:
-            await handler(context, step)
-        else:
-            raise Exception(f"No handler for optimization type: {context.optimization_type}")
+        await context.handler(context, step)
     
     async def _execute_verification_step(self, step: ExecutionStep, context: ExecutionContext):
         """Execute verification step."""
@@ -419,7 +619,7 @@ class ExecutionEngine:
         
         # Check if configuration matches target
         verification_passed = await self._verify_optimization_result(
-            context.target_config, current_config, context
+            context.effective_target_config, current_config, context
         )
         
         if not verification_passed:
@@ -429,121 +629,47 @@ class ExecutionEngine:
     
     async def _execute_completion_step(self, step: ExecutionStep, context: ExecutionContext):
         """Execute completion step."""
-        # Update resource tags
-        await self.cloud_provider_service.update_resource_tags(
+        # Tagging is metadata only, so the pipeline does not wait for the provider round-trip
+        task = asyncio.create_task(self.cloud_provider_service.update_resource_tags(
             context.resource_id, context.cloud_provider, {
                 "optimized": "true",
-                "optimization_type": context.optimization_type,
+                "optimization_type": context.optimization_type.value,
                 "optimized_at": datetime.now().isoformat(),
                 "execution_id": context.execution_id
             }
-        )
+        ))
+        self.pending_tag_tasks.add(task)
+        task.add_done_callback(self._tag_update_done)
         
         step.metadata["completion_completed"] = True
     
     # Optimization-specific handlers
     async def _execute_rightsizing(self, context: ExecutionContext, opportunity: OptimizationOpportunity) -> List[ExecutionStep]:
         """Execute rightsizing optimization."""
-        return [
-            ExecutionStep(
-                id=f"{context.execution_id}_rightsizing",
-                name="Instance Rightsizing",
-                description=f"Change instance type from {context.current_config.get('instance_type')} to {context.target_config.get('instance_type')}",
-                phase=ExecutionPhase.EXECUTION,
-                order=4,
-                timeout_minutes=20,
-                rollback_steps=[
-                    "Stop instance",
-                    "Change instance type back to original",
-                    "Start instance"
-                ]
-            )
-        ]
+        return [RIGHTSIZING_STEP.build(
+            context.execution_id,
+            description=f"Change instance type from {context.current_config.get('instance_type')} to {context.target_config.get('instance_type')}"
+        )]
     
     async def _execute_scheduling(self, context: ExecutionContext, opportunity: OptimizationOpportunity) -> List[ExecutionStep]:
         """Execute scheduling optimization."""
-        return [
-            ExecutionStep(
-                id=f"{context.execution_id}_scheduling",
-                name="Resource Scheduling",
-                description="Configure automatic start/stop schedule",
-                phase=ExecutionPhase.EXECUTION,
-                order=4,
-                timeout_minutes=15,
-                rollback_steps=[
-                    "Remove scheduled actions",
-                    "Start resource manually"
-                ]
-            )
-        ]
+        return [SCHEDULING_STEP.build(context.execution_id)]
     
     async def _execute_unused_resource_removal(self, context: ExecutionContext, opportunity: OptimizationOpportunity) -> List[ExecutionStep]:
         """Execute unused resource removal."""
-        return [
-            ExecutionStep(
-                id=f"{context.execution_id}_removal",
-                name="Unused Resource Removal",
-                description="Remove unused resource",
-                phase=ExecutionPhase.EXECUTION,
-                order=4,
-                timeout_minutes=10,
-                rollback_steps=[
-                    "Restore from backup",
-                    "Recreate resource configuration"
-                ]
-            )
-        ]
+        return [REMOVAL_STEP.build(context.execution_id)]
     
     async def _execute_storage_optimization(self, context: ExecutionContext, opportunity: OptimizationOpportunity) -> List[ExecutionStep]:
         """Execute storage optimization."""
-        return [
-            ExecutionStep(
-                id=f"{context.execution_id}_storage",
-                name="Storage Optimization",
-                description="Migrate to optimal storage class",
-                phase=ExecutionPhase.EXECUTION,
-                order=4,
-                timeout_minutes=30,
-                rollback_steps=[
-                    "Migrate back to original storage class",
-                    "Remove lifecycle policies"
-                ]
-            )
-        ]
+        return [STORAGE_STEP.build(context.execution_id)]
     
     async def _execute_reserved_instance_purchase(self, context: ExecutionContext, opportunity: OptimizationOpportunity) -> List[ExecutionStep]:
         """Execute reserved instance purchase."""
-        return [
-            ExecutionStep(
-                id=f"{context.execution_id}_reserved",
-                name="Reserved Instance Purchase",
-                description="Purchase reserved instances",
-                phase=ExecutionPhase.EXECUTION,
-                order=4,
-                timeout_minutes=5,
-                rollback_steps=[
-                    "Cancel reserved instance purchase"
-                ]
-            )
-        ]
+        return [RESERVED_INSTANCE_STEP.build(context.execution_id)]
     
     async def _execute_spot_instance_migration(self, context: ExecutionContext, opportunity: OptimizationOpportunity) -> List[ExecutionStep]:
         """Execute spot instance migration."""
-        return [
-            ExecutionStep(
-                id=f"{context.execution_id}_spot",
-                name="Spot Instance Migration",
-                description="Migrate to spot instances",
-                phase=ExecutionPhase.EXECUTION,
-                order=4,
-                timeout_minutes=25,
-                rollback_steps=[
-                    "Stop spot instance",
-                    "Start on-demand instance",
-                    "Update load balancer configuration"
-                ]
-            )
-        ]
+        return [SPOT_INSTANCE_STEP.build(context.execution_id)]
     
     async def _handle_execution_failure(self, execution: OptimizationExecution, 
                                       context: ExecutionContext, error_message: str):
@@ -580,6 +706,21 @@ class ExecutionEngine:
     
     async def _rollback_execution(self, context: ExecutionContext) -> bool:
         """Perform rollback of failed execution."""
+        # A cancelled caller must not abort a restore half-way; the shielded task runs to completion
+        # and records its own outcome
+        return await asyncio.shield(self._restore_and_verify(context))
+    
+    async def _restore_and_verify(self, context: ExecutionContext) -> bool:
+        """Restore the resource from backup and verify the original configuration is back."""
+        # Validation and backup run concurrently, so a backup can exist for a resource
+        # that was never touched; only restore once the execution phase has started
+        if not context.changes_started:
+            log_event("rollback_skipped", {
+                "execution_id": context.execution_id,
+                "reason": "no changes applied"
+            })
+            return True
+        
         try:
             log_event("rollback_started", {
                 "execution_id": context.execution_id,
@@ -625,13 +766,13 @@ class ExecutionEngine:
         # Implementation would check specific prerequisites
         return True
     
-    async def _validate_target_config(self, target_config: Dict[str, Any], 
+    async def _validate_target_config(self, target_config: Mapping[str, Any], 
                                     context: ExecutionContext) -> bool:
         """Validate target configuration."""
         # Implementation would validate configuration
         return True
     
-    async def _verify_optimization_result(self, target_config: Dict[str, Any], 
+    async def _verify_optimization_result(self, target_config: Mapping[str, Any], 
                                         current_config: Dict[str, Any], 
                                         context: ExecutionContext) -> bool:
         """Verify optimization result."""
@@ -660,10 +801,11 @@ class ExecutionEngine:
         """Get execution status."""
         if execution_id in self.active_executions:
             execution_data = self.active_executions[execution_id]
+            context = execution_data["context"]
             return {
                 "execution_id": execution_id,
                 "status": execution_data["status"].value,
-                "context": execution_data["context"].__dict__,
+                "context": context.status_view() if context else None,
                 "is_active": True
             }
         else:
@@ -678,6 +820,9 @@ class ExecutionEngine:
         try:
             if execution_id in self.active_executions:
                 execution_data = self.active_executions[execution_id]
+                # Still preparing: nothing has been changed yet and there is no context to roll back
+                if execution_data["context"] is None:
+                    return False
                 
                 # Perform rollback
                 await self._rollback_execution(execution_data["context"])
@@ -687,7 +832,7 @@ class ExecutionEngine:
                 execution_data["execution"].error_message = f"Cancelled: {reason}"
                 
                 # Remove from active executions
-                del self.active_executions[execution_id]
+                self.active_executions.pop(execution_id, None)
                 
                 log_event("execution_cancelled", {
                     "execution_id": execution_id,
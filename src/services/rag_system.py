@@ -448,9 +448,9 @@ class RAGSystem:
         regions = []
         
         for resource in infrastructure_data.get('resources', []):
-            services.append(resource.get('service', ''))
-            providers.append(resource.get('provider', ''))
-            regions.append(resource.get('region', ''))
+            services.append(resource.service)
+            providers.append(resource.provider)
+            regions.append(resource.region)
         
         unique_services = list(set(filter(None, services)))
         unique_providers = list(set(filter(None, providers)))
@@ -543,7 +543,7 @@ class RAGSystem:
         """Filter insights based on relevance to current infrastructure."""
         filtered = []
         
-        current_services = [r.get('service') for r in infrastructure_data.get('resources', [])]
+        current_services = [r.service for r in infrastructure_data.get('resources', [])]
         
         for insight in insights:
             # Check if insight is applicable to current services
@@ -0,0 +1,108 @@
+"""
+Tests for the cloud provider infrastructure snapshot cache.
+"""
+
+import orjson
+import pytest
+
+from src.services.cloud_providers import CloudProviderService, CloudResource
+
+
+class InMemoryCache:
+    """Minimal async stand-in for the Redis snapshot cache."""
+
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+
+def _provider_failure():
+    async def fetch():
+        raise ConnectionError("provider unavailable")
+    return fetch
+
+
+def _provider_resources(*resources):
+    async def fetch():
+        return list(resources)
+    return fetch
+
+
+@pytest.fixture
+def service():
+    service = CloudProviderService()
+    service.aws_client = object()
+    service.azure_client = object()
+    service.gcp_client = object()
+    service.cache_client = InMemoryCache()
+    return service
+
+
+@pytest.fixture
+def stale_payload(service):
+    payload = orjson.dumps({
+        "resources": [CloudResource(id="i-1", name="web", service="ec2", provider="aws", region="us-east-1")],
+        "total_monthly_cost": 42.0,
+        "total_resources": 1,
+        "cost_breakdown": {"ec2": 42.0},
+        "providers": ["aws"],
+        "failed_providers": []
+    })
+    service.cache_client.values[f"{service._get_infrastructure_cache_key()}:stale"] = payload
+    return payload
+
+
+@pytest.mark.asyncio
+async def test_all_providers_failing_serves_stale_snapshot(service, stale_payload):
+    service._get_aws_resources = _provider_failure()
+    service._get_azure_resources = _provider_failure()
+    service._get_gcp_resources = _provider_failure()
+
+    data = await service.get_infrastructure_data()
+
+    assert data["stale"] is True
+    assert data["total_monthly_cost"] == 42.0
+    assert [resource.id for resource in data["resources"]] == ["i-1"]
+    # The outage must not be cached as a fresh snapshot
+    assert service._get_infrastructure_cache_key() not in service.cache_client.values
+
+
+@pytest.mark.asyncio
+async def test_partial_provider_failure_keeps_stale_snapshot(service, stale_payload):
+    service._get_aws_resources = _provider_failure()
+    service._get_azure_resources = _provider_resources(
+        CloudResource(id="vm-1", name="api", service="vm", provider="azure", region="eastus", monthly_cost=10.0)
+    )
+    service._get_gcp_resources = _provider_resources()
+
+    data = await service.get_infrastructure_data()
+
+    assert data["providers"] == ["azure", "gcp"]
+    assert data["failed_providers"] == ["aws"]
+    assert data["total_monthly_cost"] == 10.0
+    cache_key = service._get_infrastructure_cache_key()
+    # A partial snapshot is neither served as fresh nor allowed to replace the last good copy
+    assert cache_key not in service.cache_client.values
+    assert service.cache_client.values[f"{cache_key}:stale"] == stale_payload
+
+
+@pytest.mark.asyncio
+async def test_complete_snapshot_is_cached(service):
+    service._get_aws_resources = _provider_resources(
+        CloudResource(id="i-2", name="db", service="ec2", provider="aws", region="us-east-1", monthly_cost=5.0)
+    )
+    service._get_azure_resources = _provider_resources()
+    service._get_gcp_resources = _provider_resources()
+
+    data = await service.get_infrastructure_data()
+
+    assert data["failed_providers"] == []
+    cache_key = service._get_infrastructure_cache_key()
+    assert service.cache_client.values[cache_key] == service.cache_client.values[f"{cache_key}:stale"]
+    cached = await service.get_infrastructure_data()
+    assert [resource.id for resource in cached["resources"]] == ["i-2"]
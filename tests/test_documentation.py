@@ -0,0 +1,267 @@
+"""
+Tests for ticket template rendering and ServiceNow batch ticket creation.
+"""
+
+import asyncio
+import base64
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from src.models.optimization import OptimizationType
+from src.services.documentation import (
+    DocumentationService,
+    RateLimiter,
+    TICKET_TEMPLATES,
+    _EXECUTION_DESCRIPTION_TEMPLATE,
+    _FAILURE_DESCRIPTION_TEMPLATE,
+    _REQUEST_DESCRIPTION_TEMPLATE,
+    _compile_labels,
+    _compile_template,
+)
+
+
+# Every field the ticket templates reference, with numbers where a format spec needs them
+TEMPLATE_VALUES = {
+    "service_name": "ec2",
+    "resource_id": "i-123",
+    "optimization_type": "rightsizing",
+    "cloud_provider": "aws",
+    "region": "us-east-1",
+    "current_cost": 1234.5,
+    "potential_savings": 456.789,
+    "savings_amount": 456.789,
+    "confidence_score": 0.876,
+    "risk_level": "low",
+    "description": "Downsize {not a field}",
+    "implementation_steps": "- Resize instance",
+    "rollback_steps": "- Restore instance type",
+    "prerequisites": "- Backup",
+    "estimated_execution_time": 15,
+    "expires_at": "2024-01-22 10:30 UTC",
+    "execution_id": "exec-1",
+    "actual_savings": 400.0,
+    "annual_savings": 4800.0,
+    "roi": 0.324,
+    "execution_time": "0:12:00",
+    "execution_details": "[]",
+    "approved_by": "approver-1",
+    "executed_at": "2024-01-15T10:30:00",
+    "completed_at": "2024-01-15T10:42:00",
+    "error_message": "quota exceeded",
+    "failed_step": "Execution Phase",
+    "failure_time": "2024-01-15T10:35:00",
+    "root_cause_analysis": "Analysis pending",
+    "prevention_measures": "Review parameters",
+    "failed_at": "2024-01-15T10:35:00"
+}
+
+
+def _ticket_template_strings():
+    for templates in TICKET_TEMPLATES.values():
+        yield templates.jira.summary
+        yield templates.jira.description
+        yield templates.servicenow.short_description
+        yield templates.servicenow.description
+    yield _REQUEST_DESCRIPTION_TEMPLATE
+    yield _EXECUTION_DESCRIPTION_TEMPLATE
+    yield _FAILURE_DESCRIPTION_TEMPLATE
+
+
+@pytest.mark.parametrize("template", list(_ticket_template_strings()))
+def test_compiled_templates_match_str_format(template):
+    assert _compile_template(template)(TEMPLATE_VALUES) == template.format_map(TEMPLATE_VALUES)
+
+
+@pytest.mark.parametrize("ticket_type", list(TICKET_TEMPLATES))
+def test_compiled_labels_match_str_format(ticket_type):
+    labels = TICKET_TEMPLATES[ticket_type].jira.labels
+
+    assert _compile_labels(labels)(TEMPLATE_VALUES) == [label.format_map(TEMPLATE_VALUES) for label in labels]
+
+
+@pytest.mark.parametrize("template", [
+    "{name!r} / {name!s} / {name!a}",
+    "{amount:>12,.2f}|{ratio:.1%}|{name:^10}|{count:05d}",
+    "{{literal}} {name!r:>10} {{}}",
+    "",
+    "no fields at all"
+])
+def test_conversions_and_format_specs_match_str_format(template):
+    values = {"name": "café", "amount": 1234.5, "ratio": 0.25, "count": 42}
+
+    assert _compile_template(template)(values) == template.format_map(values)
+
+
+@pytest.mark.parametrize("template", [
+    "{0}",
+    "{}",
+    "{opportunity.id}",
+    "{items[0]}",
+    "{amount:{width}}"
+])
+def test_unsupported_fields_are_rejected(template):
+    with pytest.raises(ValueError):
+        _compile_template(template)
+
+
+def test_labels_must_be_a_single_field_reference():
+    with pytest.raises(ValueError):
+        _compile_labels(("provider-{cloud_provider}",))
+
+
+class StubResponse:
+    """Minimal stand-in for an aiohttp response."""
+
+    def __init__(self, status, body):
+        self.status = status
+        self.body = body
+        self.headers = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def json(self, loads=None):
+        return self.body
+
+    async def text(self):
+        return str(self.body)
+
+
+class StubSession:
+    """Session double that records POSTs and answers them through `handler`."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.posts = []
+
+    def post(self, url, json=None):
+        self.posts.append((url, json))
+        return StubResponse(*self.handler(url, json))
+
+
+def _is_batch(url):
+    return url.endswith("/api/now/v1/batch")
+
+
+def _serviced(request_id, sys_id, status_code=201):
+    return {
+        "id": request_id,
+        "status_code": status_code,
+        "body": base64.b64encode(orjson.dumps({"result": {"sys_id": sys_id}})).decode()
+    }
+
+
+def _opportunity(resource_id):
+    return SimpleNamespace(
+        service_name="ec2",
+        resource_id=resource_id,
+        optimization_type=OptimizationType.RIGHTSIZING,
+        cloud_provider=SimpleNamespace(value="aws"),
+        region="us-east-1",
+        current_cost=100.0,
+        potential_savings=40.0,
+        confidence_score=0.9,
+        risk_level=SimpleNamespace(value="low"),
+        description="Downsize instance",
+        estimated_execution_time=15,
+        expires_at=None,
+        implementation_steps=["Resize instance"],
+        rollback_steps=["Restore instance type"],
+        prerequisites=["Backup"]
+    )
+
+
+def _service(handler):
+    service = DocumentationService()
+    service.servicenow_session = StubSession(handler)
+    service.ticket_limits["servicenow"] = (asyncio.Semaphore(16), RateLimiter(1000.0))
+    return service
+
+
+@pytest.mark.asyncio
+async def test_batch_results_follow_request_ids():
+    def handler(url, payload):
+        # Serviced requests come back out of order and are matched by id
+        return 200, {"serviced_requests": [_serviced("1", "sys-b"), _serviced("0", "sys-a", status_code=400)]}
+
+    service = _service(handler)
+    results = await service.create_servicenow_request_tickets_batch([_opportunity("i-1"), _opportunity("i-2")])
+
+    assert [result.status for result in results] == ["failed", "created"]
+    assert results[0].error.startswith("HTTP 400")
+    assert results[1].ticket_id == "sys-b"
+
+    (url, payload), = service.servicenow_session.posts
+    assert _is_batch(url)
+    records = [orjson.loads(base64.b64decode(request["body"])) for request in payload["rest_requests"]]
+    assert [request["id"] for request in payload["rest_requests"]] == ["0", "1"]
+    assert ["i-1" in record["description"] for record in records] == [True, False]
+    assert ["i-2" in record["description"] for record in records] == [False, True]
+
+
+@pytest.mark.asyncio
+async def test_unserviced_requests_fall_back_to_single_creates():
+    def handler(url, payload):
+        if _is_batch(url):
+            return 200, {"serviced_requests": [_serviced("0", "sys-a")], "unserviced_requests": ["1"]}
+        return 201, {"result": {"sys_id": "sys-single"}}
+
+    service = _service(handler)
+    results = await service.create_servicenow_request_tickets_batch([_opportunity("i-1"), _opportunity("i-2")])
+
+    assert [result.ticket_id for result in results] == ["sys-a", "sys-single"]
+    single_posts = [payload for url, payload in service.servicenow_session.posts if not _is_batch(url)]
+    assert len(single_posts) == 1
+    assert "i-2" in single_posts[0]["description"]
+
+
+@pytest.mark.asyncio
+async def test_batch_post_failure_fails_every_ticket():
+    def handler(url, payload):
+        raise ConnectionError("instance unreachable")
+
+    service = _service(handler)
+    results = await service.create_servicenow_request_tickets_batch([_opportunity("i-1"), _opportunity("i-2")])
+
+    assert [result.status for result in results] == ["failed", "failed"]
+    assert all(result.error == "instance unreachable" for result in results)
+    assert len(service.servicenow_session.posts) == 1
+
+
+@pytest.mark.asyncio
+async def test_failure_after_partial_success_keeps_created_tickets():
+    def handler(url, payload):
+        if _is_batch(url):
+            malformed = {"id": "1", "status_code": 201, "body": base64.b64encode(b"not json").decode()}
+            return 200, {"serviced_requests": [_serviced("0", "sys-a"), malformed]}
+        return 201, {"result": {"sys_id": "sys-duplicate"}}
+
+    service = _service(handler)
+    results = await service.create_servicenow_request_tickets_batch(
+        [_opportunity("i-1"), _opportunity("i-2"), _opportunity("i-3")]
+    )
+
+    assert results[0].ticket_id == "sys-a"
+    assert [result.status for result in results] == ["created", "failed", "failed"]
+    # Nothing is created again through the single-record fallback
+    assert len(service.servicenow_session.posts) == 1
+
+
+@pytest.mark.asyncio
+async def test_single_create_failure_keeps_other_results():
+    def handler(url, payload):
+        if _is_batch(url):
+            return 200, {"serviced_requests": [_serviced("0", "sys-a")]}
+        raise ConnectionError("instance unreachable")
+
+    service = _service(handler)
+    results = await service.create_servicenow_request_tickets_batch([_opportunity("i-1"), _opportunity("i-2")])
+
+    assert results[0].ticket_id == "sys-a"
+    assert results[1].status == "failed"
+    assert results[1].error == "instance unreachable"
@@ -0,0 +1,94 @@
+"""
+Tests for execution engine failure handling.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.models.optimization import OptimizationStatus, OptimizationType
+from src.services.execution_engine import ExecutionEngine, ExecutionPhase
+
+
+class RecordingCloudProvider:
+    """Cloud provider double that records backup and restore calls."""
+
+    def __init__(self):
+        self.backups = []
+        self.restores = []
+
+    async def validate_connection(self, provider):
+        return True
+
+    async def resource_exists(self, resource_id, provider):
+        return True
+
+    async def get_resource_config(self, resource_id, provider):
+        return {"instance_type": "m5.large", "prerequisites": ["quota"]}
+
+    async def create_resource_backup(self, resource_id, provider):
+        self.backups.append(resource_id)
+        return {"instance_type": "m5.large"}
+
+    async def restore_resource_from_backup(self, resource_id, provider, backup_data):
+        self.restores.append(resource_id)
+
+    async def update_resource_tags(self, resource_id, provider, tags):
+        pass
+
+
+@pytest.fixture
+def engine():
+    engine = ExecutionEngine()
+    engine.cloud_provider_service = RecordingCloudProvider()
+    return engine
+
+
+@pytest.fixture
+def opportunity():
+    return SimpleNamespace(
+        id="opp-1",
+        resource_id="i-123",
+        region="us-east-1",
+        cloud_provider=SimpleNamespace(value="aws"),
+        optimization_type=OptimizationType.RIGHTSIZING,
+        estimated_execution_time=5
+    )
+
+
+@pytest.mark.asyncio
+async def test_validation_failure_does_not_restore_untouched_resource(engine, opportunity):
+    async def prerequisite_not_met(prerequisite, context):
+        return False
+    engine._validate_prerequisite = prerequisite_not_met
+
+    with pytest.raises(Exception, match="Prerequisite not met"):
+        await engine.execute_optimization(opportunity, "approver-1")
+
+    # Backup runs alongside validation, but nothing was changed so nothing is restored
+    assert engine.cloud_provider_service.backups == ["i-123"]
+    assert engine.cloud_provider_service.restores == []
+    assert engine.active_executions == {}
+
+
+@pytest.mark.asyncio
+async def test_execution_failure_restores_from_backup(engine, opportunity):
+    async def failing_execution(step, context):
+        raise Exception("instance type change rejected")
+    engine.phase_handlers[ExecutionPhase.EXECUTION] = failing_execution
+
+    with pytest.raises(Exception, match="instance type change rejected"):
+        await engine.execute_optimization(opportunity, "approver-1")
+
+    assert engine.cloud_provider_service.restores == ["i-123"]
+    assert engine.active_executions == {}
+
+
+@pytest.mark.asyncio
+async def test_successful_execution_releases_its_slot(engine, opportunity):
+    execution = await engine.execute_optimization(opportunity, "approver-1")
+
+    assert execution.status == OptimizationStatus.COMPLETED
+    assert engine.cloud_provider_service.restores == []
+    assert engine.active_executions == {}
+    await engine.close()